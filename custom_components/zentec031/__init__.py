@@ -3,116 +3,77 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from functools import partial
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
 from .api import ZentecModbusApi
 from .const import (
-    CONF_ALARM_REGISTER,
-    CONF_FAN_SPEED_REGISTER,
-    CONF_MAX_HEAT_TEMP_REGISTER,
-    CONF_MAX_FAN_SPEED,
-    CONF_MIN_HEAT_TEMP_REGISTER,
-    CONF_MODE_HEAT_VALUE,
-    CONF_MODE_REGISTER,
-    CONF_MODE_VENT_VALUE,
-    CONF_OUTDOOR_TEMP_REGISTER,
-    CONF_POWER_REGISTER,
-    CONF_READ_ONLY,
+    CONF_METRICS_EXPORT,
     CONF_SCAN_INTERVAL,
-    CONF_SLAVE_ID,
-    CONF_SUPPLY_TEMP_DIVISOR,
-    CONF_SUPPLY_TEMP_REGISTER,
-    CONF_TARGET_TEMP_REGISTER,
-    CONF_TEMPERATURE_DIVISOR,
-    DEFAULT_ALARM_REGISTER,
-    DEFAULT_FAN_SPEED_REGISTER,
-    DEFAULT_MAX_HEAT_TEMP_REGISTER,
-    DEFAULT_MAX_FAN_SPEED,
-    DEFAULT_MIN_HEAT_TEMP_REGISTER,
-    DEFAULT_MODE_HEAT_VALUE,
-    DEFAULT_MODE_REGISTER,
-    DEFAULT_MODE_VENT_VALUE,
-    DEFAULT_OUTDOOR_TEMP_REGISTER,
     DEFAULT_PORT,
-    DEFAULT_POWER_REGISTER,
-    DEFAULT_READ_ONLY,
-    DEFAULT_SCAN_INTERVAL,
-    DEFAULT_SLAVE_ID,
-    DEFAULT_SUPPLY_TEMP_DIVISOR,
-    DEFAULT_SUPPLY_TEMP_REGISTER,
-    DEFAULT_TARGET_TEMP_REGISTER,
-    DEFAULT_TEMPERATURE_DIVISOR,
     DOMAIN,
+    METRICS_STORAGE_KEY,
+    METRICS_STORAGE_VERSION,
     PLATFORMS,
+    RELOAD_OPTION_KEYS,
 )
 from .coordinator import ZentecCoordinator
+from .gateway import async_join_gateway
+from .metrics_view import async_register_metrics_view
+from .runtime_config import build_runtime_config
+from .schedule import DATA_SCHEDULER, ZentecScheduler
+from .services import async_setup_services
+from .websocket_api import async_setup_websocket_api
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _build_runtime_config(entry: ConfigEntry) -> dict[str, int | bool]:
-    data = entry.data
-    options = entry.options
-    return {
-        CONF_SLAVE_ID: int(data.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID)),
-        CONF_SCAN_INTERVAL: int(options.get(CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))),
-        CONF_POWER_REGISTER: int(
-            options.get(CONF_POWER_REGISTER, data.get(CONF_POWER_REGISTER, data.get("power_coil", DEFAULT_POWER_REGISTER)))
-        ),
-        CONF_MODE_REGISTER: int(options.get(CONF_MODE_REGISTER, data.get(CONF_MODE_REGISTER, DEFAULT_MODE_REGISTER))),
-        CONF_MODE_HEAT_VALUE: int(options.get(CONF_MODE_HEAT_VALUE, data.get(CONF_MODE_HEAT_VALUE, DEFAULT_MODE_HEAT_VALUE))),
-        CONF_MODE_VENT_VALUE: int(options.get(CONF_MODE_VENT_VALUE, data.get(CONF_MODE_VENT_VALUE, DEFAULT_MODE_VENT_VALUE))),
-        CONF_FAN_SPEED_REGISTER: int(
-            options.get(CONF_FAN_SPEED_REGISTER, data.get(CONF_FAN_SPEED_REGISTER, DEFAULT_FAN_SPEED_REGISTER))
-        ),
-        CONF_TARGET_TEMP_REGISTER: int(
-            options.get(CONF_TARGET_TEMP_REGISTER, data.get(CONF_TARGET_TEMP_REGISTER, DEFAULT_TARGET_TEMP_REGISTER))
-        ),
-        CONF_MIN_HEAT_TEMP_REGISTER: int(
-            options.get(CONF_MIN_HEAT_TEMP_REGISTER, data.get(CONF_MIN_HEAT_TEMP_REGISTER, DEFAULT_MIN_HEAT_TEMP_REGISTER))
-        ),
-        CONF_MAX_HEAT_TEMP_REGISTER: int(
-            options.get(CONF_MAX_HEAT_TEMP_REGISTER, data.get(CONF_MAX_HEAT_TEMP_REGISTER, DEFAULT_MAX_HEAT_TEMP_REGISTER))
-        ),
-        CONF_SUPPLY_TEMP_REGISTER: int(
-            options.get(CONF_SUPPLY_TEMP_REGISTER, data.get(CONF_SUPPLY_TEMP_REGISTER, DEFAULT_SUPPLY_TEMP_REGISTER))
-        ),
-        CONF_SUPPLY_TEMP_DIVISOR: int(
-            options.get(CONF_SUPPLY_TEMP_DIVISOR, data.get(CONF_SUPPLY_TEMP_DIVISOR, DEFAULT_SUPPLY_TEMP_DIVISOR))
-        ),
-        CONF_OUTDOOR_TEMP_REGISTER: int(
-            options.get(CONF_OUTDOOR_TEMP_REGISTER, data.get(CONF_OUTDOOR_TEMP_REGISTER, DEFAULT_OUTDOOR_TEMP_REGISTER))
-        ),
-        CONF_ALARM_REGISTER: int(options.get(CONF_ALARM_REGISTER, data.get(CONF_ALARM_REGISTER, DEFAULT_ALARM_REGISTER))),
-        CONF_TEMPERATURE_DIVISOR: int(
-            options.get(CONF_TEMPERATURE_DIVISOR, data.get(CONF_TEMPERATURE_DIVISOR, DEFAULT_TEMPERATURE_DIVISOR))
-        ),
-        CONF_MAX_FAN_SPEED: int(options.get(CONF_MAX_FAN_SPEED, data.get(CONF_MAX_FAN_SPEED, DEFAULT_MAX_FAN_SPEED))),
-        CONF_READ_ONLY: bool(options.get(CONF_READ_ONLY, data.get(CONF_READ_ONLY, DEFAULT_READ_ONLY))),
-    }
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up Zentec 031 services, websocket commands and schedules."""
+    scheduler = ZentecScheduler(hass)
+    await scheduler.async_load()
+    hass.data[DATA_SCHEDULER] = scheduler
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Zentec 031 from a config entry."""
-    config = _build_runtime_config(entry)
-
-    api = ZentecModbusApi(
-        host=entry.data[CONF_HOST],
-        port=int(entry.data.get(CONF_PORT, DEFAULT_PORT)),
-        config=config,
+    config = build_runtime_config(entry.data, entry.options)
+
+    # The first client construction imports pymodbus; keep that off the event loop.
+    api = await hass.async_add_import_executor_job(
+        partial(
+            ZentecModbusApi,
+            host=entry.data[CONF_HOST],
+            port=int(entry.data.get(CONF_PORT, DEFAULT_PORT)),
+            config=config,
+        )
     )
 
     coordinator = ZentecCoordinator(
         hass=hass,
+        entry=entry,
         api=api,
         update_interval=timedelta(seconds=config[CONF_SCAN_INTERVAL]),
         name=f"{DOMAIN}_{entry.entry_id}",
     )
 
+    # Joined before the first poll, so a gateway already known to be down is not polled again.
+    entry.async_on_unload(
+        async_join_gateway(hass, coordinator, entry.data[CONF_HOST], int(entry.data.get(CONF_PORT, DEFAULT_PORT)))
+    )
+    await coordinator.async_load_metrics()
     await coordinator.async_refresh()
     if not coordinator.last_update_success:
         _LOGGER.warning(
@@ -120,18 +81,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     entry.runtime_data = coordinator
+    coordinator.async_configure_sampler()
+    entry.async_on_unload(coordinator.async_stop_sampler)
+    coordinator.async_configure_clock_sync()
+    entry.async_on_unload(coordinator.async_stop_clock_sync)
+    entry.async_on_unload(coordinator.async_supervise_connection())
+    if config[CONF_METRICS_EXPORT]:
+        async_register_metrics_view(hass)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Zentec entry."""
     coordinator: ZentecCoordinator = entry.runtime_data
+    await coordinator.async_stop_capture()
+    await coordinator.async_stop_profiling()
     coordinator.api.close()
+    await coordinator.async_save_metrics()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload entry on options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply options to the running entry, reloading only when the entity set changes."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    config = build_runtime_config(entry.data, entry.options)
+    if any(config[key] != coordinator.api.config.get(key) for key in RELOAD_OPTION_KEYS):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    await coordinator.async_apply_config(config)
+    if config[CONF_METRICS_EXPORT]:
+        async_register_metrics_view(hass)
+    await coordinator.async_request_refresh()
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored derived metrics and schedule memberships of a deleted entry."""
+    await hass.data[DATA_SCHEDULER].async_remove_entry(entry.entry_id)
+    await Store(hass, METRICS_STORAGE_VERSION, f"{METRICS_STORAGE_KEY}.{entry.entry_id}").async_remove()
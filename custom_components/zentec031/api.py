@@ -2,26 +2,82 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
-
-from pymodbus.client import ModbusTcpClient
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import math
+from pathlib import Path
+import select
+import socket
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
 from .const import (
+    CLOCK_REGISTER,
+    CLOCK_REGISTER_COUNT,
     CONF_ALARM_REGISTER,
+    CONF_BAUDRATE,
     CONF_FAN_SPEED_REGISTER,
     CONF_MAX_HEAT_TEMP_REGISTER,
     CONF_MAX_FAN_SPEED,
     CONF_MIN_HEAT_TEMP_REGISTER,
     CONF_MODE_REGISTER,
     CONF_OUTDOOR_TEMP_REGISTER,
+    CONF_LEAN_TRANSPORT,
+    CONF_PARITY,
+    CONF_PIPELINE_WINDOW,
     CONF_POWER_REGISTER,
     CONF_SLAVE_ID,
+    CONF_STOPBITS,
     CONF_SUPPLY_TEMP_DIVISOR,
     CONF_SUPPLY_TEMP_REGISTER,
     CONF_TARGET_TEMP_REGISTER,
     CONF_TEMPERATURE_DIVISOR,
+    CONF_TRANSPORT,
+    CONF_WRITE_FRESHNESS,
+    ALL_REGISTERS,
+    DEFAULT_BAUDRATE,
+    DEFAULT_LEAN_TRANSPORT,
+    DEFAULT_PARITY,
+    DEFAULT_PIPELINE_WINDOW,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STOPBITS,
+    DEFAULT_TRANSPORT,
+    DEFAULT_WRITE_FRESHNESS,
+    IDLE_PROBE_TIMEOUT,
+    KEEPALIVE_COUNT,
+    KEEPALIVE_IDLE,
+    KEEPALIVE_INTERVAL,
+    MAX_READ_COUNT,
+    MAX_WRITE_COUNT,
+    MAX_SCAN_INTERVAL,
+    REG_ALARM_1,
+    REG_ALARM_2,
+    REG_ALARM_3,
+    REG_FAN_SPEED,
+    REG_MAX_HEAT_TEMP,
+    REG_MIN_HEAT_TEMP,
+    REG_MODE,
+    REG_OUTDOOR_TEMP,
+    REG_POWER,
+    REG_SUPPLY_TEMP,
+    REG_TARGET_TEMP,
+    SAMPLE_REGISTERS,
+    SERIAL_MAX_FRAME,
+    SERIAL_TURNAROUND,
+    TARGET_BUS_UTILIZATION,
+    TRANSPORT_RTU_OVER_TCP,
+    TRANSPORT_SERIAL,
+    TRANSPORT_TCP,
 )
+from .transport import EncodedReads, ModbusTcpPipeline
+
+if TYPE_CHECKING:
+    from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+
+    from .capture import CaptureWriter
 
 
 @dataclass(slots=True)
@@ -42,52 +98,679 @@ class ZentecState:
     alarm_code_3: int | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class RegisterBlock:
+    """Contiguous register span fetched with a single request."""
+
+    address: int
+    count: int
+    input_registers: bool
+    keys: tuple[tuple[str, int], ...]
+
+
+@dataclass(slots=True)
+class TransactionStats:
+    """Modbus transaction counters of polls, samples and writes since the API was created."""
+
+    reads: int = 0
+    read_errors: int = 0
+    read_seconds: float = 0.0
+    writes: int = 0
+    write_errors: int = 0
+
+
+@dataclass(slots=True)
+class ProbeResult:
+    """Outcome of a one-shot read of the full register map."""
+
+    state: ZentecState
+    requests: int
+    round_trip: float
+    failed_addresses: list[int] = field(default_factory=list)
+
+    @property
+    def recommended_scan_interval(self) -> int:
+        """Return a scan interval keeping bus utilization near the target."""
+        poll_time = self.round_trip * self.requests
+        interval = math.ceil(poll_time / TARGET_BUS_UTILIZATION)
+        return max(DEFAULT_SCAN_INTERVAL, min(interval, MAX_SCAN_INTERVAL))
+
+
+@dataclass(frozen=True, slots=True)
+class ControllerClock:
+    """Controller clock from the technical registers 65512..65519."""
+
+    year: int
+    month: int
+    day: int
+    weekday: int
+    hour: int
+    minute: int
+    second: int
+    utc_offset: int
+
+    @classmethod
+    def from_registers(cls, registers: list[int]) -> ControllerClock:
+        """Decode the clock block read from ``CLOCK_REGISTER``."""
+        values = [value & 0xFF for value in registers[:CLOCK_REGISTER_COUNT]]
+        offset = values[7] - 0x100 if values[7] >= 0x80 else values[7]
+        return cls(*values[:7], utc_offset=offset)
+
+    @classmethod
+    def from_datetime(cls, moment: datetime) -> ControllerClock:
+        """Build the clock for the aware local time ``moment``, rounded to the second.
+
+        The zone register holds whole hours, so an offset such as +05:30 is
+        rounded to the nearest hour, half hours up; the time fields stay exact.
+        """
+        moment += timedelta(microseconds=500_000)
+        offset = moment.utcoffset()
+        return cls(
+            year=moment.year - 2000,
+            month=moment.month,
+            day=moment.day,
+            weekday=moment.isoweekday(),
+            hour=moment.hour,
+            minute=moment.minute,
+            second=moment.second,
+            utc_offset=math.floor(offset.total_seconds() / 3600 + 0.5) if offset is not None else 0,
+        )
+
+    def to_registers(self) -> list[int]:
+        """Encode the clock for one write starting at ``CLOCK_REGISTER``."""
+        return [
+            self.year,
+            self.month,
+            self.day,
+            self.weekday,
+            self.hour,
+            self.minute,
+            self.second,
+            self.utc_offset & 0xFF,
+        ]
+
+    def drift(self, reference: datetime) -> float | None:
+        """Return seconds the clock runs ahead of the local wall time of ``reference``.
+
+        None if the registers do not hold a valid date, e.g. after a reset.
+        """
+        try:
+            moment = datetime(2000 + self.year, self.month, self.day, self.hour, self.minute, self.second)
+        except ValueError:
+            return None
+        return (moment - reference.replace(tzinfo=None)).total_seconds()
+
+
+_CLOCK_BLOCK = RegisterBlock(CLOCK_REGISTER, CLOCK_REGISTER_COUNT, False, ())
+
+# MBAP header (transaction id, protocol id, length, unit id) and the PDU of a
+# one-register read, used by the idle probe that bypasses pymodbus.
+_MBAP = struct.Struct(">HHHB")
+_READ_PDU = struct.Struct(">BHH")
+_PROBE_TRANSACTION = 0xFFFF
+
+
+def build_register_map(config: dict[str, Any]) -> dict[str, int]:
+    """Resolve logical register keys to Modbus addresses."""
+    alarm_register = int(config[CONF_ALARM_REGISTER])
+    return {
+        REG_POWER: int(config[CONF_POWER_REGISTER]),
+        REG_MODE: int(config[CONF_MODE_REGISTER]),
+        REG_FAN_SPEED: int(config[CONF_FAN_SPEED_REGISTER]),
+        REG_TARGET_TEMP: int(config[CONF_TARGET_TEMP_REGISTER]),
+        REG_MIN_HEAT_TEMP: int(config[CONF_MIN_HEAT_TEMP_REGISTER]),
+        REG_MAX_HEAT_TEMP: int(config[CONF_MAX_HEAT_TEMP_REGISTER]),
+        REG_SUPPLY_TEMP: int(config[CONF_SUPPLY_TEMP_REGISTER]),
+        REG_OUTDOOR_TEMP: int(config[CONF_OUTDOOR_TEMP_REGISTER]),
+        REG_ALARM_1: alarm_register,
+        REG_ALARM_2: alarm_register + 1,
+        REG_ALARM_3: alarm_register + 2,
+    }
+
+
+def compile_read_plan(register_map: dict[str, int], keys: Iterable[str]) -> tuple[RegisterBlock, ...]:
+    """Group the registers behind ``keys`` into as few block reads as possible.
+
+    Only directly adjacent addresses of the same register type are merged, so
+    no register outside the configured map is ever requested.
+    """
+    by_address: dict[int, list[str]] = {}
+    for key in keys:
+        by_address.setdefault(register_map[key], []).append(key)
+
+    blocks: list[RegisterBlock] = []
+    start: int | None = None
+    members: list[tuple[str, int]] = []
+    last = 0
+    for address in sorted(by_address):
+        input_registers = _is_input_register(address)
+        if (
+            start is None
+            or address != last + 1
+            or input_registers != _is_input_register(start)
+            or address - start >= MAX_READ_COUNT
+        ):
+            if start is not None:
+                blocks.append(RegisterBlock(start, last - start + 1, _is_input_register(start), tuple(members)))
+            start = address
+            members = []
+        members.extend((key, address - start) for key in by_address[address])
+        last = address
+    if start is not None:
+        blocks.append(RegisterBlock(start, last - start + 1, _is_input_register(start), tuple(members)))
+    return tuple(blocks)
+
+
+def encode_read_plan(plan: tuple[RegisterBlock, ...], unit: int) -> EncodedReads:
+    """Pre-encode the requests of ``plan`` for the lean Modbus TCP transport."""
+    return EncodedReads(unit, [(0x04 if block.input_registers else 0x03, block.address, block.count) for block in plan])
+
+
+def plan_range_reads(
+    ranges: Iterable[tuple[int, int]], input_registers: bool | None = None
+) -> tuple[RegisterBlock, ...]:
+    """Split inclusive address ranges into as few reads of up to MAX_READ_COUNT as possible.
+
+    Overlapping and adjacent ranges are merged. With ``input_registers`` None
+    the register type follows the address, as for the configured registers.
+    """
+    spans: list[tuple[bool, int, int]] = []
+    for first, last in ranges:
+        if input_registers is not None:
+            spans.append((input_registers, first, last))
+            continue
+        # Split where the address-derived register type changes.
+        for low, high in ((first, min(last, 29999)), (max(first, 30000), min(last, 39999)), (max(first, 40000), last)):
+            if low <= high:
+                spans.append((_is_input_register(low), low, high))
+
+    merged: list[list[Any]] = []
+    for kind, first, last in sorted(spans):
+        if merged and merged[-1][0] == kind and first <= merged[-1][2] + 1:
+            merged[-1][2] = max(merged[-1][2], last)
+        else:
+            merged.append([kind, first, last])
+    return tuple(
+        RegisterBlock(address, min(MAX_READ_COUNT, last - address + 1), kind, ())
+        for kind, first, last in merged
+        for address in range(first, last + 1, MAX_READ_COUNT)
+    )
+
+
+def serial_timeout(config: dict[str, Any]) -> float:
+    """Return the response timeout of a serial link for its baud rate and framing."""
+    parity_bit = 0 if config.get(CONF_PARITY, DEFAULT_PARITY) == "N" else 1
+    bits_per_char = 1 + 8 + parity_bit + int(config.get(CONF_STOPBITS, DEFAULT_STOPBITS))
+    return SERIAL_TURNAROUND + SERIAL_MAX_FRAME * bits_per_char / int(config.get(CONF_BAUDRATE, DEFAULT_BAUDRATE))
+
+
+def crc16(frame: bytes) -> int:
+    """Return the Modbus RTU CRC of ``frame``; it is sent low byte first."""
+    crc = 0xFFFF
+    for byte in frame:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def _frame_length(response: bytes, rtu: bool) -> int | None:
+    """Return the full length of a response frame once its header is in, else None."""
+    if rtu:
+        if len(response) < 3:
+            return None
+        # Exception responses carry one code byte instead of a byte count.
+        return 5 if response[1] & 0x80 else 5 + response[2]
+    if len(response) < _MBAP.size:
+        return None
+    return 6 + _MBAP.unpack_from(response)[2]
+
+
+def _is_input_register(address: int) -> bool:
+    return 30000 <= address < 40000
+
+
 class ZentecModbusApi:
     """Thin async-friendly wrapper over blocking pymodbus client."""
 
-    def __init__(self, host: str, port: int, config: dict[str, Any]) -> None:
-        self._client = ModbusTcpClient(host=host, port=port, timeout=10, retries=3)
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        config: dict[str, Any],
+        timeout: float = 10,
+        retries: int = 3,
+        client: ModbusTcpClient | ModbusSerialClient | None = None,
+    ) -> None:
+        # ``client`` replaces the Modbus client, e.g. with a fake bus in tests.
+        self._client = client if client is not None else self._create_client(host, port, config, timeout, retries)
+        self._capture: CaptureWriter | None = None
         self._config = config
+        self._register_map = build_register_map(config)
+        self._read_keys: tuple[str, ...] = ALL_REGISTERS
+        self._plan = compile_read_plan(self._register_map, ALL_REGISTERS)
+        self._sample_plan = compile_read_plan(self._register_map, SAMPLE_REGISTERS)
+        # Serializes transactions: polls, samples and writes run in separate executor jobs.
+        self._lock = threading.Lock()
+        self._last_activity = time.monotonic()
+        self._keepalive_socket: socket.socket | None = None
+        self._pipeline = ModbusTcpPipeline(timeout, self._trace_packet)
+        # Last value each holding register was read back or written with, and when (monotonic).
+        self._confirmed: dict[int, tuple[int, float]] = {}
+        self._encoded: dict[int, tuple[tuple[RegisterBlock, ...], EncodedReads]] = {}
+        self._encode_plans()
+        # Plain counters, updated under the lock and read from the event loop without it.
+        self.stats = TransactionStats()
+
+    def _create_client(
+        self, host: str, port: int, config: dict[str, Any], timeout: float, retries: int
+    ) -> ModbusTcpClient | ModbusSerialClient:
+        """Build the pymodbus client for the configured transport.
+
+        Imported here so the integration, its config flow and the offline CLI
+        commands load without pymodbus; construct off the event loop. The
+        serial client derives the RTU inter-frame silence from the baud rate
+        itself; its timeout is capped at ``serial_timeout`` since the
+        network-sized ``timeout`` would stall a multi-drop bus.
+        """
+        from pymodbus import FramerType
+        from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+
+        transport = config.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+        if transport == TRANSPORT_SERIAL:
+            return ModbusSerialClient(
+                port=host,
+                framer=FramerType.RTU,
+                baudrate=int(config.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)),
+                bytesize=8,
+                parity=config.get(CONF_PARITY, DEFAULT_PARITY),
+                stopbits=int(config.get(CONF_STOPBITS, DEFAULT_STOPBITS)),
+                timeout=min(timeout, serial_timeout(config)),
+                retries=retries,
+                trace_packet=self._trace_packet,
+            )
+        return ModbusTcpClient(
+            host=host,
+            port=port,
+            framer=FramerType.RTU if transport == TRANSPORT_RTU_OVER_TCP else FramerType.SOCKET,
+            timeout=timeout,
+            retries=retries,
+            trace_packet=self._trace_packet,
+        )
 
     @property
     def config(self) -> dict[str, Any]:
         """Return runtime config."""
         return self._config
 
+    @property
+    def register_map(self) -> dict[str, int]:
+        """Return the Modbus address of every register key."""
+        return self._register_map
+
+    @property
+    def read_plan(self) -> tuple[RegisterBlock, ...]:
+        """Return the block reads performed by ``read_state``."""
+        return self._plan
+
+    @property
+    def read_keys(self) -> tuple[str, ...]:
+        """Return the register keys in the read plan."""
+        return self._read_keys
+
+    def set_read_keys(self, keys: Iterable[str]) -> None:
+        """Restrict polling to the registers behind ``keys``."""
+        self._read_keys = tuple(keys)
+        self._plan = compile_read_plan(self._register_map, self._read_keys)
+        self._encode_plans()
+
+    def update_config(self, config: dict[str, Any]) -> None:
+        """Swap runtime config and recompile read plans on the open connection.
+
+        Waits for the transaction in progress; do not call from the event loop.
+        """
+        register_map = build_register_map(config)
+        plan = compile_read_plan(register_map, self._read_keys)
+        sample_plan = compile_read_plan(register_map, SAMPLE_REGISTERS)
+        with self._lock:
+            self._config = config
+            self._register_map = register_map
+            self._plan = plan
+            self._sample_plan = sample_plan
+            self._encode_plans()
+
+    def _encode_plans(self) -> None:
+        """Pre-encode the poll and sample plans for the lean transport, keyed by plan identity."""
+        unit = self._config[CONF_SLAVE_ID]
+        self._encoded = {id(plan): (plan, encode_read_plan(plan, unit)) for plan in (self._plan, self._sample_plan)}
+
+    @property
+    def capture_path(self) -> Path | None:
+        """Return the file traffic is being captured to, if any."""
+        return self._capture.path if self._capture is not None else None
+
+    def start_capture(self, path: Path) -> None:
+        """Record every request and response with timing to ``path``."""
+        from .capture import FRAMER_RTU, FRAMER_SOCKET, CaptureWriter
+
+        # The lean transport and the idle probe frame like pymodbus on the same link.
+        tcp = self._config.get(CONF_TRANSPORT, DEFAULT_TRANSPORT) == TRANSPORT_TCP
+        capture = CaptureWriter(path, FRAMER_SOCKET if tcp else FRAMER_RTU)
+        with self._lock:
+            previous, self._capture = self._capture, capture
+        if previous is not None:
+            previous.close()
+
+    def stop_capture(self) -> Path | None:
+        """Stop capturing and return the finished file.
+
+        Does not wait for a transaction in progress: the writer drops packets
+        recorded after it is closed.
+        """
+        capture, self._capture = self._capture, None
+        if capture is None:
+            return None
+        capture.close()
+        return capture.path
+
     def close(self) -> None:
-        """Close client socket."""
+        """Close client socket without waiting for a transaction in progress."""
+        self.stop_capture()
         self._client.close()
 
     def read_state(self) -> ZentecState:
-        """Read all key values from controller."""
+        """Read the registers in the current read plan from controller."""
+        return self.decode(self.read_raw())
+
+    def read_raw(self) -> dict[str, int | None]:
+        """Read the current read plan and return undecoded values by register key."""
+        return self._read_plan(self._plan)
+
+    def read_samples(self) -> ZentecState:
+        """Read only the registers tracked by the high-resolution sample buffer."""
+        return self.decode(self._read_plan(self._sample_plan))
+
+    def probe(self, budget: float) -> ProbeResult:
+        """Read the full register map once and time every request.
+
+        The budget covers the connect: a request that could not get its
+        answer within ``budget`` seconds of the start, even timing out, is
+        reported as failed instead of being sent, so the probe returns in
+        time without being cancelled. ``round_trip`` averages the answered
+        requests only. Raises ConnectionError if the socket cannot open.
+        """
+        unit = self._config[CONF_SLAVE_ID]
+        plan = compile_read_plan(self._register_map, ALL_REGISTERS)
+        values: dict[str, int | None] = dict.fromkeys(ALL_REGISTERS)
+        failed: list[int] = []
+        elapsed = 0.0
+        answered = 0
+        deadline = time.monotonic() + budget
+        with self._lock:
+            if not self._client.connect():
+                raise ConnectionError("Failed to connect to Zentec controller")
+            for block in plan:
+                if time.monotonic() + self._pipeline.timeout > deadline:
+                    failed.append(block.address)
+                    continue
+                started = time.perf_counter()
+                registers = self._read_block(block, unit)
+                if registers is None:
+                    failed.append(block.address)
+                    continue
+                elapsed += time.perf_counter() - started
+                answered += 1
+                for key, offset in block.keys:
+                    values[key] = registers[offset]
+        return ProbeResult(
+            state=self.decode(values),
+            requests=len(plan),
+            round_trip=elapsed / answered if answered else 0.0,
+            failed_addresses=failed,
+        )
+
+    def read_registers(self, blocks: Iterable[RegisterBlock]) -> tuple[dict[int, int], list[RegisterBlock]]:
+        """Read arbitrary blocks and return values by address plus the blocks that failed.
+
+        The lock is taken per block, so polls and writes interleave with a long survey.
+        """
+        unit = self._config[CONF_SLAVE_ID]
+        values: dict[int, int] = {}
+        failed: list[RegisterBlock] = []
+        for block in blocks:
+            with self._lock:
+                registers = self._read_block(block, unit)
+                if registers is not None:
+                    self._confirm(block, registers)
+            if registers is None:
+                failed.append(block)
+                continue
+            values.update(zip(range(block.address, block.address + block.count), registers))
+        return values, failed
+
+    def read_clock(self) -> tuple[ControllerClock, float]:
+        """Read the clock block in one request.
+
+        Returns the clock and the Unix time halfway through the request, to
+        compare against. Raises ConnectionError if the read fails.
+        """
         unit = self._config[CONF_SLAVE_ID]
+        with self._lock:
+            started = time.time()
+            registers = self._read_block(_CLOCK_BLOCK, unit)
+            read_at = (started + time.time()) / 2
+        if registers is None:
+            raise ConnectionError("Failed to read controller clock")
+        return ControllerClock.from_registers(registers), read_at
+
+    def write_clock(self, now: Callable[[], datetime]) -> None:
+        """Set the clock to ``now()`` with one multi-register write.
+
+        ``now`` is called once the bus is free, so waiting for a running poll
+        does not end up in the written time.
+        """
+        unit = self._config[CONF_SLAVE_ID]
+        with self._lock:
+            self._ensure_client_connected()
+            clock = ControllerClock.from_datetime(now())
+            result = self._client.write_registers(address=CLOCK_REGISTER, values=clock.to_registers(), device_id=unit)
+            self._last_activity = time.monotonic()
+        if result.isError():
+            raise ConnectionError(f"Controller rejected the clock write: {result}")
+
+    def supervise_connection(self, probe_after: float) -> bool | None:
+        """Keep an idle connection ready so the next transaction does not hit a dead socket.
+
+        Reopens a closed connection, drops a socket the peer has closed or reset
+        and, after ``probe_after`` seconds without traffic, checks the link with
+        a one-register read that gives up after IDLE_PROBE_TIMEOUT instead of
+        the client timeout and retries. Returns whether the connection is
+        usable, or None if a transaction was running and nothing was checked.
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            probe_failed = False
+            if (sock := self._socket()) is not None:
+                if self._socket_closed(sock):
+                    # Gateways close idle sockets routinely; just reopen.
+                    self._client.close()
+                elif time.monotonic() - self._last_activity >= probe_after and not self._probe_socket(sock):
+                    probe_failed = True
+                    self._client.close()
+            if not self._client.connected:
+                self._ensure_client_connected()
+            return not probe_failed and bool(self._client.connected)
+        finally:
+            self._lock.release()
+
+    def check_link(self) -> bool:
+        """Open the connection if needed and check it with a one-register read.
+
+        On TCP links the read gives up after IDLE_PROBE_TIMEOUT; serial links
+        read through pymodbus. Used to tell when a gateway that stopped
+        answering is back, so it costs one short transaction.
+        """
+        with self._lock:
+            try:
+                self._ensure_client_connected()
+            except Exception:  # noqa: BLE001
+                return False
+            if not self._client.connected:
+                return False
+            if (sock := self._socket()) is None:
+                block = self._plan[0] if self._plan else RegisterBlock(self._register_map[REG_POWER], 1, False, ())
+                return self._read_block(block, self._config[CONF_SLAVE_ID]) is not None
+            if self._probe_socket(sock):
+                return True
+            self._client.close()
+            return False
+
+    def _socket(self) -> socket.socket | None:
+        # Only TCP links are supervised; the serial client keeps a serial port here.
+        sock = getattr(self._client, "socket", None)
+        return sock if isinstance(sock, socket.socket) else None
+
+    def _configure_socket(self) -> None:
+        """Enable TCP keepalive once per new socket, so silently dropped peers get noticed."""
+        sock = self._socket()
+        if sock is None or sock is self._keepalive_socket:
+            return
+        self._keepalive_socket = sock
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in (
+                ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+                ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+                ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+            ):
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _socket_closed(sock: socket.socket) -> bool:
+        """Return True if the peer closed or reset the socket; discard stale bytes."""
+        try:
+            while select.select([sock], [], [], 0)[0]:
+                # Readable with nothing to read means FIN; leftover bytes are late
+                # responses to timed-out requests and would confuse the next one.
+                if not sock.recv(4096, socket.MSG_DONTWAIT):
+                    return True
+        except (BlockingIOError, InterruptedError):
+            return False
+        except (OSError, ValueError):
+            return True
+        return False
+
+    def _probe_socket(self, sock: socket.socket) -> bool:
+        """Read one register directly on the socket and wait at most IDLE_PROBE_TIMEOUT."""
+        block = self._plan[0] if self._plan else RegisterBlock(self._register_map[REG_POWER], 1, False, ())
+        unit = self._config[CONF_SLAVE_ID]
+        pdu = _READ_PDU.pack(0x04 if block.input_registers else 0x03, block.address, 1)
+        rtu = self._config.get(CONF_TRANSPORT) == TRANSPORT_RTU_OVER_TCP
+        if rtu:
+            request = bytes((unit,)) + pdu
+            request += crc16(request).to_bytes(2, "little")
+        else:
+            request = _MBAP.pack(_PROBE_TRANSACTION, 0, 1 + len(pdu), unit) + pdu
+        self._trace_packet(True, request)
+        response = b""
+        deadline = time.monotonic() + IDLE_PROBE_TIMEOUT
+        try:
+            sock.sendall(request)
+            while (remaining := deadline - time.monotonic()) > 0 and select.select([sock], [], [], remaining)[0]:
+                chunk = sock.recv(256, socket.MSG_DONTWAIT)
+                if not chunk:
+                    return False
+                response += chunk
+                if (length := _frame_length(response, rtu)) is not None and len(response) >= length:
+                    break
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            return False
+        length = _frame_length(response, rtu)
+        if length is None or len(response) < length:
+            return False
+        self._trace_packet(False, response)
+        # Any answer, an exception response included, proves the link is alive.
+        if rtu:
+            if response[0] != unit or crc16(response[: length - 2]).to_bytes(2, "little") != response[length - 2 : length]:
+                return False
+        elif _MBAP.unpack_from(response)[0] != _PROBE_TRANSACTION:
+            return False
+        self._last_activity = time.monotonic()
+        return True
+
+    def _read_plan(self, plan: tuple[RegisterBlock, ...]) -> dict[str, int | None]:
+        unit = self._config[CONF_SLAVE_ID]
+        values: dict[str, int | None] = dict.fromkeys(ALL_REGISTERS)
+        with self._lock:
+            started = time.perf_counter()
+            window = int(self._config.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW))
+            lean = bool(self._config.get(CONF_LEAN_TRANSPORT, DEFAULT_LEAN_TRANSPORT))
+            raw = self._read_lean(plan, unit, window) if lean or (window > 1 and len(plan) > 1) else None
+            stats = self.stats
+            stats.reads += len(plan)
+            for index, block in enumerate(plan):
+                registers = raw[index] if raw is not None else self._read_block(block, unit)
+                if registers is None:
+                    stats.read_errors += 1
+                    continue
+                self._confirm(block, registers)
+                for key, offset in block.keys:
+                    values[key] = registers[offset]
+            stats.read_seconds += time.perf_counter() - started
+        return values
+
+    def _read_lean(
+        self, plan: tuple[RegisterBlock, ...], unit: int, window: int
+    ) -> list[tuple[int, ...] | None] | None:
+        """Read ``plan`` with pre-encoded requests, up to ``window`` in flight; None where pymodbus must read.
+
+        Runs on the pymodbus client's socket, so the gateway still sees one
+        connection. Needs MBAP framing, so RTU framings and clients without a
+        TCP socket read block by block through pymodbus.
+        """
+        if self._config.get(CONF_TRANSPORT, DEFAULT_TRANSPORT) != TRANSPORT_TCP:
+            return None
+        try:
+            self._ensure_client_connected()
+        except Exception:  # noqa: BLE001
+            return None
+        if (sock := self._socket()) is None:
+            return None
+        encoded = self._encoded.get(id(plan))
+        reads = encoded[1] if encoded is not None and encoded[0] is plan else encode_read_plan(plan, unit)
+        try:
+            results, timed_out = self._pipeline.read(sock, reads, window)
+        except OSError:
+            self._client.close()
+            return [None] * len(plan)
+        if timed_out:
+            # Late responses would be taken for the next transaction's.
+            self._client.close()
+        if any(registers is not None for registers in results):
+            self._last_activity = time.monotonic()
+        return results
+
+    def decode(self, values: dict[str, int | None]) -> ZentecState:
+        """Decode raw values keyed by register key into a state."""
         divisor = max(int(self._config[CONF_TEMPERATURE_DIVISOR]), 1)
         supply_divisor = max(int(self._config[CONF_SUPPLY_TEMP_DIVISOR]), 1)
-        reg_map = {
-            "power": int(self._config[CONF_POWER_REGISTER]),
-            "mode": int(self._config[CONF_MODE_REGISTER]),
-            "fan_speed": int(self._config[CONF_FAN_SPEED_REGISTER]),
-            "target_temp": int(self._config[CONF_TARGET_TEMP_REGISTER]),
-            "min_heat_temp": int(self._config[CONF_MIN_HEAT_TEMP_REGISTER]),
-            "max_heat_temp": int(self._config[CONF_MAX_HEAT_TEMP_REGISTER]),
-            "supply_temp": int(self._config[CONF_SUPPLY_TEMP_REGISTER]),
-            "outdoor_temp": int(self._config[CONF_OUTDOOR_TEMP_REGISTER]),
-            "alarm_code": int(self._config[CONF_ALARM_REGISTER]),
-            "alarm_code_2": int(self._config[CONF_ALARM_REGISTER]) + 1,
-            "alarm_code_3": int(self._config[CONF_ALARM_REGISTER]) + 2,
-        }
-        values = {key: self._read_register(address, unit) for key, address in reg_map.items()}
-        power_raw = values["power"]
-        mode_raw = values["mode"]
-        fan_speed = values["fan_speed"]
-        target_temp_raw = values["target_temp"]
-        min_heat_temp_raw = values["min_heat_temp"]
-        max_heat_temp_raw = values["max_heat_temp"]
-        supply_temp_raw = values["supply_temp"]
-        outdoor_temp_raw = values["outdoor_temp"]
-        alarm_code = values["alarm_code"]
-        alarm_code_2 = values["alarm_code_2"]
-        alarm_code_3 = values["alarm_code_3"]
+        power_raw = values[REG_POWER]
+        mode_raw = values[REG_MODE]
+        fan_speed = values[REG_FAN_SPEED]
+        target_temp_raw = values[REG_TARGET_TEMP]
+        min_heat_temp_raw = values[REG_MIN_HEAT_TEMP]
+        max_heat_temp_raw = values[REG_MAX_HEAT_TEMP]
+        supply_temp_raw = values[REG_SUPPLY_TEMP]
+        outdoor_temp_raw = values[REG_OUTDOOR_TEMP]
+        alarm_code = values[REG_ALARM_1]
+        alarm_code_2 = values[REG_ALARM_2]
+        alarm_code_3 = values[REG_ALARM_3]
 
         return ZentecState(
             power=bool(power_raw) if power_raw is not None else None,
@@ -104,95 +787,148 @@ class ZentecModbusApi:
             alarm_code_3=alarm_code_3,
         )
 
-    def set_power(self, enabled: bool) -> None:
+    def setting_values(
+        self,
+        power: bool | None = None,
+        mode_value: int | None = None,
+        fan_speed: int | None = None,
+        target_temp: float | None = None,
+    ) -> dict[int, int]:
+        """Return raw register values by address for the given settings, for ``write_values``."""
+        values: dict[int, int] = {}
+        if power is not None:
+            values[self._config[CONF_POWER_REGISTER]] = 1 if power else 0
+        if mode_value is not None:
+            values[self._config[CONF_MODE_REGISTER]] = mode_value
+        if fan_speed is not None:
+            max_speed = max(int(self._config[CONF_MAX_FAN_SPEED]), 1)
+            values[self._config[CONF_FAN_SPEED_REGISTER]] = max(1, min(fan_speed, max_speed))
+        if target_temp is not None:
+            divisor = max(int(self._config[CONF_TEMPERATURE_DIVISOR]), 1)
+            values[self._config[CONF_TARGET_TEMP_REGISTER]] = int(round(target_temp * divisor))
+        return values
+
+    def set_power(self, enabled: bool, force: bool = False) -> bool:
         """Write power state to holding register."""
-        unit = self._config[CONF_SLAVE_ID]
-        self._ensure_client_connected()
-        self._client.write_register(
-            address=self._config[CONF_POWER_REGISTER],
-            value=1 if enabled else 0,
-            device_id=unit,
-        )
+        return self.write_values(self.setting_values(power=enabled), force) > 0
 
-    def set_fan_speed(self, fan_speed: int) -> None:
+    def set_fan_speed(self, fan_speed: int, force: bool = False) -> bool:
         """Write fan speed to holding register."""
-        max_speed = max(int(self._config[CONF_MAX_FAN_SPEED]), 1)
-        fan_speed = max(1, min(fan_speed, max_speed))
-        unit = self._config[CONF_SLAVE_ID]
-
-        self._ensure_client_connected()
-        self._client.write_register(
-            address=self._config[CONF_FAN_SPEED_REGISTER],
-            value=fan_speed,
-            device_id=unit,
-        )
+        return self.write_values(self.setting_values(fan_speed=fan_speed), force) > 0
 
-    def set_mode(self, mode_value: int) -> None:
+    def set_mode(self, mode_value: int, force: bool = False) -> bool:
         """Write operation mode to holding register."""
-        unit = self._config[CONF_SLAVE_ID]
-        self._ensure_client_connected()
-        self._client.write_register(
-            address=self._config[CONF_MODE_REGISTER],
-            value=mode_value,
-            device_id=unit,
-        )
+        return self.write_values(self.setting_values(mode_value=mode_value), force) > 0
 
-    def set_target_temp(self, target_temp: float) -> None:
+    def set_target_temp(self, target_temp: float, force: bool = False) -> bool:
         """Write target air temperature to holding register."""
-        divisor = max(int(self._config[CONF_TEMPERATURE_DIVISOR]), 1)
-        value = int(round(target_temp * divisor))
-        unit = self._config[CONF_SLAVE_ID]
-
-        self._ensure_client_connected()
-        self._client.write_register(
-            address=self._config[CONF_TARGET_TEMP_REGISTER],
-            value=value,
-            device_id=unit,
-        )
+        return self.write_values(self.setting_values(target_temp=target_temp), force) > 0
 
-    def set_min_heat_temp(self, value: float) -> None:
+    def set_min_heat_temp(self, value: float, force: bool = False) -> bool:
         """Write minimum heating setpoint."""
         divisor = max(int(self._config[CONF_TEMPERATURE_DIVISOR]), 1)
         raw = int(round(value * divisor))
-        unit = self._config[CONF_SLAVE_ID]
-        self._ensure_client_connected()
-        self._client.write_register(
-            address=self._config[CONF_MIN_HEAT_TEMP_REGISTER],
-            value=raw,
-            device_id=unit,
-        )
+        return self.write_values({self._config[CONF_MIN_HEAT_TEMP_REGISTER]: raw}, force) > 0
 
-    def set_max_heat_temp(self, value: float) -> None:
+    def set_max_heat_temp(self, value: float, force: bool = False) -> bool:
         """Write maximum heating setpoint."""
         divisor = max(int(self._config[CONF_TEMPERATURE_DIVISOR]), 1)
         raw = int(round(value * divisor))
+        return self.write_values({self._config[CONF_MAX_HEAT_TEMP_REGISTER]: raw}, force) > 0
+
+    def write_values(self, values: dict[int, int], force: bool = False) -> int:
+        """Write raw values by address in as few transactions as possible; return how many were sent.
+
+        Registers recently confirmed to hold the requested value are skipped:
+        setters run on every automation re-assert and parameters live in
+        wear-limited storage. ``force`` or a freshness window of 0 writes
+        everything. Remaining addresses become write-multiple runs; a gap
+        between them is bridged only with registers of ``values`` that were
+        skipped, so a run never carries a register the caller did not ask
+        for. A single register is written with write-single.
+        """
         unit = self._config[CONF_SLAVE_ID]
-        self._ensure_client_connected()
-        self._client.write_register(
-            address=self._config[CONF_MAX_HEAT_TEMP_REGISTER],
-            value=raw,
-            device_id=unit,
-        )
+        freshness = float(self._config.get(CONF_WRITE_FRESHNESS, DEFAULT_WRITE_FRESHNESS))
+        with self._lock:
+            now = time.monotonic()
+            fresh = {
+                address: confirmed[0]
+                for address, confirmed in self._confirmed.items()
+                if now - confirmed[1] <= freshness
+            }
+            runs: list[dict[int, int]] = []
+            for address in sorted(values):
+                value = values[address]
+                if not force and fresh.get(address) == value:
+                    continue
+                if runs:
+                    run = runs[-1]
+                    last = next(reversed(run))
+                    gap = range(last + 1, address)
+                    if address - next(iter(run)) < MAX_WRITE_COUNT and all(register in values for register in gap):
+                        run.update((register, values[register]) for register in gap)
+                        run[address] = value
+                        continue
+                runs.append({address: value})
+            for run in runs:
+                address = next(iter(run))
+                self.stats.writes += 1
+                try:
+                    self._ensure_client_connected()
+                    if len(run) == 1:
+                        result = self._client.write_register(address=address, value=run[address], device_id=unit)
+                    else:
+                        result = self._client.write_registers(address=address, values=list(run.values()), device_id=unit)
+                except Exception:
+                    self.stats.write_errors += 1
+                    raise
+                self._last_activity = time.monotonic()
+                if result.isError():
+                    self.stats.write_errors += 1
+                    for register in run:
+                        self._confirmed.pop(register, None)
+                    raise ConnectionError(f"Controller rejected writing registers {address}..{next(reversed(run))}: {result}")
+                self._confirmed.update((register, (value, self._last_activity)) for register, value in run.items())
+        return len(runs)
 
-    def _read_register(self, address: int, unit: int) -> int | None:
+    def _confirm(self, block: RegisterBlock, registers: Sequence[int]) -> None:
+        # Writes go to holding registers; an input register may share their address.
+        if block.input_registers:
+            return
+        now = time.monotonic()
+        for offset, value in enumerate(registers):
+            self._confirmed[block.address + offset] = (value, now)
+
+    def _read_block(self, block: RegisterBlock, unit: int) -> list[int] | None:
         try:
             self._ensure_client_connected()
-            if 30000 <= address < 40000:
-                result = self._client.read_input_registers(address=address, count=1, device_id=unit)
+            if block.input_registers:
+                result = self._client.read_input_registers(address=block.address, count=block.count, device_id=unit)
             else:
-                result = self._client.read_holding_registers(address=address, count=1, device_id=unit)
+                result = self._client.read_holding_registers(address=block.address, count=block.count, device_id=unit)
         except Exception:  # noqa: BLE001
             return None
-        if result.isError() or not getattr(result, "registers", None):
+        registers = getattr(result, "registers", None)
+        if result.isError() or not registers or len(registers) < block.count:
             return None
-        return int(result.registers[0])
+        self._last_activity = time.monotonic()
+        return [int(value) for value in registers]
+
+    def _trace_packet(self, sending: bool, data: bytes) -> bytes:
+        if (capture := self._capture) is not None:
+            capture.record(sending, data)
+        return data
 
     def _ensure_client_connected(self) -> None:
         if not self._client.connected:
             self._client.connect()
+        self._configure_socket()
 
     @staticmethod
     def _to_temp(value: int | None, divisor: int) -> float | None:
         if value is None:
             return None
+        # Temperatures are SInt16 on the wire.
+        if value >= 0x8000:
+            value -= 0x10000
         return round(value / divisor, 1)
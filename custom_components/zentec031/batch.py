@@ -0,0 +1,263 @@
+"""Columnar batch decoding and export of raw Zentec 031 register images.
+
+NumPy is an optional dependency (and pyarrow for Parquet output): both are
+imported on first use, so the integration and the collector run without them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+from .const import (
+    ALARM_COUNT,
+    ALARM_WORD_KEYS,
+    ALL_REGISTERS,
+    CONF_SUPPLY_TEMP_DIVISOR,
+    CONF_TEMPERATURE_DIVISOR,
+    DEFAULT_SUPPLY_TEMP_DIVISOR,
+    DEFAULT_TEMPERATURE_DIVISOR,
+    REG_FAN_SPEED,
+    REG_MAX_HEAT_TEMP,
+    REG_MIN_HEAT_TEMP,
+    REG_MODE,
+    REG_OUTDOOR_TEMP,
+    REG_POWER,
+    REG_SUPPLY_TEMP,
+    REG_TARGET_TEMP,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Marker for registers that were not read, in raw images and integer columns.
+MISSING = -1
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+_INDEX = {key: index for index, key in enumerate(ALL_REGISTERS)}
+ALARM_COLUMNS = tuple(f"alarm_e{alarm:02d}" for alarm in range(1, ALARM_COUNT + 1))
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as err:
+        raise RuntimeError("Batch decoding requires NumPy (pip install numpy)") from err
+    return numpy
+
+
+# Decoded temperatures of every SInt16 value by divisor. ``np.round`` rounds
+# some ties (e.g. 0.15) differently from the ``round`` used by
+# ``ZentecModbusApi.decode``, so the tables are built with ``round`` itself.
+_TEMPERATURE_TABLES: dict[int, np.ndarray] = {}
+
+
+def _temperature_table(divisor: int) -> np.ndarray:
+    table = _TEMPERATURE_TABLES.get(divisor)
+    if table is None:
+        table = _numpy().array([round(value / divisor, 1) for value in range(-0x8000, 0x8000)])
+        _TEMPERATURE_TABLES[divisor] = table
+    return table
+
+
+def decode_batch(
+    images: Any,
+    temperature_divisor: Any = DEFAULT_TEMPERATURE_DIVISOR,
+    supply_temp_divisor: Any = DEFAULT_SUPPLY_TEMP_DIVISOR,
+) -> dict[str, np.ndarray]:
+    """Decode N raw register images in one vectorized pass.
+
+    ``images`` is an (N, len(ALL_REGISTERS)) integer array in ``ALL_REGISTERS``
+    order with ``MISSING`` for unread registers. Divisors are scalars or
+    per-row arrays. Columns mirror ``ZentecState``: temperatures are float64
+    with NaN when missing, other values int32 with ``MISSING``. One bool
+    column per alarm E01..E48 follows.
+    """
+    np = _numpy()
+    raw = np.asarray(images, dtype=np.int32)
+    if raw.ndim != 2 or raw.shape[1] != len(ALL_REGISTERS):
+        raise ValueError(f"Expected an (N, {len(ALL_REGISTERS)}) array, got shape {raw.shape}")
+    missing = raw == MISSING
+    # Temperatures are SInt16 on the wire; offset them to index the tables.
+    offset = np.where(raw >= 0x8000, raw - 0x8000, raw + 0x8000)
+    divisor = np.broadcast_to(np.maximum(np.asarray(temperature_divisor, dtype=np.int32), 1), len(raw))
+    supply_divisor = np.broadcast_to(np.maximum(np.asarray(supply_temp_divisor, dtype=np.int32), 1), len(raw))
+
+    def temperature(key: str, scale: np.ndarray) -> np.ndarray:
+        index = _INDEX[key]
+        values = np.empty(len(raw), dtype=np.float64)
+        for value in np.unique(scale):
+            rows = scale == value
+            values[rows] = _temperature_table(int(value))[offset[rows, index]]
+        values[missing[:, index]] = np.nan
+        return values
+
+    power_raw = raw[:, _INDEX[REG_POWER]]
+    columns: dict[str, np.ndarray] = {
+        "power": np.where(power_raw == MISSING, MISSING, power_raw != 0).astype(np.int32),
+        "power_raw": power_raw,
+        "mode_raw": raw[:, _INDEX[REG_MODE]],
+        "fan_speed": raw[:, _INDEX[REG_FAN_SPEED]],
+    }
+    for key in (REG_TARGET_TEMP, REG_MIN_HEAT_TEMP, REG_MAX_HEAT_TEMP):
+        columns[key] = temperature(key, divisor)
+    columns[REG_SUPPLY_TEMP] = temperature(REG_SUPPLY_TEMP, supply_divisor)
+    columns[REG_OUTDOOR_TEMP] = temperature(REG_OUTDOOR_TEMP, divisor)
+
+    word_index = [_INDEX[key] for key in ALARM_WORD_KEYS]
+    words = raw[:, word_index]
+    for key, word in zip(ALARM_WORD_KEYS, words.T):
+        columns[key] = word
+    # (N, 3, 16) bit planes flattened to (N, 48), bit0 of the first word is E01.
+    bits = (np.where(words == MISSING, 0, words)[:, :, None] >> np.arange(16, dtype=np.int32)) & 1
+    alarms = bits.reshape(len(raw), ALARM_COUNT).astype(bool)
+    for index, name in enumerate(ALARM_COLUMNS):
+        columns[name] = alarms[:, index]
+    return columns
+
+
+@dataclass(slots=True)
+class RawChunk:
+    """A batch of raw images read from collector output."""
+
+    times: list[str]
+    devices: list[str]
+    images: np.ndarray
+    temperature_divisor: np.ndarray
+    supply_temp_divisor: np.ndarray
+
+
+def read_raw_records(sources: Iterable[TextIO], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[RawChunk]:
+    """Yield chunks of raw images from ``zentec031_cli.py poll --raw`` NDJSON."""
+    np = _numpy()
+    times: list[str] = []
+    devices: list[str] = []
+    rows: list[list[int]] = []
+    divisors: list[tuple[int, int]] = []
+
+    def flush() -> RawChunk:
+        chunk = RawChunk(
+            times=times.copy(),
+            devices=devices.copy(),
+            images=np.array(rows, dtype=np.int32).reshape(len(rows), len(ALL_REGISTERS)),
+            temperature_divisor=np.array([value[0] for value in divisors], dtype=np.int32),
+            supply_temp_divisor=np.array([value[1] for value in divisors], dtype=np.int32),
+        )
+        times.clear()
+        devices.clear()
+        rows.clear()
+        divisors.clear()
+        return chunk
+
+    for source in sources:
+        for line in source:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            registers = record.get("registers")
+            if registers is None:
+                raise ValueError("Record without registers; collect with --raw")
+            times.append(record["time"])
+            devices.append(record["device"])
+            rows.append([MISSING if (value := registers.get(key)) is None else value for key in ALL_REGISTERS])
+            divisors.append(
+                (
+                    int(record.get(CONF_TEMPERATURE_DIVISOR, DEFAULT_TEMPERATURE_DIVISOR)),
+                    int(record.get(CONF_SUPPLY_TEMP_DIVISOR, DEFAULT_SUPPLY_TEMP_DIVISOR)),
+                )
+            )
+            if len(rows) >= chunk_size:
+                yield flush()
+    if rows:
+        yield flush()
+
+
+class CsvChunkWriter:
+    """Append decoded chunks to a CSV file, writing the header once."""
+
+    def __init__(self, path: Path) -> None:
+        self._handle = path.open("w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._handle)
+        self._header = False
+
+    def write(self, chunk: RawChunk, columns: dict[str, np.ndarray]) -> None:
+        """Write one chunk; missing values become empty cells."""
+        np = _numpy()
+        if not self._header:
+            self._writer.writerow(["time", "device", *columns])
+            self._header = True
+        cells: list[list[Any]] = [chunk.times, chunk.devices]
+        for values in columns.values():
+            if values.dtype == bool:
+                cells.append(values.view(np.uint8).tolist())
+                continue
+            # Object arrays keep native ints/floats, which csv formats far faster than astype(str).
+            missing = np.isnan(values) if values.dtype.kind == "f" else values == MISSING
+            if not missing.any():
+                cells.append(values.tolist())
+                continue
+            cell = values.astype(object)
+            cell[missing] = ""
+            cells.append(cell.tolist())
+        self._writer.writerows(zip(*cells))
+
+    def close(self) -> None:
+        """Close the file."""
+        self._handle.close()
+
+
+class ParquetChunkWriter:
+    """Write each decoded chunk as one Parquet row group."""
+
+    def __init__(self, path: Path) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as err:
+            raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)") from err
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._path = path
+        self._writer: Any = None
+
+    def write(self, chunk: RawChunk, columns: dict[str, np.ndarray]) -> None:
+        """Write one chunk; missing values become nulls."""
+        np = _numpy()
+        pa = self._pa
+        millis = np.array([datetime.fromisoformat(value).timestamp() * 1000 for value in chunk.times], dtype=np.int64)
+        arrays = [pa.array(millis, type=pa.timestamp("ms", tz="UTC")), pa.array(chunk.devices, type=pa.string())]
+        for values in columns.values():
+            if values.dtype == bool:
+                arrays.append(pa.array(values))
+            elif values.dtype.kind == "f":
+                arrays.append(pa.array(values, mask=np.isnan(values)))
+            else:
+                arrays.append(pa.array(values, mask=values == MISSING))
+        table = pa.Table.from_arrays(arrays, names=["time", "device", *columns])
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        """Finish the file."""
+        if self._writer is not None:
+            self._writer.close()
+
+
+def export_raw_records(sources: Iterable[TextIO], path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Decode raw NDJSON chunk by chunk into CSV or Parquet (by suffix) and return the row count."""
+    writer = ParquetChunkWriter(path) if path.suffix == ".parquet" else CsvChunkWriter(path)
+    rows = 0
+    try:
+        for chunk in read_raw_records(sources, chunk_size):
+            writer.write(chunk, decode_batch(chunk.images, chunk.temperature_divisor, chunk.supply_temp_divisor))
+            rows += len(chunk.times)
+    finally:
+        writer.close()
+    return rows
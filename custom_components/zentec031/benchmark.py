@@ -0,0 +1,114 @@
+"""Import and setup-path timing checks for Zentec 031.
+
+Each import is timed in a fresh interpreter, which also reports which heavy
+modules the import pulled in. Importing the integration must not load the
+modules in ``LAZY_IMPORTS``; those checks are deterministic, so they catch an
+eager import even when timing noise would hide it. Modules that run without
+Home Assistant are imported from the bare package, as the CLI launcher does.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import importlib.util
+import json
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import time
+
+from .api import ZentecModbusApi
+from .const import DOMAIN
+from .runtime_config import build_runtime_config
+
+# Module -> prefixes of modules it must not import; True if it needs Home Assistant.
+LAZY_IMPORTS: dict[str, tuple[tuple[str, ...], bool]] = {
+    DOMAIN: (("pymodbus", "numpy", "pyarrow"), True),
+    f"{DOMAIN}.cli": (("pymodbus", "numpy", "pyarrow"), False),
+    f"{DOMAIN}.config_flow": (("pymodbus",), True),
+    f"{DOMAIN}.coordinator": (("pymodbus", "homeassistant.components.recorder"), True),
+    f"{DOMAIN}.sensor": (("pymodbus", "homeassistant.components.recorder"), True),
+}
+
+_PROBE = """
+import json, sys, time, types
+if {bare!r}:
+    package = types.ModuleType({package!r})
+    package.__path__ = [{path!r}]
+    sys.modules[{package!r}] = package
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+loaded = [prefix for prefix in {prefixes!r} if any(name == prefix or name.startswith(prefix + ".") for name in sys.modules)]
+print(json.dumps([elapsed, loaded]))
+"""
+
+
+@dataclass(slots=True)
+class ImportResult:
+    """Import timing of one module in fresh interpreters."""
+
+    module: str
+    seconds: list[float] = field(default_factory=list)
+    eager: list[str] = field(default_factory=list)
+    skipped: bool = False
+
+    @property
+    def median(self) -> float:
+        """Return the median import time in seconds."""
+        return statistics.median(self.seconds) if self.seconds else 0.0
+
+
+def measure_import(module: str, forbidden: tuple[str, ...], runs: int, bare: bool = False) -> ImportResult:
+    """Import ``module`` ``runs`` times, each in a new interpreter.
+
+    ``bare`` registers the package without running its ``__init__``.
+    """
+    result = ImportResult(module)
+    environment = dict(os.environ)
+    package = Path(__file__).resolve().parent
+    root = str(package.parent)
+    probe = _PROBE.format(module=module, prefixes=forbidden, bare=bare, package=DOMAIN, path=str(package))
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, (root, environment.get("PYTHONPATH"))))
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            check=True,
+            env=environment,
+            text=True,
+        ).stdout
+        seconds, eager = json.loads(output.splitlines()[-1])
+        result.seconds.append(seconds)
+        result.eager = eager
+    return result
+
+
+def measure_imports(runs: int) -> list[ImportResult]:
+    """Time every module in ``LAZY_IMPORTS``; Home Assistant ones are skipped without it."""
+    has_homeassistant = importlib.util.find_spec("homeassistant") is not None
+    results: list[ImportResult] = []
+    for module, (forbidden, needs_homeassistant) in LAZY_IMPORTS.items():
+        if needs_homeassistant and not has_homeassistant:
+            results.append(ImportResult(module, skipped=True))
+            continue
+        results.append(measure_import(module, forbidden, runs, bare=not needs_homeassistant))
+    return results
+
+
+def measure_setup(entries: int) -> tuple[float, float]:
+    """Return seconds for the first and the mean of further entry setups.
+
+    Covers the per-entry work done before the first poll: parsing entry data
+    and options once and building the API with its compiled read plans. The
+    first setup includes loading pymodbus.
+    """
+    timings: list[float] = []
+    for _ in range(max(entries, 2)):
+        started = time.perf_counter()
+        api = ZentecModbusApi("192.0.2.1", 502, build_runtime_config({}, {}))
+        timings.append(time.perf_counter() - started)
+        api.close()
+    return timings[0], statistics.fmean(timings[1:])
@@ -0,0 +1,61 @@
+"""Binary sensor platform for Zentec 031."""
+
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import ALARM_COUNT, ALARM_WORD_KEYS
+from .coordinator import ZentecCoordinator
+from .entity import ZentecEntity
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator = entry.runtime_data
+    async_add_entities(ZentecAlarmBinarySensor(coordinator, entry, alarm) for alarm in range(1, ALARM_COUNT + 1))
+
+
+class ZentecAlarmBinarySensor(ZentecEntity, BinarySensorEntity):
+    """Single alarm bit (E01..E48) decoded from the alarm registers.
+
+    State is pushed by the coordinator only when this bit flips, so a poll
+    without alarm changes does not rewrite any of the 48 alarm states.
+    """
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(self, coordinator: ZentecCoordinator, entry: ConfigEntry, alarm: int) -> None:
+        super().__init__(coordinator, entry)
+        self._alarm = alarm
+        self._attr_name = f"Alarm E{alarm:02d}"
+        self._register_keys = (ALARM_WORD_KEYS[(alarm - 1) // 16],)
+        # Alarms 17-48 mirror the disabled-by-default raw alarm diagnostics.
+        self._attr_entity_registry_enabled_default = alarm <= 16
+        self._last_available: bool | None = None
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._entry.entry_id}_alarm_e{self._alarm:02d}"
+
+    @property
+    def is_on(self) -> bool | None:
+        return self.coordinator.alarm_active(self._alarm)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._last_available = self.available
+        self.async_on_remove(self.coordinator.async_add_alarm_listener(self._alarm, self.async_write_ha_state))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Bit changes arrive through the alarm listener; only availability is tracked here.
+        available = self.available
+        if available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
@@ -0,0 +1,277 @@
+"""Capture of Modbus traffic to a binary file and replay of it.
+
+A capture starts with ``HEADER`` (magic, version, wall-clock start, framer)
+and is followed by one ``RECORD`` per packet: direction, seconds since start
+and length, then the raw frame bytes as seen by pymodbus. Version 1 files
+have no framer byte and hold Modbus TCP frames.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import struct
+import threading
+import time
+from typing import BinaryIO
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"ZCAP"
+VERSION = 2
+HEADER = struct.Struct("<4sBdB")
+_HEADER_V1 = struct.Struct("<4sBd")
+RECORD = struct.Struct("<BdH")
+
+# Framing of the captured bytes: MBAP (Modbus TCP) or RTU (serial, RTU over TCP).
+FRAMER_SOCKET = 0
+FRAMER_RTU = 1
+FRAMERS = (FRAMER_SOCKET, FRAMER_RTU)
+
+_SENT = 0
+_RECEIVED = 1
+# MBAP header: transaction id, protocol id, length, unit id.
+_MBAP = struct.Struct(">HHHB")
+# Exception code returned for requests that never occur in the capture.
+_ILLEGAL_DATA_ADDRESS = 0x02
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureRecord:
+    """One captured packet."""
+
+    offset: float
+    sending: bool
+    data: bytes
+
+
+@dataclass(frozen=True, slots=True)
+class Exchange:
+    """A captured request with its response, None if it timed out."""
+
+    request: bytes
+    response: bytes | None
+    delay: float
+
+
+class CaptureWriter:
+    """Append packets to a capture file; safe to call from any thread."""
+
+    def __init__(self, path: Path, framer: int = FRAMER_SOCKET) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._handle: BinaryIO = path.open("wb")
+        self._handle.write(HEADER.pack(MAGIC, VERSION, time.time(), framer))
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, sending: bool, data: bytes) -> None:
+        """Write one packet stamped with the time since the capture started."""
+        with self._lock:
+            if self._handle.closed:
+                return
+            self._handle.write(RECORD.pack(_SENT if sending else _RECEIVED, time.monotonic() - self._started, len(data)))
+            self._handle.write(data)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            self._handle.close()
+
+
+def read_capture(path: Path) -> tuple[float, int, list[CaptureRecord]]:
+    """Return the wall-clock start, the framer and all records of a capture file."""
+    data = path.read_bytes()
+    if len(data) < _HEADER_V1.size:
+        raise ValueError(f"{path} is not a capture file")
+    magic, version, started = _HEADER_V1.unpack_from(data)
+    if magic != MAGIC or version not in (1, VERSION) or (version == VERSION and len(data) < HEADER.size):
+        raise ValueError(f"{path} is not a version 1 or {VERSION} capture file")
+    if version == 1:
+        framer, position = FRAMER_SOCKET, _HEADER_V1.size
+    else:
+        framer, position = HEADER.unpack_from(data)[3], HEADER.size
+    if framer not in FRAMERS:
+        raise ValueError(f"{path} uses unknown framer {framer}")
+    records: list[CaptureRecord] = []
+    while position + RECORD.size <= len(data):
+        direction, offset, length = RECORD.unpack_from(data, position)
+        position += RECORD.size
+        records.append(CaptureRecord(offset, direction == _SENT, data[position : position + length]))
+        position += length
+    return started, framer, records
+
+
+def pair_exchanges(records: Iterable[CaptureRecord], framer: int = FRAMER_SOCKET) -> list[Exchange]:
+    """Pair each sent frame with its response.
+
+    pymodbus reports the accumulated receive buffer, so the last matching
+    receive holds the complete response frame. Modbus TCP responses are
+    matched by transaction id: pipelined polls have several requests
+    outstanding, so the response to a request is not necessarily the next
+    thing received. RTU frames have no transaction id and only one request is
+    outstanding, so a receive belongs to the last request sent if unit and
+    function (exception bit aside) agree.
+    """
+    rtu = framer == FRAMER_RTU
+    requests: list[CaptureRecord] = []
+    responses: list[CaptureRecord | None] = []
+    outstanding: dict[bytes, int] = {}
+    for record in records:
+        key = record.data[:2]
+        if rtu and not record.sending and len(key) == 2:
+            key = bytes((key[0], key[1] & 0x7F))
+        if record.sending:
+            if rtu:
+                outstanding.clear()
+            outstanding[key] = len(requests)
+            requests.append(record)
+            responses.append(None)
+        elif (index := outstanding.get(key)) is not None:
+            responses[index] = record
+    return [
+        Exchange(request.data, None, 0.0)
+        if response is None
+        else Exchange(request.data, _first_frame(response.data, rtu), response.offset - request.offset)
+        for request, response in zip(requests, responses)
+    ]
+
+
+def _first_frame(data: bytes, rtu: bool) -> bytes:
+    length = _rtu_response_length(data) if rtu else _mbap_frame_length(data)
+    return data if length is None else data[:length]
+
+
+def _mbap_frame_length(data: bytes) -> int | None:
+    if len(data) < _MBAP.size:
+        return None
+    return 6 + _MBAP.unpack_from(data)[2]
+
+
+def _rtu_response_length(data: bytes) -> int | None:
+    if len(data) < 3:
+        return None
+    function = data[1]
+    if function & 0x80:
+        return 5
+    # Reads carry a byte count; write responses echo address and count or value.
+    return 5 + data[2] if function in (0x01, 0x02, 0x03, 0x04) else 8
+
+
+def _rtu_request_length(data: bytes) -> int | None:
+    if len(data) < 2:
+        return None
+    if data[1] in (0x0F, 0x10):
+        # Unit, function, address, count, byte count, values, CRC.
+        return 9 + data[6] if len(data) >= 7 else None
+    return 8
+
+
+class ReplayServer:
+    """Modbus TCP (or RTU over TCP) server answering from a capture.
+
+    Requests are matched on everything but the transaction id. Repeated
+    requests cycle through their captured responses in order, each sent after
+    its captured round trip times ``scale``. Requests already queued are
+    answered concurrently, so pipelined polls see their captured timing.
+    Requests that timed out in the capture get no answer; unknown requests
+    get an exception response.
+    """
+
+    def __init__(self, exchanges: Iterable[Exchange], scale: float = 1.0, framer: int = FRAMER_SOCKET) -> None:
+        self._scale = scale
+        self._rtu = framer == FRAMER_RTU
+        self._responses: dict[bytes, list[Exchange]] = {}
+        for exchange in exchanges:
+            self._responses.setdefault(self._key(exchange.request), []).append(exchange)
+        self._cursor: dict[bytes, int] = {}
+        self.served = 0
+        self.unmatched = 0
+
+    def _key(self, frame: bytes) -> bytes:
+        return frame if self._rtu else frame[2:]
+
+    async def serve(self, host: str, port: int) -> None:
+        """Serve until cancelled."""
+        server = await asyncio.start_server(self._handle_client, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        answers: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                frame = await self._read_request(reader)
+                answer = asyncio.create_task(self._answer(frame, writer))
+                answers.add(answer)
+                answer.add_done_callback(answers.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for answer in answers:
+                answer.cancel()
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> bytes:
+        if self._rtu:
+            frame = await reader.readexactly(7)
+            length = _rtu_request_length(frame)
+            assert length is not None
+            return frame + await reader.readexactly(length - len(frame))
+        header = await reader.readexactly(_MBAP.size)
+        _, _, length, _ = _MBAP.unpack(header)
+        return header + await reader.readexactly(max(length - 1, 0))
+
+    async def _answer(self, frame: bytes, writer: asyncio.StreamWriter) -> None:
+        response = await self._respond(frame)
+        if response is not None and not writer.is_closing():
+            writer.write(response)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def _respond(self, frame: bytes) -> bytes | None:
+        key = self._key(frame)
+        exchanges = self._responses.get(key)
+        if not exchanges:
+            self.unmatched += 1
+            _LOGGER.debug("No captured response for %s", frame.hex())
+            return self._exception(frame)
+        index = self._cursor.get(key, 0)
+        self._cursor[key] = (index + 1) % len(exchanges)
+        exchange = exchanges[index]
+        if exchange.delay > 0 and self._scale > 0:
+            await asyncio.sleep(exchange.delay * self._scale)
+        if exchange.response is None:
+            return None
+        self.served += 1
+        return exchange.response if self._rtu else frame[:2] + exchange.response[2:]
+
+    def _exception(self, frame: bytes) -> bytes:
+        if self._rtu:
+            from .api import crc16
+
+            response = bytes((frame[0], frame[1] | 0x80, _ILLEGAL_DATA_ADDRESS))
+            return response + crc16(response).to_bytes(2, "little")
+        transaction, protocol, _, unit = _MBAP.unpack_from(frame)
+        function = frame[_MBAP.size] if len(frame) > _MBAP.size else 0
+        return _MBAP.pack(transaction, protocol, 3, unit) + bytes((function | 0x80, _ILLEGAL_DATA_ADDRESS))
+
+
+def iter_capture_summary(records: list[CaptureRecord], framer: int = FRAMER_SOCKET) -> Iterator[str]:
+    """Yield human readable statistics about a capture."""
+    exchanges = pair_exchanges(records, framer)
+    answered = [exchange.delay for exchange in exchanges if exchange.response is not None]
+    yield f"{len(exchanges)} requests, {len(exchanges) - len(answered)} unanswered"
+    if answered:
+        answered.sort()
+        yield (
+            f"round trip min {answered[0] * 1000:.1f} ms, "
+            f"median {answered[len(answered) // 2] * 1000:.1f} ms, max {answered[-1] * 1000:.1f} ms"
+        )
+    if records:
+        yield f"span {records[-1].offset:.1f} s"
@@ -0,0 +1,384 @@
+"""Standalone command line collector for Zentec 031 controllers.
+
+Runs without Home Assistant through ``script/zentec031_cli.py``, which
+skips the package ``__init__``: devices from an inventory are polled through
+``ZentecModbusApi`` on worker threads, with at most ``--concurrency`` reads
+in flight, and every decoded state is written as one NDJSON line. Raw
+records can later be decoded in bulk by ``export`` (see ``batch.py``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+import json
+import logging
+import math
+from pathlib import Path
+import sys
+import time
+from typing import Any, TextIO
+
+from .api import ZentecModbusApi
+from .batch import DEFAULT_CHUNK_SIZE, export_raw_records
+from .capture import ReplayServer, iter_capture_summary, pair_exchanges, read_capture
+from .const import (
+    CONF_LEAN_TRANSPORT,
+    CONF_PIPELINE_WINDOW,
+    CONF_READ_ONLY,
+    CONF_SLAVE_ID,
+    CONF_SUPPLY_TEMP_DIVISOR,
+    CONF_TEMPERATURE_DIVISOR,
+    CONF_TRANSPORT,
+    DEFAULT_PORT,
+    DEFAULT_SLAVE_ID,
+    DEFAULT_TRANSPORT,
+    TRANSPORTS,
+)
+from .inventory import parse_inventory, read_inventory
+from .runtime_config import build_runtime_config
+
+_COMMANDS = ("poll", "export", "replay", "startup", "-h", "--help")
+_PERCENTILES = (50, 90, 99)
+
+
+@dataclass(slots=True)
+class Device:
+    """One controller from the inventory."""
+
+    name: str
+    host: str
+    port: int
+    config: dict[str, Any]
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def load_inventory(path: str, slave_id: int, transport: str = DEFAULT_TRANSPORT) -> list[Device]:
+    """Read devices from a CSV file with a header row.
+
+    ``host`` is required (the device path for serial links); ``port``,
+    ``slave_id``, ``transport`` and ``name`` are optional and any other
+    column named like a config key (for example ``supply_temp_register`` or
+    ``baudrate``) overrides that setting for the row.
+    """
+    if path == "-":
+        with _stdin() as handle:
+            rows = parse_inventory(handle, path)
+    else:
+        rows = read_inventory(path)
+    devices: list[Device] = []
+    for _, values in rows:
+        values.setdefault(CONF_SLAVE_ID, str(slave_id))
+        values.setdefault(CONF_TRANSPORT, transport)
+        devices.append(_device(values))
+    return devices
+
+
+def _device(values: dict[str, str]) -> Device:
+    host = values["host"]
+    port = int(values.get("port", DEFAULT_PORT))
+    config = build_runtime_config(values, {})
+    # Reads only; never let a collector write to a controller.
+    config[CONF_READ_ONLY] = True
+    name = values.get("name") or f"{host}:{port}/{config[CONF_SLAVE_ID]}"
+    return Device(name=name, host=host, port=port, config=config)
+
+
+def _stdin() -> TextIO:
+    return open(sys.stdin.fileno(), newline="", encoding="utf-8", closefd=False)
+
+
+def _host_device(target: str, slave_id: int, transport: str) -> Device:
+    host, _, port = target.partition(":")
+    values = {"host": host, CONF_SLAVE_ID: str(slave_id), CONF_TRANSPORT: transport}
+    if port:
+        values["port"] = port
+    return _device(values)
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted ``values``."""
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class Collector:
+    """Poll devices concurrently and emit NDJSON records."""
+
+    def __init__(self, devices: list[Device], args: argparse.Namespace) -> None:
+        self._devices = devices
+        self._args = args
+        self._semaphore = asyncio.Semaphore(args.concurrency)
+        self._outputs: dict[str, TextIO] = {}
+
+    async def run(self) -> None:
+        """Poll every device ``--count`` times, or forever when it is 0."""
+        try:
+            await asyncio.gather(*(self._poll_device(device) for device in self._devices))
+        finally:
+            for handle in self._outputs.values():
+                handle.close()
+
+    async def _poll_device(self, device: Device) -> None:
+        api = ZentecModbusApi(
+            host=device.host,
+            port=device.port,
+            config=device.config,
+            timeout=self._args.timeout,
+            retries=self._args.retries,
+        )
+        if self._args.capture:
+            target = Path(self._args.capture)
+            await asyncio.to_thread(
+                api.start_capture, target / f"{_safe_name(device.name)}.zcap" if target.is_dir() else target
+            )
+        next_poll = time.monotonic()
+        polls = 0
+        try:
+            while not self._args.count or polls < self._args.count:
+                async with self._semaphore:
+                    started = time.perf_counter()
+                    registers = await asyncio.to_thread(api.read_raw)
+                    latency = time.perf_counter() - started
+                polls += 1
+                ok = any(value is not None for value in registers.values())
+                if ok:
+                    device.latencies.append(latency)
+                else:
+                    device.errors += 1
+                if not self._args.bench:
+                    self._emit(device, self._values(api, device, registers, latency, ok))
+                if self._args.count and polls >= self._args.count:
+                    break
+                next_poll += self._args.interval
+                await asyncio.sleep(max(next_poll - time.monotonic(), 0))
+        finally:
+            await asyncio.to_thread(api.close)
+
+    def _values(
+        self, api: ZentecModbusApi, device: Device, registers: dict[str, int | None], latency: float, ok: bool
+    ) -> dict[str, Any]:
+        values: dict[str, Any] = {"latency": round(latency, 4), "ok": ok}
+        if self._args.raw:
+            values[CONF_TEMPERATURE_DIVISOR] = device.config[CONF_TEMPERATURE_DIVISOR]
+            values[CONF_SUPPLY_TEMP_DIVISOR] = device.config[CONF_SUPPLY_TEMP_DIVISOR]
+            values["registers"] = registers
+        else:
+            values.update(asdict(api.decode(registers)))
+        return values
+
+    def _emit(self, device: Device, values: dict[str, Any]) -> None:
+        record = {
+            "time": datetime.now(UTC).isoformat(timespec="milliseconds"),
+            "device": device.name,
+            "host": device.host,
+            "port": device.port,
+            CONF_SLAVE_ID: device.config[CONF_SLAVE_ID],
+            **values,
+        }
+        handle = self._output(device)
+        handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        handle.flush()
+
+    def _output(self, device: Device) -> TextIO:
+        if self._args.output == "-":
+            return sys.stdout
+        target = Path(self._args.output)
+        key = device.name if target.is_dir() else str(target)
+        if key not in self._outputs:
+            path = target / f"{_safe_name(device.name)}.ndjson" if target.is_dir() else target
+            self._outputs[key] = path.open("a", encoding="utf-8")
+        return self._outputs[key]
+
+
+def _safe_name(name: str) -> str:
+    return "".join(char if char.isalnum() or char in "-_." else "_" for char in name)
+
+
+def print_bench(devices: list[Device], stream: TextIO) -> None:
+    """Print per-device read latency percentiles in milliseconds."""
+    width = max((len(device.name) for device in devices), default=6)
+    headers = ["polls", "errors", *(f"p{value}" for value in _PERCENTILES), "max"]
+    stream.write(f"{'device':<{width}}" + "".join(f"{header:>9}" for header in headers) + "\n")
+    for device in devices:
+        latencies = sorted(device.latencies)
+        cells = [str(len(latencies) + device.errors), str(device.errors)]
+        if latencies:
+            cells += [f"{percentile(latencies, value) * 1000:.1f}" for value in _PERCENTILES]
+            cells.append(f"{latencies[-1] * 1000:.1f}")
+        else:
+            cells += ["-"] * (len(_PERCENTILES) + 1)
+        stream.write(f"{device.name:<{width}}" + "".join(f"{cell:>9}" for cell in cells) + "\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of ``script/zentec031_cli.py``."""
+    parser = argparse.ArgumentParser(prog="zentec031_cli.py", description="Zentec 031 tools outside Home Assistant.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    poll = commands.add_parser("poll", help="poll controllers over Modbus TCP (default)")
+    source = poll.add_mutually_exclusive_group(required=True)
+    source.add_argument("-i", "--inventory", help="CSV inventory with a host column ('-' for stdin)")
+    source.add_argument("--host", action="append", metavar="HOST[:PORT]", help="controller address, repeatable")
+    poll.add_argument("--slave-id", type=int, default=DEFAULT_SLAVE_ID, help="default Slave ID")
+    poll.add_argument("--transport", choices=TRANSPORTS, default=DEFAULT_TRANSPORT, help="default transport")
+    poll.add_argument(
+        "--pipeline-window", type=int, default=1, help="Modbus TCP reads in flight per device, 1 = one at a time"
+    )
+    poll.add_argument("--lean", action="store_true", help="poll Modbus TCP with pre-encoded requests instead of pymodbus")
+    poll.add_argument("-o", "--output", default="-", help="'-' for stdout, a file, or a directory for one file per device")
+    poll.add_argument("-n", "--count", type=int, help="polls per device, 0 to run until interrupted")
+    poll.add_argument("--interval", type=float, help="seconds between polls of one device")
+    poll.add_argument("-c", "--concurrency", type=int, default=8, help="maximum reads in flight")
+    poll.add_argument("--timeout", type=float, default=3, help="per-request timeout in seconds")
+    poll.add_argument("--retries", type=int, default=0, help="retries per request")
+    poll.add_argument("--raw", action="store_true", help="record undecoded register values for batch export")
+    poll.add_argument("--bench", action="store_true", help="print latency percentiles instead of records")
+    poll.add_argument("--capture", help="record Modbus traffic to a file, or a directory for one file per device")
+    poll.add_argument("-v", "--verbose", action="store_true", help="show pymodbus connection errors")
+
+    export = commands.add_parser("export", help="decode --raw records into CSV or Parquet (needs NumPy)")
+    export.add_argument("inputs", nargs="+", help="NDJSON files written by poll --raw ('-' for stdin)")
+    export.add_argument("-o", "--output", required=True, help="output file, Parquet if it ends in .parquet, else CSV")
+    export.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="records decoded per batch")
+
+    replay = commands.add_parser("replay", help="serve a traffic capture as a Modbus TCP server")
+    replay.add_argument("capture", help="capture file written by poll --capture or the start_capture service")
+    replay.add_argument("--listen", default="127.0.0.1", help="address to listen on")
+    replay.add_argument("--port", type=int, default=5020, help="TCP port to listen on")
+    replay.add_argument("--scale", type=float, default=1.0, help="response delay factor, 1 = original timing, 0 = none")
+
+    startup = commands.add_parser("startup", help="time integration imports and entry setup, check lazy imports")
+    startup.add_argument("--runs", type=int, default=5, help="fresh interpreters per module")
+    startup.add_argument("--entries", type=int, default=50, help="entry setups to time")
+    startup.add_argument("--max-import-ms", type=float, help="fail if a median import takes longer")
+    startup.add_argument("--max-setup-ms", type=float, help="fail if the mean entry setup takes longer")
+    return parser
+
+
+async def _async_main(devices: list[Device], args: argparse.Namespace) -> None:
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=args.concurrency))
+    await Collector(devices, args).run()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the requested command and return the process exit code."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in _COMMANDS:
+        argv.insert(0, "poll")
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        return _export(parser, args)
+    if args.command == "replay":
+        return _replay(parser, args)
+    if args.command == "startup":
+        return _startup(parser, args)
+    return _poll(parser, args)
+
+
+def _poll(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if args.count is None:
+        args.count = 100 if args.bench else 1
+    if args.interval is None:
+        args.interval = 0 if args.bench else 10
+    if args.concurrency < 1 or args.count < 0 or args.interval < 0:
+        parser.error("--concurrency must be positive, --count and --interval not negative")
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    if not args.verbose:
+        # Failed devices already show up as "ok": false / errors.
+        logging.getLogger("pymodbus").setLevel(logging.CRITICAL)
+
+    try:
+        if args.inventory:
+            devices = load_inventory(args.inventory, args.slave_id, args.transport)
+        else:
+            devices = [_host_device(target, args.slave_id, args.transport) for target in args.host]
+    except (OSError, ValueError) as err:
+        parser.error(str(err))
+    if not devices:
+        parser.error("inventory is empty")
+    for device in devices:
+        device.config[CONF_PIPELINE_WINDOW] = args.pipeline_window
+        device.config[CONF_LEAN_TRANSPORT] = args.lean
+
+    interrupted = False
+    try:
+        asyncio.run(_async_main(devices, args))
+    except KeyboardInterrupt:
+        interrupted = True
+    if args.bench:
+        print_bench(devices, sys.stdout)
+    return 130 if interrupted else 0
+
+
+def _export(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        sources = [
+            _stdin() if name == "-" else stack.enter_context(open(name, encoding="utf-8"))
+            for name in args.inputs
+        ]
+        try:
+            rows = export_raw_records(sources, Path(args.output), args.chunk_size)
+        except (KeyError, RuntimeError, ValueError) as err:
+            parser.error(str(err))
+    sys.stderr.write(f"{rows} records exported in {time.perf_counter() - started:.2f} s\n")
+    return 0
+
+
+def _replay(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if args.scale < 0:
+        parser.error("--scale must not be negative")
+    try:
+        _, framer, records = read_capture(Path(args.capture))
+    except (OSError, ValueError) as err:
+        parser.error(str(err))
+    for line in iter_capture_summary(records, framer):
+        sys.stderr.write(line + "\n")
+    server = ReplayServer(pair_exchanges(records, framer), args.scale, framer)
+    sys.stderr.write(f"Replaying on {args.listen}:{args.port}, Ctrl+C to stop\n")
+    try:
+        asyncio.run(server.serve(args.listen, args.port))
+    except KeyboardInterrupt:
+        pass
+    sys.stderr.write(f"{server.served} responses served, {server.unmatched} unmatched requests\n")
+    return 0
+
+
+def _startup(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    # Imported here: the benchmark spawns interpreters and is rarely needed.
+    from .benchmark import measure_imports, measure_setup
+
+    if args.runs < 1 or args.entries < 2:
+        parser.error("--runs must be positive and --entries at least 2")
+    failed = False
+    for result in measure_imports(args.runs):
+        if result.skipped:
+            sys.stdout.write(f"{result.module:<24} skipped, Home Assistant not installed\n")
+            continue
+        line = f"{result.module:<24} {result.median * 1000:8.1f} ms"
+        if result.eager:
+            line += f"  FAIL imports {', '.join(result.eager)} eagerly"
+            failed = True
+        elif args.max_import_ms is not None and result.median * 1000 > args.max_import_ms:
+            line += f"  FAIL > {args.max_import_ms:g} ms"
+            failed = True
+        sys.stdout.write(line + "\n")
+
+    first, mean = measure_setup(args.entries)
+    line = f"{'entry setup':<24} {mean * 1000:8.3f} ms (first {first * 1000:.1f} ms incl. pymodbus)"
+    if args.max_setup_ms is not None and mean * 1000 > args.max_setup_ms:
+        line += f"  FAIL > {args.max_setup_ms:g} ms"
+        failed = True
+    sys.stdout.write(line + "\n")
+    return 1 if failed else 0
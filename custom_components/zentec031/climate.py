@@ -17,9 +17,13 @@ from .const import (
     CONF_MAX_FAN_SPEED,
     CONF_MODE_HEAT_VALUE,
     CONF_MODE_VENT_VALUE,
-    DEFAULT_MAX_FAN_SPEED,
     DEFAULT_MODE_HEAT_VALUE,
     DEFAULT_MODE_VENT_VALUE,
+    REG_FAN_SPEED,
+    REG_MODE,
+    REG_POWER,
+    REG_SUPPLY_TEMP,
+    REG_TARGET_TEMP,
 )
 from .entity import ZentecEntity
 
@@ -37,6 +41,7 @@ class ZentecClimate(ZentecEntity, ClimateEntity):
     """Main climate controller entity."""
 
     _attr_name = "Climate"
+    _register_keys = (REG_POWER, REG_MODE, REG_FAN_SPEED, REG_TARGET_TEMP, REG_SUPPLY_TEMP)
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
         | ClimateEntityFeature.FAN_MODE
@@ -49,19 +54,22 @@ class ZentecClimate(ZentecEntity, ClimateEntity):
 
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator, entry)
-        self._heat_mode_value = int(
-            entry.options.get(CONF_MODE_HEAT_VALUE, entry.data.get(CONF_MODE_HEAT_VALUE, DEFAULT_MODE_HEAT_VALUE))
-        )
-        self._vent_mode_value = int(
-            entry.options.get(CONF_MODE_VENT_VALUE, entry.data.get(CONF_MODE_VENT_VALUE, DEFAULT_MODE_VENT_VALUE))
-        )
-        self._max_speed = int(entry.options.get(CONF_MAX_FAN_SPEED, entry.data.get(CONF_MAX_FAN_SPEED, DEFAULT_MAX_FAN_SPEED)))
+        self._max_speed = int(coordinator.api.config[CONF_MAX_FAN_SPEED])
         self._attr_fan_modes = [str(speed) for speed in range(1, self._max_speed + 1)]
 
     @property
     def unique_id(self) -> str:
         return f"{self._entry.entry_id}_climate"
 
+    @property
+    def _heat_mode_value(self) -> int:
+        # Read live so mode value options apply without recreating the entity.
+        return int(self.coordinator.api.config.get(CONF_MODE_HEAT_VALUE, DEFAULT_MODE_HEAT_VALUE))
+
+    @property
+    def _vent_mode_value(self) -> int:
+        return int(self.coordinator.api.config.get(CONF_MODE_VENT_VALUE, DEFAULT_MODE_VENT_VALUE))
+
     @property
     def current_temperature(self) -> float | None:
         return self.coordinator.data.supply_temp if self.coordinator.data else None
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
-from pymodbus.client import ModbusTcpClient
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
 from homeassistant.core import callback
-from homeassistant.helpers import selector
+from homeassistant.helpers import config_validation as cv, selector
 
+from .api import ProbeResult, ZentecModbusApi
 from .const import (
+    BAUDRATES,
     CONF_ALARM_REGISTER,
+    CONF_BAUDRATE,
+    CONF_CLOCK_DRIFT_THRESHOLD,
+    CONF_LEAN_TRANSPORT,
+    CONF_METRICS_EXPORT,
+    CONF_PIPELINE_WINDOW,
+    CONF_WRITE_FRESHNESS,
+    CONF_CLOCK_SYNC_INTERVAL,
     CONF_FAN_SPEED_REGISTER,
     CONF_MAX_HEAT_TEMP_REGISTER,
     CONF_MAX_FAN_SPEED,
@@ -21,38 +30,104 @@ from .const import (
     CONF_MODE_HEAT_VALUE,
     CONF_MODE_REGISTER,
     CONF_MODE_VENT_VALUE,
+    CONF_OUTDOOR_TEMP_DEADBAND,
+    CONF_OUTDOOR_TEMP_MAX_SILENCE,
+    CONF_OUTDOOR_TEMP_MIN_INTERVAL,
     CONF_OUTDOOR_TEMP_REGISTER,
+    CONF_PARITY,
     CONF_POWER_REGISTER,
     CONF_READ_ONLY,
+    CONF_SAMPLE_INTERVAL,
     CONF_SCAN_INTERVAL,
     CONF_SLAVE_ID,
+    CONF_STOPBITS,
+    CONF_SUPPLY_TEMP_DEADBAND,
     CONF_SUPPLY_TEMP_DIVISOR,
+    CONF_SUPPLY_TEMP_MAX_SILENCE,
+    CONF_SUPPLY_TEMP_MIN_INTERVAL,
     CONF_SUPPLY_TEMP_REGISTER,
     CONF_TARGET_TEMP_REGISTER,
     CONF_TEMPERATURE_DIVISOR,
+    CONF_TRANSPORT,
     DEFAULT_ALARM_REGISTER,
+    DEFAULT_BAUDRATE,
+    DEFAULT_CLOCK_DRIFT_THRESHOLD,
+    DEFAULT_LEAN_TRANSPORT,
+    DEFAULT_METRICS_EXPORT,
+    DEFAULT_PIPELINE_WINDOW,
+    DEFAULT_WRITE_FRESHNESS,
+    DEFAULT_CLOCK_SYNC_INTERVAL,
+    DEFAULT_DEADBAND,
     DEFAULT_FAN_SPEED_REGISTER,
     DEFAULT_MAX_HEAT_TEMP_REGISTER,
     DEFAULT_MAX_FAN_SPEED,
+    DEFAULT_MAX_SILENCE,
     DEFAULT_MIN_HEAT_TEMP_REGISTER,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
     DEFAULT_MODE_HEAT_VALUE,
     DEFAULT_MODE_REGISTER,
     DEFAULT_MODE_VENT_VALUE,
     DEFAULT_OUTDOOR_TEMP_REGISTER,
+    DEFAULT_PARITY,
     DEFAULT_PORT,
     DEFAULT_POWER_REGISTER,
     DEFAULT_READ_ONLY,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SLAVE_ID,
+    DEFAULT_STOPBITS,
     DEFAULT_SUPPLY_TEMP_DIVISOR,
     DEFAULT_SUPPLY_TEMP_REGISTER,
     DEFAULT_TARGET_TEMP_REGISTER,
     DEFAULT_TEMPERATURE_DIVISOR,
+    DEFAULT_TRANSPORT,
     DOMAIN,
+    MAX_PIPELINE_WINDOW,
+    PARITIES,
+    PROBE_BUDGET,
+    PROBE_TIMEOUT,
+    TRANSPORT_SERIAL,
+    TRANSPORTS,
 )
 
 CONF_ADVANCED_OPTIONS = "advanced_options"
 
+_REGISTER = vol.All(vol.Coerce(int), vol.Range(min=0, max=65535))
+_DIVISOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=1000))
+_CONNECTION_KEYS = (CONF_NAME, CONF_HOST, CONF_PORT, CONF_TRANSPORT, CONF_BAUDRATE, CONF_PARITY, CONF_STOPBITS)
+
+# One inventory row of the import_inventory service; values arrive as strings
+# and columns that are not entry keys (notes, asset numbers) are dropped.
+IMPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): cv.string,
+        vol.Optional(CONF_NAME): cv.string,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+        vol.Optional(CONF_TRANSPORT, default=DEFAULT_TRANSPORT): vol.In(TRANSPORTS),
+        vol.Optional(CONF_BAUDRATE): vol.All(vol.Coerce(int), vol.In(BAUDRATES)),
+        vol.Optional(CONF_PARITY): vol.In(PARITIES),
+        vol.Optional(CONF_STOPBITS): vol.All(vol.Coerce(int), vol.In((1, 2))),
+        vol.Optional(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(vol.Coerce(int), vol.Range(min=0, max=247)),
+        vol.Optional(CONF_SCAN_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+        vol.Optional(CONF_POWER_REGISTER): _REGISTER,
+        vol.Optional(CONF_MODE_REGISTER): _REGISTER,
+        vol.Optional(CONF_MODE_HEAT_VALUE): _REGISTER,
+        vol.Optional(CONF_MODE_VENT_VALUE): _REGISTER,
+        vol.Optional(CONF_FAN_SPEED_REGISTER): _REGISTER,
+        vol.Optional(CONF_TARGET_TEMP_REGISTER): _REGISTER,
+        vol.Optional(CONF_MIN_HEAT_TEMP_REGISTER): _REGISTER,
+        vol.Optional(CONF_MAX_HEAT_TEMP_REGISTER): _REGISTER,
+        vol.Optional(CONF_SUPPLY_TEMP_REGISTER): _REGISTER,
+        vol.Optional(CONF_SUPPLY_TEMP_DIVISOR): _DIVISOR,
+        vol.Optional(CONF_OUTDOOR_TEMP_REGISTER): _REGISTER,
+        vol.Optional(CONF_ALARM_REGISTER): _REGISTER,
+        vol.Optional(CONF_TEMPERATURE_DIVISOR): _DIVISOR,
+        vol.Optional(CONF_MAX_FAN_SPEED): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+        vol.Optional(CONF_READ_ONLY): cv.boolean,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
 
 class ZentecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Zentec 031."""
@@ -61,45 +136,103 @@ class ZentecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         self._user_input: dict[str, Any] = {}
+        self._advanced: dict[str, Any] = {}
+        self._show_advanced = False
+        self._probe: ProbeResult | None = None
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            is_ok = await self.hass.async_add_executor_job(
-                _can_connect,
-                user_input[CONF_HOST],
-                int(user_input[CONF_PORT]),
-            )
-            if not is_ok:
-                errors["base"] = "cannot_connect"
-            else:
-                self._user_input = {
-                    CONF_NAME: user_input[CONF_NAME],
-                    CONF_HOST: user_input[CONF_HOST],
-                    CONF_PORT: int(user_input[CONF_PORT]),
-                }
-                if bool(user_input.get(CONF_ADVANCED_OPTIONS)):
-                    return await self.async_step_advanced()
-                return await self._async_create_final_entry({})
+            self._user_input = {
+                CONF_NAME: user_input[CONF_NAME],
+                CONF_HOST: user_input[CONF_HOST],
+                CONF_PORT: int(user_input[CONF_PORT]),
+                CONF_TRANSPORT: user_input[CONF_TRANSPORT],
+            }
+            self._show_advanced = bool(user_input.get(CONF_ADVANCED_OPTIONS))
+            if user_input[CONF_TRANSPORT] == TRANSPORT_SERIAL:
+                return await self.async_step_serial()
+            if (result := await self._async_probe_connection(errors)) is not None:
+                return result
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_NAME, default="Zentec 031"): str,
+                    vol.Required(CONF_TRANSPORT, default=DEFAULT_TRANSPORT): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=list(TRANSPORTS), translation_key=CONF_TRANSPORT)
+                    ),
                     vol.Required(CONF_HOST): str,
                     vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
                     vol.Optional(CONF_ADVANCED_OPTIONS, default=False): bool,
                 }
             ),
             errors=errors,
+            description_placeholders=self._probe_placeholders(),
+        )
+
+    async def async_step_serial(self, user_input: dict[str, Any] | None = None):
+        """Ask for the line settings of a serial RTU link."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            self._user_input.update(
+                {
+                    CONF_BAUDRATE: int(user_input[CONF_BAUDRATE]),
+                    CONF_PARITY: user_input[CONF_PARITY],
+                    CONF_STOPBITS: int(user_input[CONF_STOPBITS]),
+                }
+            )
+            if (result := await self._async_probe_connection(errors)) is not None:
+                return result
+
+        return self.async_show_form(
+            step_id="serial",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_BAUDRATE, default=str(DEFAULT_BAUDRATE)): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=[str(baudrate) for baudrate in BAUDRATES])
+                    ),
+                    vol.Required(CONF_PARITY, default=DEFAULT_PARITY): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=list(PARITIES), translation_key=CONF_PARITY)
+                    ),
+                    vol.Required(CONF_STOPBITS, default=str(DEFAULT_STOPBITS)): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=["1", "2"])
+                    ),
+                }
+            ),
+            errors=errors,
+            description_placeholders=self._probe_placeholders(),
         )
 
+    async def _async_probe_connection(self, errors: dict[str, str]) -> config_entries.ConfigFlowResult | None:
+        """Probe the connection settings and move on, or fill ``errors`` and return None."""
+        error = await self._async_probe(self._build_entry_data({}))
+        # The slave ID and register map are entered on the advanced step,
+        # so at this point only the connection itself has to work there.
+        if error == "cannot_connect" or (error is not None and not self._show_advanced):
+            errors["base"] = error
+            return None
+        if self._show_advanced:
+            return await self.async_step_advanced()
+        assert self._probe is not None
+        self._advanced = {CONF_SCAN_INTERVAL: self._probe.recommended_scan_interval}
+        return await self.async_step_probe()
+
     async def async_step_advanced(self, user_input: dict[str, Any] | None = None):
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return await self._async_create_final_entry(user_input)
+            error = await self._async_probe(self._build_entry_data(user_input))
+            if error is not None:
+                errors["base"] = error
+            else:
+                self._advanced = user_input
+                return await self.async_step_probe()
 
+        recommended_interval = self._probe.recommended_scan_interval if self._probe else DEFAULT_SCAN_INTERVAL
         return self.async_show_form(
             step_id="advanced",
             data_schema=vol.Schema(
@@ -112,7 +245,7 @@ class ZentecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             mode=selector.NumberSelectorMode.BOX,
                         )
                     ),
-                    vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(CONF_SCAN_INTERVAL, default=recommended_interval): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
                     vol.Required(CONF_POWER_REGISTER, default=DEFAULT_POWER_REGISTER): vol.All(
                         vol.Coerce(int), vol.Range(min=0, max=65535)
                     ),
@@ -163,13 +296,101 @@ class ZentecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_READ_ONLY, default=DEFAULT_READ_ONLY): bool,
                 }
             ),
+            errors=errors,
+            description_placeholders=self._probe_placeholders(),
+        )
+
+    async def async_step_probe(self, user_input: dict[str, Any] | None = None):
+        """Show what the probe read before creating the entry."""
+        if user_input is not None:
+            return await self._async_create_final_entry(self._advanced)
+
+        return self.async_show_form(
+            step_id="probe",
+            data_schema=vol.Schema({}),
+            description_placeholders=self._probe_placeholders(),
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> config_entries.ConfigFlowResult:
+        """Probe one inventory row and create its entry without any form.
+
+        Started by the import_inventory service for every row; aborts with
+        the same error keys as the user steps.
+        """
+        try:
+            advanced = IMPORT_SCHEMA(import_data)
+        except vol.Invalid as err:
+            return self.async_abort(reason="invalid_row", description_placeholders={"error": str(err)})
+        self._user_input = {key: advanced.pop(key) for key in _CONNECTION_KEYS if key in advanced}
+        self._user_input.setdefault(
+            CONF_NAME, f"Zentec 031 {self._user_input[CONF_HOST]}:{self._user_input[CONF_PORT]}/{advanced[CONF_SLAVE_ID]}"
         )
+        data = self._build_entry_data(advanced)
+        # Skip the probe for rows that are already set up or being imported.
+        await self.async_set_unique_id(f"{data[CONF_HOST]}:{data[CONF_PORT]}:{data[CONF_SLAVE_ID]}")
+        self._abort_if_unique_id_configured()
+        if (error := await self._async_probe(data)) is not None:
+            return self.async_abort(reason=error, description_placeholders=self._probe_placeholders())
+        assert self._probe is not None
+        advanced.setdefault(CONF_SCAN_INTERVAL, self._probe.recommended_scan_interval)
+        return await self._async_create_final_entry(advanced)
+
+    async def _async_probe(self, data: dict[str, Any]) -> str | None:
+        """Read the register map once; return an error key or None on success."""
+        api = await self.hass.async_add_import_executor_job(
+            partial(ZentecModbusApi, data[CONF_HOST], data[CONF_PORT], data, timeout=PROBE_TIMEOUT, retries=0)
+        )
+        try:
+            # The probe keeps to its budget itself; cancelling cannot stop the executor thread.
+            self._probe = await self.hass.async_add_executor_job(api.probe, PROBE_BUDGET)
+        except ConnectionError:
+            return "cannot_connect"
+        finally:
+            await self.hass.async_add_executor_job(api.close)
+
+        if len(self._probe.failed_addresses) == self._probe.requests:
+            return "no_response"
+        if self._probe.failed_addresses:
+            return "read_failed"
+        return None
+
+    def _probe_placeholders(self) -> dict[str, str]:
+        if self._probe is None:
+            return {}
+        state = self._probe.state
+
+        def _fmt(value: Any) -> str:
+            return "-" if value is None else str(value)
+
+        return {
+            "supply_temp": _fmt(state.supply_temp),
+            "outdoor_temp": _fmt(state.outdoor_temp),
+            "target_temp": _fmt(state.target_temp),
+            "fan_speed": _fmt(state.fan_speed),
+            "power": _fmt(state.power_raw),
+            "mode": _fmt(state.mode_raw),
+            "alarm": _fmt(state.alarm_code),
+            "round_trip": f"{self._probe.round_trip * 1000:.0f}",
+            "requests": str(self._probe.requests),
+            "scan_interval": str(self._advanced.get(CONF_SCAN_INTERVAL, self._probe.recommended_scan_interval)),
+            "failed": ", ".join(str(address) for address in self._probe.failed_addresses),
+        }
 
     async def _async_create_final_entry(self, advanced: dict[str, Any]) -> config_entries.ConfigFlowResult:
-        data = {
+        data = self._build_entry_data(advanced)
+        await self.async_set_unique_id(f"{data[CONF_HOST]}:{data[CONF_PORT]}:{data[CONF_SLAVE_ID]}")
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=data[CONF_NAME], data=data)
+
+    def _build_entry_data(self, advanced: dict[str, Any]) -> dict[str, Any]:
+        return {
             CONF_NAME: self._user_input[CONF_NAME],
             CONF_HOST: self._user_input[CONF_HOST],
             CONF_PORT: int(self._user_input[CONF_PORT]),
+            CONF_TRANSPORT: self._user_input.get(CONF_TRANSPORT, DEFAULT_TRANSPORT),
+            CONF_BAUDRATE: int(self._user_input.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)),
+            CONF_PARITY: self._user_input.get(CONF_PARITY, DEFAULT_PARITY),
+            CONF_STOPBITS: int(self._user_input.get(CONF_STOPBITS, DEFAULT_STOPBITS)),
             CONF_SLAVE_ID: int(advanced.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID)),
             CONF_SCAN_INTERVAL: int(advanced.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
             CONF_POWER_REGISTER: int(advanced.get(CONF_POWER_REGISTER, DEFAULT_POWER_REGISTER)),
@@ -189,10 +410,6 @@ class ZentecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_READ_ONLY: bool(advanced.get(CONF_READ_ONLY, DEFAULT_READ_ONLY)),
         }
 
-        await self.async_set_unique_id(f"{data[CONF_HOST]}:{data[CONF_PORT]}:{data[CONF_SLAVE_ID]}")
-        self._abort_if_unique_id_configured()
-        return self.async_create_entry(title=data[CONF_NAME], data=data)
-
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -319,14 +536,58 @@ class ZentecOptionsFlow(config_entries.OptionsFlow):
                         CONF_READ_ONLY,
                         default=bool(options.get(CONF_READ_ONLY, data.get(CONF_READ_ONLY, DEFAULT_READ_ONLY))),
                     ): bool,
+                    vol.Required(
+                        CONF_SUPPLY_TEMP_DEADBAND,
+                        default=float(options.get(CONF_SUPPLY_TEMP_DEADBAND, DEFAULT_DEADBAND)),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                    vol.Required(
+                        CONF_SUPPLY_TEMP_MIN_INTERVAL,
+                        default=int(options.get(CONF_SUPPLY_TEMP_MIN_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Required(
+                        CONF_SUPPLY_TEMP_MAX_SILENCE,
+                        default=int(options.get(CONF_SUPPLY_TEMP_MAX_SILENCE, DEFAULT_MAX_SILENCE)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Required(
+                        CONF_OUTDOOR_TEMP_DEADBAND,
+                        default=float(options.get(CONF_OUTDOOR_TEMP_DEADBAND, DEFAULT_DEADBAND)),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                    vol.Required(
+                        CONF_OUTDOOR_TEMP_MIN_INTERVAL,
+                        default=int(options.get(CONF_OUTDOOR_TEMP_MIN_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Required(
+                        CONF_OUTDOOR_TEMP_MAX_SILENCE,
+                        default=int(options.get(CONF_OUTDOOR_TEMP_MAX_SILENCE, DEFAULT_MAX_SILENCE)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Required(
+                        CONF_SAMPLE_INTERVAL,
+                        default=int(options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
+                    vol.Required(
+                        CONF_CLOCK_SYNC_INTERVAL,
+                        default=int(options.get(CONF_CLOCK_SYNC_INTERVAL, DEFAULT_CLOCK_SYNC_INTERVAL)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=168)),
+                    vol.Required(
+                        CONF_CLOCK_DRIFT_THRESHOLD,
+                        default=int(options.get(CONF_CLOCK_DRIFT_THRESHOLD, DEFAULT_CLOCK_DRIFT_THRESHOLD)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Required(
+                        CONF_LEAN_TRANSPORT,
+                        default=bool(options.get(CONF_LEAN_TRANSPORT, DEFAULT_LEAN_TRANSPORT)),
+                    ): bool,
+                    vol.Required(
+                        CONF_PIPELINE_WINDOW,
+                        default=int(options.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_PIPELINE_WINDOW)),
+                    vol.Required(
+                        CONF_WRITE_FRESHNESS,
+                        default=int(options.get(CONF_WRITE_FRESHNESS, DEFAULT_WRITE_FRESHNESS)),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Required(
+                        CONF_METRICS_EXPORT,
+                        default=bool(options.get(CONF_METRICS_EXPORT, DEFAULT_METRICS_EXPORT)),
+                    ): bool,
                 }
             ),
         )
-
-
-def _can_connect(host: str, port: int) -> bool:
-    client = ModbusTcpClient(host=host, port=port)
-    try:
-        return bool(client.connect())
-    finally:
-        client.close()
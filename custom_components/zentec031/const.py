@@ -7,6 +7,10 @@ from datetime import timedelta
 DOMAIN = "zentec031"
 
 CONF_SLAVE_ID = "slave_id"
+CONF_TRANSPORT = "transport"
+CONF_BAUDRATE = "baudrate"
+CONF_PARITY = "parity"
+CONF_STOPBITS = "stopbits"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_POWER_REGISTER = "power_register"
 CONF_MODE_REGISTER = "mode_register"
@@ -23,8 +27,38 @@ CONF_ALARM_REGISTER = "alarm_register"
 CONF_TEMPERATURE_DIVISOR = "temperature_divisor"
 CONF_MAX_FAN_SPEED = "max_fan_speed"
 CONF_READ_ONLY = "read_only"
+CONF_SUPPLY_TEMP_DEADBAND = "supply_temp_deadband"
+CONF_SUPPLY_TEMP_MIN_INTERVAL = "supply_temp_min_interval"
+CONF_SUPPLY_TEMP_MAX_SILENCE = "supply_temp_max_silence"
+CONF_OUTDOOR_TEMP_DEADBAND = "outdoor_temp_deadband"
+CONF_OUTDOOR_TEMP_MIN_INTERVAL = "outdoor_temp_min_interval"
+CONF_OUTDOOR_TEMP_MAX_SILENCE = "outdoor_temp_max_silence"
+CONF_SAMPLE_INTERVAL = "sample_interval"
+CONF_CLOCK_SYNC_INTERVAL = "clock_sync_interval"
+CONF_CLOCK_DRIFT_THRESHOLD = "clock_drift_threshold"
+CONF_PIPELINE_WINDOW = "pipeline_window"
+CONF_WRITE_FRESHNESS = "write_freshness"
+CONF_LEAN_TRANSPORT = "lean_transport"
+CONF_METRICS_EXPORT = "metrics_export"
 
 DEFAULT_PORT = 502
+
+# Modbus TCP, RTU frames over a TCP serial server, or RTU on a local serial port
+# (the host then holds the device path, e.g. /dev/ttyUSB0).
+TRANSPORT_TCP = "tcp"
+TRANSPORT_RTU_OVER_TCP = "rtu_over_tcp"
+TRANSPORT_SERIAL = "serial"
+TRANSPORTS = (TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP, TRANSPORT_SERIAL)
+DEFAULT_TRANSPORT = TRANSPORT_TCP
+DEFAULT_BAUDRATE = 9600
+DEFAULT_PARITY = "N"
+DEFAULT_STOPBITS = 1
+BAUDRATES = (1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200)
+PARITIES = ("N", "E", "O")
+# Serial response timeout: controller turnaround plus the longest RTU frame
+# (256 bytes) on the wire at the configured baud rate.
+SERIAL_TURNAROUND = 0.5
+SERIAL_MAX_FRAME = 256
 DEFAULT_SLAVE_ID = 0
 DEFAULT_SCAN_INTERVAL = 10
 
@@ -44,10 +78,125 @@ DEFAULT_ALARM_REGISTER = 40004
 DEFAULT_TEMPERATURE_DIVISOR = 1
 DEFAULT_MAX_FAN_SPEED = 7
 DEFAULT_READ_ONLY = False
+# Publish filtering is off by default: every change is written as before.
+DEFAULT_DEADBAND = 0.0
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_MAX_SILENCE = 0
+# High-resolution sampling is off by default.
+DEFAULT_SAMPLE_INTERVAL = 0
+# Periodic clock sync is off by default (hours); correct drift beyond this many seconds.
+DEFAULT_CLOCK_SYNC_INTERVAL = 0
+DEFAULT_CLOCK_DRIFT_THRESHOLD = 30
+# Modbus TCP polls bypass pymodbus with pre-encoded requests; off by default.
+DEFAULT_LEAN_TRANSPORT = False
+# The entry is left out of the OpenMetrics endpoint unless enabled.
+DEFAULT_METRICS_EXPORT = False
+# Read requests kept in flight on Modbus TCP; 1 sends one request at a time.
+DEFAULT_PIPELINE_WINDOW = 1
+MAX_PIPELINE_WINDOW = 16
+# Skip a write if the register was confirmed to hold the value this many seconds ago; 0 always writes.
+DEFAULT_WRITE_FRESHNESS = 30
+
+# Raw samples kept in memory; must exceed one hour so every hour can be aggregated.
+SAMPLE_RETENTION = timedelta(hours=2)
 
 DEFAULT_UPDATE_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
 
-PLATFORMS = ["climate", "number", "sensor"]
+# Setup probe: per-request timeout and overall time budget, seconds.
+PROBE_TIMEOUT = 3
+PROBE_BUDGET = 10
+# Bulk import: inventory rows probed at the same time.
+IMPORT_CONCURRENCY = 8
+MAX_IMPORT_CONCURRENCY = 32
+# Connection supervision: how often an idle connection is checked, after how
+# many idle seconds a one-register probe read is sent and how long it may take.
+CONNECTION_CHECK_INTERVAL = 5
+IDLE_PROBE_AFTER = 60
+IDLE_PROBE_TIMEOUT = 2
+# Gateway circuit breaker: consecutive polls without any answer, across all
+# entries behind one host and port, after which the gateway is taken as down,
+# and the first and longest delay between probes while it is down, seconds.
+GATEWAY_FAILURE_THRESHOLD = 3
+GATEWAY_PROBE_INTERVAL = 15
+GATEWAY_PROBE_MAX_INTERVAL = 300
+# TCP keepalive: first probe after this many idle seconds, then every interval, dead after count misses.
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+# Recommended scan interval keeps the bus busy at most this share of the time.
+TARGET_BUS_UTILIZATION = 0.05
+MIN_SCAN_INTERVAL = 5
+MAX_SCAN_INTERVAL = 3600
+# Poll interval while a live register view is subscribed, seconds. The
+# coordinator schedules refreshes on whole seconds, so this is the floor.
+LIVE_SCAN_INTERVAL = 1
+
+# Logical registers polled by the API. Entities declare which of these they
+# consume so the coordinator only reads what is actually in use.
+REG_POWER = "power"
+REG_MODE = "mode"
+REG_FAN_SPEED = "fan_speed"
+REG_TARGET_TEMP = "target_temp"
+REG_MIN_HEAT_TEMP = "min_heat_temp"
+REG_MAX_HEAT_TEMP = "max_heat_temp"
+REG_SUPPLY_TEMP = "supply_temp"
+REG_OUTDOOR_TEMP = "outdoor_temp"
+REG_ALARM_1 = "alarm_code"
+REG_ALARM_2 = "alarm_code_2"
+REG_ALARM_3 = "alarm_code_3"
+
+ALL_REGISTERS = (
+    REG_POWER,
+    REG_MODE,
+    REG_FAN_SPEED,
+    REG_TARGET_TEMP,
+    REG_MIN_HEAT_TEMP,
+    REG_MAX_HEAT_TEMP,
+    REG_SUPPLY_TEMP,
+    REG_OUTDOOR_TEMP,
+    REG_ALARM_1,
+    REG_ALARM_2,
+    REG_ALARM_3,
+)
+
+# Registers captured by the high-resolution sample buffer, in channel order.
+SAMPLE_REGISTERS = (REG_SUPPLY_TEMP, REG_OUTDOOR_TEMP, REG_FAN_SPEED, REG_POWER)
+
+# Technical registers 65512..65519: year, month, day, weekday, hour, minute,
+# second, time zone, all UInt8: the year counts from 2000, the weekday is ISO
+# (1 = Monday) and the time zone is the UTC offset in whole hours as a signed
+# byte.
+CLOCK_REGISTER = 65512
+CLOCK_REGISTER_COUNT = 8
+
+# Derived metrics are checkpointed at most this often, not on every poll.
+METRICS_SAVE_DELAY = 300
+METRICS_STORAGE_VERSION = 1
+METRICS_STORAGE_KEY = f"{DOMAIN}.metrics"
+
+# Alarm words 40004..40006 carry alarms E01..E48, one bit per alarm (bit0 = E01).
+ALARM_COUNT = 48
+ALARM_WORD_KEYS = (REG_ALARM_1, REG_ALARM_2, REG_ALARM_3)
+
+EVENT_ALARM = f"{DOMAIN}_alarm"
+
+# Weekly schedules shared by all entries; transitions of one boundary are
+# applied to at most this many units at a time.
+SCHEDULE_STORAGE_VERSION = 1
+SCHEDULE_STORAGE_KEY = f"{DOMAIN}.schedules"
+SCHEDULE_CONCURRENCY = 8
+
+# Sensor values filtered before publishing: key -> (deadband, min interval, max silence) options.
+PUBLISH_FILTER_OPTIONS = {
+    REG_SUPPLY_TEMP: (CONF_SUPPLY_TEMP_DEADBAND, CONF_SUPPLY_TEMP_MIN_INTERVAL, CONF_SUPPLY_TEMP_MAX_SILENCE),
+    REG_OUTDOOR_TEMP: (CONF_OUTDOOR_TEMP_DEADBAND, CONF_OUTDOOR_TEMP_MIN_INTERVAL, CONF_OUTDOOR_TEMP_MAX_SILENCE),
+}
+
+# Modbus limits for a single read holding/input registers and write multiple registers request.
+MAX_READ_COUNT = 125
+MAX_WRITE_COUNT = 123
+
+PLATFORMS = ["binary_sensor", "climate", "number", "sensor"]
 
 OPTION_KEYS = {
     CONF_POWER_REGISTER,
@@ -66,4 +215,20 @@ OPTION_KEYS = {
     CONF_MAX_FAN_SPEED,
     CONF_READ_ONLY,
     CONF_SCAN_INTERVAL,
+    CONF_SUPPLY_TEMP_DEADBAND,
+    CONF_SUPPLY_TEMP_MIN_INTERVAL,
+    CONF_SUPPLY_TEMP_MAX_SILENCE,
+    CONF_OUTDOOR_TEMP_DEADBAND,
+    CONF_OUTDOOR_TEMP_MIN_INTERVAL,
+    CONF_OUTDOOR_TEMP_MAX_SILENCE,
+    CONF_SAMPLE_INTERVAL,
+    CONF_CLOCK_SYNC_INTERVAL,
+    CONF_CLOCK_DRIFT_THRESHOLD,
+    CONF_PIPELINE_WINDOW,
+    CONF_WRITE_FRESHNESS,
+    CONF_LEAN_TRANSPORT,
+    CONF_METRICS_EXPORT,
 }
+
+# Options that change which entities exist; everything else is applied live.
+RELOAD_OPTION_KEYS = {CONF_MAX_FAN_SPEED}
@@ -2,27 +2,107 @@
 
 from __future__ import annotations
 
-from dataclasses import fields
-from datetime import timedelta
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
-from typing import Any
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import ZentecModbusApi, ZentecState
-from .const import CONF_READ_ONLY
+from .api import ControllerClock, ZentecModbusApi, ZentecState
+from .const import (
+    ALARM_WORD_KEYS,
+    ALL_REGISTERS,
+    CONF_CLOCK_DRIFT_THRESHOLD,
+    CONF_CLOCK_SYNC_INTERVAL,
+    CONF_MODE_HEAT_VALUE,
+    CONF_READ_ONLY,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONNECTION_CHECK_INTERVAL,
+    DEFAULT_MODE_HEAT_VALUE,
+    DOMAIN,
+    EVENT_ALARM,
+    IDLE_PROBE_AFTER,
+    METRICS_SAVE_DELAY,
+    METRICS_STORAGE_KEY,
+    METRICS_STORAGE_VERSION,
+    PUBLISH_FILTER_OPTIONS,
+)
+from .metrics import DerivedMetrics
+from .sampler import ZentecSampler
+
+if TYPE_CHECKING:
+    from .gateway import ZentecGateway
+    from .profiling import ProfilingSession
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class PublishFilter:
+    """Deadband and rate limit for a published sensor value."""
+
+    deadband: float
+    min_interval: float
+    max_silence: float
+    value: float | None = None
+    published_at: float = 0.0
+
+    def apply(self, value: float | None, now: float) -> float | None:
+        """Return the value to publish given a freshly read ``value``."""
+        if value == self.value:
+            return value
+        if value is not None and self.value is not None:
+            elapsed = now - self.published_at
+            heartbeat_due = self.max_silence > 0 and elapsed >= self.max_silence
+            if not heartbeat_due and (elapsed < self.min_interval or abs(value - self.value) < self.deadband):
+                return self.value
+        self.value = value
+        self.published_at = now
+        return value
+
+
+@dataclass(slots=True)
+class PollStats:
+    """Poll counters of one coordinator since setup."""
+
+    polls: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+    last_seconds: float = 0.0
+    # Unix time of the last poll that succeeded, 0 until one does.
+    last_success: float = 0.0
+
+
+def _build_publish_filters(config: dict[str, Any]) -> dict[str, PublishFilter]:
+    filters: dict[str, PublishFilter] = {}
+    for key, (deadband_key, min_interval_key, max_silence_key) in PUBLISH_FILTER_OPTIONS.items():
+        deadband = float(config.get(deadband_key, 0))
+        min_interval = float(config.get(min_interval_key, 0))
+        max_silence = float(config.get(max_silence_key, 0))
+        if deadband > 0 or min_interval > 0:
+            filters[key] = PublishFilter(deadband, min_interval, max_silence)
+    return filters
+
+
 class ZentecCoordinator(DataUpdateCoordinator[ZentecState]):
     """Coordinate data updates and writes for Zentec controller."""
 
     def __init__(
         self,
         hass: HomeAssistant,
+        entry: ConfigEntry,
         api: ZentecModbusApi,
         update_interval: timedelta,
         name: str,
@@ -30,50 +110,502 @@ class ZentecCoordinator(DataUpdateCoordinator[ZentecState]):
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name=name,
             update_interval=update_interval,
         )
         self.api = api
+        self._scan_interval = update_interval
+        # Requested poll intervals of live register views, see async_boost_polling.
+        self._live_intervals: dict[object, int] = {}
+        # Alarm words are always read: zentec031_alarm events must fire for
+        # E01..E48 even when the (disabled by default) alarm entities are off.
+        self._register_refs: Counter[str] = Counter(ALARM_WORD_KEYS)
+        # Raw register image by Modbus address and what the last poll changed in it;
+        # register_poll counts the polls, so listeners can tell a new delta from a resend.
+        self.registers: dict[int, int] = {}
+        self.register_changes: dict[int, int] = {}
+        self.register_poll = 0
+        # Raw values of the last poll by register key, with failed reads filled from the poll before.
+        self._values: dict[str, int | None] = {}
+        # Alarms E01..E48 packed into one integer, bit n-1 = En.
+        self.alarm_bits = 0
+        self._alarm_known = 0
+        self._alarm_listeners: dict[int, CALLBACK_TYPE] = {}
+        self._publish_filters = _build_publish_filters(api.config)
+        # Filtered temperatures for sensor states; data keeps what was last read.
+        self.published: dict[str, float | None] = {}
+        self.sampler: ZentecSampler | None = None
+        self.metrics = DerivedMetrics()
+        self._metrics_store: Store[dict[str, Any]] = Store(
+            hass, METRICS_STORAGE_VERSION, f"{METRICS_STORAGE_KEY}.{entry.entry_id}"
+        )
+        self._metrics_save_pending = False
+        self._capture_timer: CALLBACK_TYPE | None = None
+        self._profiling: ProfilingSession | None = None
+        self._profiling_timer: CALLBACK_TYPE | None = None
+        # Controller clock drift in seconds at the last check, None until checked.
+        self.clock_drift: float | None = None
+        self._clock_sync_interval = 0
+        self._clock_sync_timer: CALLBACK_TYPE | None = None
+        self._clock_offset_warned = False
+        # Circuit breaker shared with the entries behind the same gateway, see gateway.py.
+        self.gateway: ZentecGateway | None = None
+        self.poll_stats = PollStats()
 
-    async def _async_update_data(self) -> ZentecState:
+    @property
+    def gateway_open(self) -> bool:
+        """Return True while the gateway is taken as down and the bus is left alone."""
+        return self.gateway is not None and self.gateway.is_open
+
+    @callback
+    def async_set_unavailable(self, err: Exception) -> None:
+        """Mark entities unavailable without polling; the gateway logs the outage once for all entries."""
+        self.last_exception = err
+        if self.last_update_success:
+            self.last_update_success = False
+            self.async_update_listeners()
+
+    async def async_apply_config(self, config: dict[str, Any]) -> None:
+        """Apply changed options to the running connection, plan and timers."""
+        # The swap waits for an in-flight poll or write to release the bus lock.
+        await self.hass.async_add_executor_job(self.api.update_config, config)
+        self._scan_interval = timedelta(seconds=int(config[CONF_SCAN_INTERVAL]))
+        self._async_apply_update_interval()
+        self._publish_filters = _build_publish_filters(config)
+        self.published = {}
+        self.async_configure_sampler()
+        self.async_configure_clock_sync()
+
+    @callback
+    def async_configure_sampler(self) -> None:
+        """Start, restart or stop the sampler to match the configured interval."""
+        interval = int(self.api.config.get(CONF_SAMPLE_INTERVAL, 0))
+        if self.sampler is not None and self.sampler.interval == interval:
+            return
+        self.async_stop_sampler()
+        if interval > 0:
+            self.sampler = ZentecSampler(self.hass, self.config_entry, self.api, interval, lambda: self.gateway_open)
+            self.sampler.async_start()
+
+    @callback
+    def async_stop_sampler(self) -> None:
+        """Stop the sampler if running."""
+        if self.sampler is not None:
+            self.sampler.async_stop()
+            self.sampler = None
+
+    @callback
+    def async_configure_clock_sync(self) -> None:
+        """Start, restart or stop the periodic clock sync to match the configured interval."""
+        interval = int(self.api.config.get(CONF_CLOCK_SYNC_INTERVAL, 0))
+        if interval == self._clock_sync_interval:
+            return
+        self.async_stop_clock_sync()
+        self._clock_sync_interval = interval
+        if interval > 0:
+            self._clock_sync_timer = async_track_time_interval(
+                self.hass, self._async_periodic_clock_sync, timedelta(hours=interval)
+            )
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_periodic_clock_sync(dt_util.utcnow()), f"{self.name} clock sync"
+            )
+
+    @callback
+    def async_stop_clock_sync(self) -> None:
+        """Stop the periodic clock sync if running."""
+        self._clock_sync_interval = 0
+        if self._clock_sync_timer is not None:
+            self._clock_sync_timer()
+            self._clock_sync_timer = None
+
+    async def async_sync_clock(self, force: bool = False) -> tuple[float | None, bool]:
+        """Check the controller clock and correct it if it drifted past the threshold.
+
+        Costs one block read, plus one block write only when the drift, an
+        invalid date or a different time zone calls for it (or ``force``).
+        Never writes in read-only mode. Returns the drift in seconds, None for
+        an invalid date, and whether the clock was written.
+        """
         try:
-            new_state = await self.hass.async_add_executor_job(self.api.read_state)
-            if self.data is None:
-                return new_state
-            return ZentecState(
-                **{
-                    field.name: getattr(new_state, field.name)
-                    if getattr(new_state, field.name) is not None
-                    else getattr(self.data, field.name)
-                    for field in fields(ZentecState)
-                }
+            clock, read_at = await self.hass.async_add_executor_job(self.api.read_clock)
+        except Exception as err:  # noqa: BLE001
+            raise HomeAssistantError(f"Failed to read Zentec clock: {err}") from err
+        reference = dt_util.as_local(dt_util.utc_from_timestamp(read_at))
+        drift = clock.drift(reference)
+        self.clock_drift = round(drift, 1) if drift is not None else None
+        self.async_update_listeners()
+
+        threshold = float(self.api.config.get(CONF_CLOCK_DRIFT_THRESHOLD, 0))
+        expected_offset = ControllerClock.from_datetime(reference).utc_offset
+        zone = reference.utcoffset()
+        if zone is not None and zone % timedelta(hours=1) and not self._clock_offset_warned:
+            self._clock_offset_warned = True
+            _LOGGER.warning(
+                "Time zone offset %s is not a whole number of hours; the Zentec clock zone is set to UTC%+d",
+                zone,
+                expected_offset,
             )
+        if not force and drift is not None and abs(drift) <= threshold and clock.utc_offset == expected_offset:
+            return drift, False
+        if bool(self.api.config.get(CONF_READ_ONLY, False)):
+            _LOGGER.warning("Zentec clock is off by %s s but the integration is in read-only mode", drift)
+            return drift, False
+        try:
+            await self.hass.async_add_executor_job(self.api.write_clock, dt_util.now)
+        except Exception as err:  # noqa: BLE001
+            raise HomeAssistantError(f"Failed to set Zentec clock: {err}") from err
+        _LOGGER.info("Corrected Zentec clock drift of %s s", drift)
+        return drift, True
+
+    async def _async_periodic_clock_sync(self, now: datetime) -> None:
+        try:
+            await self.async_sync_clock()
+        except HomeAssistantError as err:
+            _LOGGER.debug("Periodic Zentec clock sync failed: %s", err)
+
+    @callback
+    def async_supervise_connection(self) -> CALLBACK_TYPE:
+        """Check the connection between polls until the returned callback is called."""
+        return async_track_time_interval(
+            self.hass,
+            self._async_check_connection,
+            timedelta(seconds=CONNECTION_CHECK_INTERVAL),
+            name=f"{self.name} connection check",
+        )
+
+    async def _async_check_connection(self, now: datetime) -> None:
+        if self.gateway_open:
+            # The gateway prober checks the link for all entries.
+            return
+        usable = await self.hass.async_add_executor_job(self.api.supervise_connection, IDLE_PROBE_AFTER)
+        if usable is False:
+            _LOGGER.debug("Zentec connection is down, reconnect failed")
+
+    async def async_start_capture(self, duration: int) -> Path:
+        """Capture Modbus traffic into the config directory for ``duration`` seconds (0 = until stopped)."""
+        path = Path(
+            self.hass.config.path(
+                DOMAIN, f"capture_{self.config_entry.entry_id}_{dt_util.utcnow():%Y%m%d_%H%M%S}.zcap"
+            )
+        )
+        await self.hass.async_add_executor_job(self.api.start_capture, path)
+        self._async_cancel_capture_timer()
+        if duration > 0:
+            self._capture_timer = async_call_later(self.hass, duration, self._async_capture_expired)
+        _LOGGER.info("Capturing Modbus traffic to %s", path)
+        return path
+
+    async def async_stop_capture(self) -> Path | None:
+        """Stop a running capture and return its file."""
+        self._async_cancel_capture_timer()
+        path = await self.hass.async_add_executor_job(self.api.stop_capture)
+        if path is not None:
+            _LOGGER.info("Modbus traffic capture saved to %s", path)
+        return path
+
+    async def _async_capture_expired(self, now: datetime) -> None:
+        self._capture_timer = None
+        await self.async_stop_capture()
+
+    @callback
+    def _async_cancel_capture_timer(self) -> None:
+        if self._capture_timer is not None:
+            self._capture_timer()
+            self._capture_timer = None
+
+    async def async_start_profiling(self, duration: int) -> ProfilingSession:
+        """Profile polls and writes for ``duration`` seconds; files go to the config directory."""
+        from .profiling import ProfilingSession
+
+        await self.async_stop_profiling()
+        stem = f"profile_{self.config_entry.entry_id}_{dt_util.utcnow():%Y%m%d_%H%M%S}"
+        self._profiling = ProfilingSession(
+            Path(self.hass.config.path(DOMAIN, f"{stem}.pstats")),
+            Path(self.hass.config.path(DOMAIN, f"{stem}.tracemalloc")),
+        )
+        self._profiling_timer = async_call_later(self.hass, duration, self._async_profiling_expired)
+        _LOGGER.info("Profiling Zentec polls and writes for %s s", duration)
+        return self._profiling
+
+    async def async_stop_profiling(self) -> ProfilingSession | None:
+        """Stop profiling, write its files and return the finished session."""
+        if self._profiling_timer is not None:
+            self._profiling_timer()
+            self._profiling_timer = None
+        session, self._profiling = self._profiling, None
+        if session is None:
+            return None
+        timings = await self.hass.async_add_executor_job(session.finish)
+        _LOGGER.info("Zentec profile saved to %s, hook timings: %s", session.stats_path, timings)
+        return session
+
+    async def _async_profiling_expired(self, now: datetime) -> None:
+        self._profiling_timer = None
+        await self.async_stop_profiling()
+
+    def _profiled(self, hook: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``func``, wrapped for the executor while profiling runs."""
+        if (session := self._profiling) is None:
+            return func
+        return session.wrap(hook, func)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners; timed as entity state writes while profiling."""
+        if (session := self._profiling) is None:
+            super().async_update_listeners()
+        else:
+            session.run("state_write", super().async_update_listeners)
+
+    async def async_load_metrics(self) -> None:
+        """Restore derived metrics from the last checkpoint."""
+        if (data := await self._metrics_store.async_load()) is not None:
+            self.metrics.restore(data)
+
+    @callback
+    def async_subscribe_registers(self, keys: Iterable[str]) -> CALLBACK_TYPE:
+        """Keep ``keys`` in the read plan until the returned callback is called."""
+        keys = tuple(keys)
+        self._register_refs.update(keys)
+        self._async_rebuild_read_plan()
+
+        @callback
+        def _unsubscribe() -> None:
+            self._register_refs.subtract(keys)
+            self._async_rebuild_read_plan()
+
+        return _unsubscribe
+
+    @callback
+    def _async_rebuild_read_plan(self) -> None:
+        self.api.set_read_keys(key for key, refs in self._register_refs.items() if refs > 0)
+
+    @callback
+    def async_boost_polling(self, interval: int) -> CALLBACK_TYPE:
+        """Poll all registers at least every ``interval`` seconds until the returned callback is called."""
+        token = object()
+        self._live_intervals[token] = interval
+        unsubscribe_registers = self.async_subscribe_registers(ALL_REGISTERS)
+        if self._async_apply_update_interval():
+            # Apply the faster rate now instead of after the pending slow poll.
+            self.config_entry.async_create_task(self.hass, self.async_request_refresh())
+
+        @callback
+        def _remove() -> None:
+            del self._live_intervals[token]
+            unsubscribe_registers()
+            self._async_apply_update_interval()
+
+        return _remove
+
+    @callback
+    def _async_apply_update_interval(self) -> bool:
+        """Set the poll interval from options and live views; return True if it got shorter."""
+        interval = self._scan_interval
+        if self._live_intervals:
+            interval = min(interval, timedelta(seconds=min(self._live_intervals.values())))
+        faster = self.update_interval is not None and interval < self.update_interval
+        self.update_interval = interval
+        return faster
+
+    def published_value(self, key: str) -> float | None:
+        """Return the value a temperature sensor should show, held by its PublishFilter if any."""
+        if self.data is None:
+            return None
+        if key in self.published:
+            return self.published[key]
+        return getattr(self.data, key)
+
+    @callback
+    def async_add_alarm_listener(self, alarm: int, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call ``update_callback`` whenever alarm ``alarm`` (1..48) changes."""
+        self._alarm_listeners[alarm] = update_callback
+
+        @callback
+        def _remove() -> None:
+            self._alarm_listeners.pop(alarm, None)
+
+        return _remove
+
+    def alarm_active(self, alarm: int) -> bool | None:
+        """Return state of alarm ``alarm`` (1..48), None while its word is unknown."""
+        bit = 1 << (alarm - 1)
+        if not self._alarm_known & bit:
+            return None
+        return bool(self.alarm_bits & bit)
+
+    async def _async_update_data(self) -> ZentecState:
+        stats = self.poll_stats
+        started = time.perf_counter()
+        try:
+            state = await self._async_poll()
+        except UpdateFailed:
+            stats.failures += 1
+            raise
+        else:
+            stats.last_success = time.time()
+            return state
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.polls += 1
+            stats.seconds += elapsed
+            stats.last_seconds = elapsed
+            if (session := self._profiling) is not None:
+                session.record("update", elapsed)
+
+    async def _async_poll(self) -> ZentecState:
+        if self.gateway_open:
+            raise UpdateFailed(f"Zentec gateway {self.gateway.name} is not answering")
+        self.register_changes = {}
+        try:
+            values = await self.hass.async_add_executor_job(self._profiled("update_bus", self.api.read_raw))
+        except Exception as err:  # noqa: BLE001
+            self._async_record_poll(False)
+            raise UpdateFailed(f"Failed to update Zentec data: {err}") from err
+        self._async_record_poll(any(value is not None for value in values.values()))
+        try:
+            self._async_update_registers(values)
+            # A failed block keeps its last values; registers dropped from the
+            # read plan go back to unknown instead of being carried forward.
+            read_keys = self.api.read_keys
+            values = {
+                key: self._values.get(key) if value is None and key in read_keys else value
+                for key, value in values.items()
+            }
+            self._values = values
+            new_state = self.api.decode(values)
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(f"Failed to update Zentec data: {err}") from err
+        self._async_process_alarms(new_state)
+        self._async_update_metrics(new_state)
+        if self._publish_filters:
+            now = time.monotonic()
+            self.published = {
+                key: publish_filter.apply(getattr(new_state, key), now)
+                for key, publish_filter in self._publish_filters.items()
+            }
+        return new_state
+
+    @callback
+    def _async_record_poll(self, answered: bool) -> None:
+        """Report the poll to the gateway breaker; fail it if the breaker is open now."""
+        if (gateway := self.gateway) is None:
+            return
+        gateway.async_record_poll(answered)
+        if gateway.is_open:
+            raise UpdateFailed(f"Zentec gateway {gateway.name} is not answering")
+
+    @callback
+    def _async_update_registers(self, values: dict[str, int | None]) -> None:
+        changes: dict[int, int] = {}
+        for key, address in self.api.register_map.items():
+            value = values[key]
+            if value is not None and self.registers.get(address) != value:
+                changes[address] = value
+        self.registers.update(changes)
+        self.register_changes = changes
+        self.register_poll += 1
+
+    @callback
+    def _async_update_metrics(self, state: ZentecState) -> None:
+        heat_mode_value = int(self.api.config.get(CONF_MODE_HEAT_VALUE, DEFAULT_MODE_HEAT_VALUE))
+        max_gap = 3 * self._scan_interval.total_seconds()
+        self.metrics.update(time.time(), state, heat_mode_value, max_gap)
+        # Store.async_delay_save restarts its timer on every call, so schedule once and
+        # let the write itself clear the flag; this batches a whole delay window per write.
+        if not self._metrics_save_pending:
+            self._metrics_save_pending = True
+            self._metrics_store.async_delay_save(self._metrics_data_to_save, METRICS_SAVE_DELAY)
+
+    async def async_save_metrics(self) -> None:
+        """Write the metrics checkpoint now, replacing any pending delayed save."""
+        self._metrics_save_pending = False
+        await self._metrics_store.async_save(self.metrics.as_dict())
 
-    async def async_set_power(self, enabled: bool) -> None:
-        await self._async_write(self.api.set_power, enabled)
+    def _metrics_data_to_save(self) -> dict[str, Any]:
+        self._metrics_save_pending = False
+        return self.metrics.as_dict()
 
-    async def async_set_fan_speed(self, fan_speed: int) -> None:
-        await self._async_write(self.api.set_fan_speed, fan_speed)
+    @callback
+    def _async_process_alarms(self, state: ZentecState) -> None:
+        """Fire events and notify entities for alarm bits that flipped since last poll."""
+        bits = 0
+        known = 0
+        for index, word in enumerate((state.alarm_code, state.alarm_code_2, state.alarm_code_3)):
+            if word is not None:
+                bits |= (word & 0xFFFF) << (16 * index)
+                known |= 0xFFFF << (16 * index)
 
-    async def async_set_mode_value(self, mode_value: int) -> None:
-        await self._async_write(self.api.set_mode, mode_value)
+        changed = (bits ^ self.alarm_bits) & known & self._alarm_known
+        appeared = known & ~self._alarm_known
+        self.alarm_bits = bits
+        self._alarm_known = known
 
-    async def async_set_target_temp(self, target_temp: float) -> None:
-        await self._async_write(self.api.set_target_temp, target_temp)
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            alarm = bit.bit_length()
+            self.hass.bus.async_fire(
+                EVENT_ALARM,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "alarm": alarm,
+                    "code": f"E{alarm:02d}",
+                    "active": bool(bits & bit),
+                },
+            )
+            if (listener := self._alarm_listeners.get(alarm)) is not None:
+                listener()
+
+        if appeared:
+            for alarm, listener in self._alarm_listeners.items():
+                if appeared & (1 << (alarm - 1)):
+                    listener()
+
+    async def async_set_power(self, enabled: bool, force: bool = False) -> None:
+        await self._async_write(self.api.set_power, enabled, force)
+
+    async def async_set_fan_speed(self, fan_speed: int, force: bool = False) -> None:
+        await self._async_write(self.api.set_fan_speed, fan_speed, force)
+
+    async def async_set_mode_value(self, mode_value: int, force: bool = False) -> None:
+        await self._async_write(self.api.set_mode, mode_value, force)
 
-    async def async_set_min_heat_temp(self, value: float) -> None:
-        await self._async_write(self.api.set_min_heat_temp, value)
+    async def async_set_target_temp(self, target_temp: float, force: bool = False) -> None:
+        await self._async_write(self.api.set_target_temp, target_temp, force)
 
-    async def async_set_max_heat_temp(self, value: float) -> None:
-        await self._async_write(self.api.set_max_heat_temp, value)
+    async def async_set_min_heat_temp(self, value: float, force: bool = False) -> None:
+        await self._async_write(self.api.set_min_heat_temp, value, force)
+
+    async def async_set_max_heat_temp(self, value: float, force: bool = False) -> None:
+        await self._async_write(self.api.set_max_heat_temp, value, force)
+
+    async def async_write_values(self, values: dict[int, int], force: bool = False) -> None:
+        """Write raw register values by address, batched into as few requests as possible.
+
+        ``force`` also writes values the controller recently confirmed.
+        """
+        await self._async_write(self.api.write_values, values, force)
 
     async def _async_write(self, method: Any, *args: Any) -> None:
+        if (session := self._profiling) is None:
+            await self._async_write_setting(method, *args)
+            return
+        started = time.perf_counter()
+        try:
+            await self._async_write_setting(method, *args)
+        finally:
+            session.record("write", time.perf_counter() - started)
+
+    async def _async_write_setting(self, method: Any, *args: Any) -> None:
         if bool(self.api.config.get(CONF_READ_ONLY, False)):
             raise HomeAssistantError("Zentec integration is in read-only mode")
+        if self.gateway_open:
+            raise HomeAssistantError(f"Zentec gateway {self.gateway.name} is not answering")
         try:
-            await self.hass.async_add_executor_job(method, *args)
+            written = await self.hass.async_add_executor_job(self._profiled("write_bus", method), *args)
         except Exception as err:  # noqa: BLE001
             raise HomeAssistantError(f"Failed to write Zentec setting: {err}") from err
-        await self.async_request_refresh()
+        if written:
+            await self.async_request_refresh()
@@ -7,7 +7,7 @@ from homeassistant.const import CONF_HOST
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_TRANSPORT, DOMAIN, TRANSPORT_SERIAL
 from .coordinator import ZentecCoordinator
 
 
@@ -15,6 +15,8 @@ class ZentecEntity(CoordinatorEntity[ZentecCoordinator]):
     """Base entity for Zentec devices."""
 
     _attr_has_entity_name = True
+    # Logical registers (REG_* from const) this entity reads from coordinator data.
+    _register_keys: tuple[str, ...] = ()
 
     def __init__(self, coordinator: ZentecCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
@@ -24,5 +26,11 @@ class ZentecEntity(CoordinatorEntity[ZentecCoordinator]):
             name="Zentec 031",
             manufacturer="Zentec",
             model="031",
-            configuration_url=f"http://{entry.data[CONF_HOST]}",
+            configuration_url=None
+            if entry.data.get(CONF_TRANSPORT) == TRANSPORT_SERIAL
+            else f"http://{entry.data[CONF_HOST]}",
         )
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_subscribe_registers(self._register_keys))
@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_MAX_FAN_SPEED, DEFAULT_MAX_FAN_SPEED
+from .const import CONF_MAX_FAN_SPEED, REG_FAN_SPEED, REG_POWER
 from .entity import ZentecEntity
 
 
@@ -27,6 +27,7 @@ class ZentecFan(ZentecEntity, FanEntity):
     """Fan speed entity."""
 
     _attr_name = "Fan"
+    _register_keys = (REG_POWER, REG_FAN_SPEED)
     _attr_supported_features = (
         FanEntityFeature.SET_SPEED
         | FanEntityFeature.PRESET_MODE
@@ -36,7 +37,7 @@ class ZentecFan(ZentecEntity, FanEntity):
 
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator, entry)
-        self._max_speed = int(entry.options.get(CONF_MAX_FAN_SPEED, entry.data.get(CONF_MAX_FAN_SPEED, DEFAULT_MAX_FAN_SPEED)))
+        self._max_speed = int(coordinator.api.config[CONF_MAX_FAN_SPEED])
         self._attr_preset_modes = [str(speed) for speed in range(1, self._max_speed + 1)]
 
     @property
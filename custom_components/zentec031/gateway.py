@@ -0,0 +1,132 @@
+"""Circuit breaker shared by all entries behind one Modbus gateway.
+
+Controllers on one RS-485 line share a converter, so when it goes down every
+entry behind it fails at once, each poll burning the full timeout and
+retries. Entries with the same host and port join one ``ZentecGateway``.
+After ``GATEWAY_FAILURE_THRESHOLD`` consecutive polls without any answer,
+counted across all of its entries, the breaker opens: all entries go
+unavailable together, their polls, samples, writes and connection checks
+return without touching the bus, and a single prober checks one link with
+backoff until the gateway answers again.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, GATEWAY_FAILURE_THRESHOLD, GATEWAY_PROBE_INTERVAL, GATEWAY_PROBE_MAX_INTERVAL
+
+if TYPE_CHECKING:
+    from .coordinator import ZentecCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_GATEWAYS: HassKey[dict[tuple[str, int], ZentecGateway]] = HassKey(f"{DOMAIN}_gateways")
+
+
+class ZentecGateway:
+    """Poll outcomes and the open/closed state of one gateway."""
+
+    def __init__(self, hass: HomeAssistant, host: str, port: int) -> None:
+        self.hass = hass
+        self.name = f"{host}:{port}"
+        self.members: list[ZentecCoordinator] = []
+        # Consecutive polls without any answer, across members.
+        self.failures = 0
+        self.is_open = False
+        self._probe_delay = GATEWAY_PROBE_INTERVAL
+        self._probe_index = 0
+        self._probe_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_record_poll(self, answered: bool) -> None:
+        """Account a member poll; any answer closes the breaker, misses may open it."""
+        if answered:
+            self.failures = 0
+            if self.is_open:
+                self._async_close()
+            return
+        self.failures += 1
+        if not self.is_open and self.failures >= GATEWAY_FAILURE_THRESHOLD:
+            self._async_open()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel a pending probe."""
+        if self._probe_timer is not None:
+            self._probe_timer()
+            self._probe_timer = None
+
+    @callback
+    def _async_open(self) -> None:
+        self.is_open = True
+        _LOGGER.warning(
+            "Zentec gateway %s did not answer %s polls in a row; pausing its %s entries until it answers again",
+            self.name,
+            self.failures,
+            len(self.members),
+        )
+        error = UpdateFailed(f"Zentec gateway {self.name} is not answering")
+        for member in self.members:
+            member.async_set_unavailable(error)
+        self._probe_delay = GATEWAY_PROBE_INTERVAL
+        self._async_schedule_probe()
+
+    @callback
+    def _async_close(self) -> None:
+        self.is_open = False
+        self.async_stop()
+        _LOGGER.info("Zentec gateway %s answers again; resuming its %s entries", self.name, len(self.members))
+        for member in self.members:
+            member.config_entry.async_create_task(self.hass, member.async_request_refresh())
+
+    @callback
+    def _async_schedule_probe(self) -> None:
+        self._probe_timer = async_call_later(self.hass, self._probe_delay, self._async_probe)
+
+    async def _async_probe(self, now: datetime) -> None:
+        self._probe_timer = None
+        if not self.is_open or not self.members:
+            return
+        # Rotate through the members, so one dead controller cannot keep the gateway open.
+        member = self.members[self._probe_index % len(self.members)]
+        self._probe_index += 1
+        answered = await self.hass.async_add_executor_job(member.api.check_link)
+        if not self.is_open:
+            return
+        if answered:
+            self.failures = 0
+            self._async_close()
+            return
+        self._probe_delay = min(self._probe_delay * 2, GATEWAY_PROBE_MAX_INTERVAL)
+        _LOGGER.debug("Zentec gateway %s is still not answering, next probe in %s s", self.name, self._probe_delay)
+        if self.members:
+            self._async_schedule_probe()
+
+
+@callback
+def async_join_gateway(hass: HomeAssistant, coordinator: ZentecCoordinator, host: str, port: int) -> CALLBACK_TYPE:
+    """Add ``coordinator`` to the breaker of its gateway until the returned callback is called."""
+    gateways = hass.data.setdefault(DATA_GATEWAYS, {})
+    key = (host, port)
+    if (gateway := gateways.get(key)) is None:
+        gateway = gateways[key] = ZentecGateway(hass, host, port)
+    gateway.members.append(coordinator)
+    coordinator.gateway = gateway
+
+    @callback
+    def _leave() -> None:
+        gateway.members.remove(coordinator)
+        coordinator.gateway = None
+        if not gateway.members:
+            gateway.async_stop()
+            gateways.pop(key, None)
+
+    return _leave
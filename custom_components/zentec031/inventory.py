@@ -0,0 +1,46 @@
+"""Device inventory files shared by the collector and the bulk import.
+
+An inventory is a CSV file with a header row, one controller per row.
+``host`` is required (the device path for serial links); every other
+column is optional and named like a config key. Blank lines and lines
+starting with ``#`` are skipped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+
+
+def parse_inventory(lines: Iterable[str], source: str) -> list[tuple[int, dict[str, str]]]:
+    """Return ``(line number, values)`` for every row, empty cells left out.
+
+    Raises ValueError naming ``source`` and the line if a host is missing.
+    """
+    # File line of every line the CSV reader gets, so skipped lines keep the numbering.
+    numbers: list[int] = []
+
+    def _data_lines() -> Iterator[str]:
+        for number, line in enumerate(lines, start=1):
+            if line.strip() and not line.lstrip().startswith("#"):
+                numbers.append(number)
+                yield line
+
+    reader = csv.DictReader(_data_lines())
+    rows: list[tuple[int, dict[str, str]]] = []
+    if reader.fieldnames is None:
+        return rows
+    consumed = reader.line_num
+    for row in reader:
+        number, consumed = numbers[consumed], reader.line_num
+        values = {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+        if "host" not in values:
+            raise ValueError(f"{source}:{number}: missing host")
+        rows.append((number, values))
+    return rows
+
+
+def read_inventory(path: str) -> list[tuple[int, dict[str, str]]]:
+    """Read and parse an inventory file; does file I/O."""
+    with open(path, newline="", encoding="utf-8") as handle:
+        return parse_inventory(handle, path)
@@ -0,0 +1,129 @@
+"""Streaming derived metrics for Zentec 031."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .api import ZentecState
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+
+class RollingAverage:
+    """Time-weighted average over a sliding window of fixed-width buckets.
+
+    Running totals are kept alongside the buckets, so adding a sample and
+    reading the average are O(1); a bucket is cleared once per rotation.
+    """
+
+    __slots__ = ("_buckets", "_epoch", "_sums", "_total", "_weight", "_weights", "_width")
+
+    def __init__(self, span: float, buckets: int) -> None:
+        self._buckets = buckets
+        self._width = span / buckets
+        self._sums = [0.0] * buckets
+        self._weights = [0.0] * buckets
+        self._total = 0.0
+        self._weight = 0.0
+        self._epoch: int | None = None
+
+    @property
+    def value(self) -> float | None:
+        """Return the current average, None until any weight is collected."""
+        if self._weight <= 0:
+            return None
+        return self._total / self._weight
+
+    def add(self, timestamp: float, value: float, weight: float) -> None:
+        """Add ``value`` observed for ``weight`` seconds ending at ``timestamp``."""
+        epoch = int(timestamp // self._width)
+        if self._epoch is None:
+            self._epoch = epoch
+        elif epoch > self._epoch:
+            for stale in range(self._epoch + 1, min(epoch, self._epoch + self._buckets) + 1):
+                index = stale % self._buckets
+                self._total -= self._sums[index]
+                self._weight -= self._weights[index]
+                self._sums[index] = 0.0
+                self._weights[index] = 0.0
+            self._epoch = epoch
+        index = self._epoch % self._buckets
+        self._sums[index] += value * weight
+        self._weights[index] += weight
+        self._total += value * weight
+        self._weight += weight
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable checkpoint."""
+        return {"epoch": self._epoch, "sums": self._sums, "weights": self._weights}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load a checkpoint produced by ``as_dict``."""
+        sums = data.get("sums") or []
+        weights = data.get("weights") or []
+        if len(sums) != self._buckets or len(weights) != self._buckets:
+            return
+        self._epoch = data.get("epoch")
+        self._sums = [float(value) for value in sums]
+        self._weights = [float(value) for value in weights]
+        self._total = sum(self._sums)
+        self._weight = sum(self._weights)
+
+
+class DerivedMetrics:
+    """Fan runtime, heating duty and temperature averages updated per poll.
+
+    Each interval between two polls is attributed to the state seen at its
+    start. Intervals longer than ``max_gap`` (missed polls, restarts) are
+    skipped rather than guessed.
+    """
+
+    def __init__(self) -> None:
+        self.fan_runtime: dict[int, float] = {}
+        self.temperature_delta: float | None = None
+        self.heating_duty = RollingAverage(DAY, 96)
+        self.supply_avg_1h = RollingAverage(HOUR, 60)
+        self.supply_avg_24h = RollingAverage(DAY, 96)
+        self.outdoor_avg_1h = RollingAverage(HOUR, 60)
+        self.outdoor_avg_24h = RollingAverage(DAY, 96)
+        self._last: tuple[float, bool, int | None, bool] | None = None
+
+    def update(self, timestamp: float, state: ZentecState, heat_mode_value: int, max_gap: float) -> None:
+        """Fold one polled state into all metrics."""
+        if self._last is not None:
+            last_timestamp, was_on, last_speed, was_heating = self._last
+            elapsed = timestamp - last_timestamp
+            if 0 < elapsed <= max_gap:
+                if was_on and last_speed:
+                    self.fan_runtime[last_speed] = self.fan_runtime.get(last_speed, 0.0) + elapsed
+                self.heating_duty.add(timestamp, 1.0 if was_heating else 0.0, elapsed)
+                if state.supply_temp is not None:
+                    self.supply_avg_1h.add(timestamp, state.supply_temp, elapsed)
+                    self.supply_avg_24h.add(timestamp, state.supply_temp, elapsed)
+                if state.outdoor_temp is not None:
+                    self.outdoor_avg_1h.add(timestamp, state.outdoor_temp, elapsed)
+                    self.outdoor_avg_24h.add(timestamp, state.outdoor_temp, elapsed)
+
+        if state.supply_temp is not None and state.outdoor_temp is not None:
+            self.temperature_delta = round(state.supply_temp - state.outdoor_temp, 1)
+        powered = bool(state.power)
+        self._last = (timestamp, powered, state.fan_speed, powered and state.mode_raw == heat_mode_value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable checkpoint."""
+        return {
+            "fan_runtime": {str(speed): seconds for speed, seconds in self.fan_runtime.items()},
+            "heating_duty": self.heating_duty.as_dict(),
+            "supply_avg_1h": self.supply_avg_1h.as_dict(),
+            "supply_avg_24h": self.supply_avg_24h.as_dict(),
+            "outdoor_avg_1h": self.outdoor_avg_1h.as_dict(),
+            "outdoor_avg_24h": self.outdoor_avg_24h.as_dict(),
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load a checkpoint produced by ``as_dict``."""
+        self.fan_runtime = {int(speed): float(seconds) for speed, seconds in data.get("fan_runtime", {}).items()}
+        for name in ("heating_duty", "supply_avg_1h", "supply_avg_24h", "outdoor_avg_1h", "outdoor_avg_24h"):
+            if name in data:
+                getattr(self, name).restore(data[name])
@@ -0,0 +1,80 @@
+"""OpenMetrics HTTP endpoint for Zentec 031."""
+
+from __future__ import annotations
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import CONF_METRICS_EXPORT, CONF_SLAVE_ID, DEFAULT_PORT, DEFAULT_SLAVE_ID, DOMAIN
+from .coordinator import ZentecCoordinator
+from .openmetrics import CONTENT_TYPE, ExportedDevice, format_labels, render_openmetrics
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+
+DATA_METRICS_VIEW: HassKey[ZentecMetricsView] = HassKey(f"{DOMAIN}_metrics_view")
+
+
+class ZentecMetricsView(HomeAssistantView):
+    """Serve the latest state and poll counters of every entry with metrics export enabled.
+
+    Scraped with a long-lived access token as bearer token, like the core
+    Prometheus integration.
+    """
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self) -> None:
+        # Escaped label set by entry id, with the title it was built for.
+        self._labels: dict[str, tuple[str, str]] = {}
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Render the exposition straight from coordinator memory."""
+        hass = request.app[KEY_HASS]
+        devices: list[ExportedDevice] = []
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+            coordinator: ZentecCoordinator = entry.runtime_data
+            if not coordinator.api.config.get(CONF_METRICS_EXPORT):
+                continue
+            available = coordinator.last_update_success
+            devices.append(
+                ExportedDevice(
+                    labels=self._entry_labels(entry),
+                    available=available,
+                    gateway_open=coordinator.gateway_open,
+                    # Held values of an unavailable unit are stale; only zentec_up tells about it.
+                    state=coordinator.data if available else None,
+                    polls=coordinator.poll_stats,
+                    transactions=coordinator.api.stats,
+                )
+            )
+        return web.Response(body=render_openmetrics(devices).encode(), headers={"Content-Type": CONTENT_TYPE})
+
+    def _entry_labels(self, entry: ConfigEntry) -> str:
+        cached = self._labels.get(entry.entry_id)
+        if cached is not None and cached[0] == entry.title:
+            return cached[1]
+        labels = format_labels(
+            {
+                "entry_id": entry.entry_id,
+                "name": entry.title,
+                "gateway": f"{entry.data[CONF_HOST]}:{entry.data.get(CONF_PORT, DEFAULT_PORT)}",
+                "slave_id": str(entry.data.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID)),
+            }
+        )
+        self._labels[entry.entry_id] = (entry.title, labels)
+        return labels
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the endpoint once, when the first entry enables metrics export."""
+    if DATA_METRICS_VIEW in hass.data:
+        return
+    view = hass.data[DATA_METRICS_VIEW] = ZentecMetricsView()
+    hass.http.register_view(view)
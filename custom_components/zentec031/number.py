@@ -9,6 +9,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import REG_MAX_HEAT_TEMP, REG_MIN_HEAT_TEMP
 from .entity import ZentecEntity
 
 
@@ -30,6 +31,7 @@ class ZentecMinHeatTemperatureSetting(ZentecEntity, NumberEntity):
     """Minimum heating temperature setting (B0)."""
 
     _attr_name = "Min Heating Temperature"
+    _register_keys = (REG_MIN_HEAT_TEMP,)
     _attr_entity_category = EntityCategory.CONFIG
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 5
@@ -53,6 +55,7 @@ class ZentecMaxHeatTemperatureSetting(ZentecEntity, NumberEntity):
     """Maximum heating temperature setting (B1)."""
 
     _attr_name = "Max Heating Temperature"
+    _register_keys = (REG_MAX_HEAT_TEMP,)
     _attr_entity_category = EntityCategory.CONFIG
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 5
@@ -0,0 +1,127 @@
+"""OpenMetrics text exposition of the fleet from coordinator memory.
+
+``render_openmetrics`` walks every metric family once and, within it, every
+device, so a scrape formats one line per known value and touches neither
+entity states nor the recorder. Label sets are escaped once per device by
+the caller and reused across scrapes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .api import TransactionStats, ZentecState
+
+if TYPE_CHECKING:
+    from .coordinator import PollStats
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+@dataclass(slots=True)
+class ExportedDevice:
+    """What one scrape renders for an entry."""
+
+    labels: str
+    available: bool
+    gateway_open: bool
+    state: ZentecState | None
+    polls: PollStats
+    transactions: TransactionStats
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    """Return an escaped label set without braces."""
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_Getter = Callable[[ExportedDevice], float | int | None]
+# Metadata lines (empty for a continued family), sample name, extra labels, value getter.
+_Family = tuple[str, str, str, _Getter]
+
+
+def _family(name: str, kind: str, help_text: str, unit: str = "") -> str:
+    lines = [f"# TYPE {name} {kind}", f"# HELP {name} {help_text}"]
+    if unit:
+        lines.append(f"# UNIT {name} {unit}")
+    return "\n".join(lines)
+
+
+def _gauge(name: str, help_text: str, getter: _Getter, unit: str = "") -> _Family:
+    return _family(name, "gauge", help_text, unit), name, "", getter
+
+
+def _counter(name: str, help_text: str, getter: _Getter, unit: str = "") -> _Family:
+    return _family(name, "counter", help_text, unit), f"{name}_total", "", getter
+
+
+def _state(attribute: str) -> _Getter:
+    def getter(device: ExportedDevice) -> float | int | None:
+        return None if device.state is None else getattr(device.state, attribute)
+
+    return getter
+
+
+def _power(device: ExportedDevice) -> int | None:
+    if device.state is None or device.state.power is None:
+        return None
+    return int(device.state.power)
+
+
+_FAMILIES: tuple[_Family, ...] = (
+    _gauge("zentec_up", "1 if the last poll succeeded.", lambda device: int(device.available)),
+    _gauge("zentec_gateway_open", "1 while the gateway is taken as down.", lambda device: int(device.gateway_open)),
+    _gauge("zentec_power", "Unit power state.", _power),
+    _gauge("zentec_mode", "Raw operating mode value.", _state("mode_raw")),
+    _gauge("zentec_fan_speed", "Fan speed step.", _state("fan_speed")),
+    _gauge("zentec_target_temperature_celsius", "Target temperature.", _state("target_temp"), "celsius"),
+    _gauge("zentec_min_heat_temperature_celsius", "Minimum heating temperature.", _state("min_heat_temp"), "celsius"),
+    _gauge("zentec_max_heat_temperature_celsius", "Maximum heating temperature.", _state("max_heat_temp"), "celsius"),
+    _gauge("zentec_supply_temperature_celsius", "Supply air temperature.", _state("supply_temp"), "celsius"),
+    _gauge("zentec_outdoor_temperature_celsius", "Outdoor air temperature.", _state("outdoor_temp"), "celsius"),
+    (_family("zentec_alarm_word", "gauge", "Alarm bits E01..E48, 16 per word."), "zentec_alarm_word", ',word="1"', _state("alarm_code")),
+    ("", "zentec_alarm_word", ',word="2"', _state("alarm_code_2")),
+    ("", "zentec_alarm_word", ',word="3"', _state("alarm_code_3")),
+    _counter("zentec_polls", "Coordinator polls.", lambda device: device.polls.polls),
+    _counter("zentec_poll_failures", "Failed coordinator polls.", lambda device: device.polls.failures),
+    _counter("zentec_poll_duration_seconds", "Time spent in polls.", lambda device: device.polls.seconds, "seconds"),
+    _gauge(
+        "zentec_last_poll_duration_seconds", "Duration of the last poll.", lambda device: device.polls.last_seconds, "seconds"
+    ),
+    _gauge(
+        "zentec_last_success_timestamp_seconds",
+        "Unix time of the last successful poll.",
+        lambda device: device.polls.last_success or None,
+        "seconds",
+    ),
+    _counter("zentec_modbus_reads", "Modbus read requests of polls and samples.", lambda device: device.transactions.reads),
+    _counter("zentec_modbus_read_errors", "Read requests without a valid response.", lambda device: device.transactions.read_errors),
+    _counter(
+        "zentec_modbus_read_duration_seconds",
+        "Bus time of poll and sample reads.",
+        lambda device: device.transactions.read_seconds,
+        "seconds",
+    ),
+    _counter("zentec_modbus_writes", "Modbus write requests.", lambda device: device.transactions.writes),
+    _counter("zentec_modbus_write_errors", "Failed or rejected write requests.", lambda device: device.transactions.write_errors),
+)
+
+
+def render_openmetrics(devices: Sequence[ExportedDevice]) -> str:
+    """Render every family for ``devices``; values that are not known yet are left out."""
+    lines: list[str] = []
+    append = lines.append
+    for header, sample, extra, getter in _FAMILIES:
+        if header:
+            append(header)
+        for device in devices:
+            if (value := getter(device)) is not None:
+                append(f"{sample}{{{device.labels}{extra}}} {value}")
+    append("# EOF\n")
+    return "\n".join(lines)
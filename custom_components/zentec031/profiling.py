@@ -0,0 +1,116 @@
+"""On-demand profiling of the poll and write paths.
+
+A ``ProfilingSession`` is only created while profiling runs; the coordinator
+checks for it before every hook, so disabled profiling costs an attribute
+lookup. Synchronous sections (bus reads and writes in the executor, entity
+state writes on the event loop) run under cProfile, one at a time, and every
+hook records wall time, so a slow poll can be split into executor queueing,
+bus time and state writes. Allocations are traced process-wide with
+tracemalloc for the session's lifetime.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import cProfile
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+import time
+import tracemalloc
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class HookTiming:
+    """Wall time spent in one profiled hook."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Account one call."""
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the timing in milliseconds for a service response."""
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class ProfilingSession:
+    """cProfile, tracemalloc and per-hook timings for one bounded window."""
+
+    def __init__(self, stats_path: Path, allocations_path: Path) -> None:
+        self.stats_path = stats_path
+        self.allocations_path: Path | None = allocations_path
+        self.timings: dict[str, HookTiming] = {}
+        self._profile = cProfile.Profile()
+        # One profiled section at a time; overlapping calls are only timed.
+        self._profile_lock = threading.Lock()
+        # tracemalloc is process-wide; leave it running if someone else started it.
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+
+    def record(self, hook: str, seconds: float) -> None:
+        """Account wall time of ``hook``."""
+        self.timings.setdefault(hook, HookTiming()).add(seconds)
+
+    def run(self, hook: str, func: Callable[..., _T], *args: Any) -> _T:
+        """Call ``func`` under cProfile and record its wall time."""
+        started = time.perf_counter()
+        try:
+            if not self._profile_lock.acquire(blocking=False):
+                return func(*args)
+            try:
+                try:
+                    self._profile.enable()
+                except ValueError:
+                    # Another profiler owns the interpreter (Python 3.12+); time only.
+                    return func(*args)
+                try:
+                    return func(*args)
+                finally:
+                    self._profile.disable()
+            finally:
+                self._profile_lock.release()
+        finally:
+            self.record(hook, time.perf_counter() - started)
+
+    def wrap(self, hook: str, func: Callable[..., _T]) -> Callable[..., _T]:
+        """Return ``func`` profiled as ``hook`` for the executor, recording its queueing delay."""
+        submitted = time.perf_counter()
+
+        def run(*args: Any) -> _T:
+            self.record(f"{hook}_queue", time.perf_counter() - submitted)
+            return self.run(hook, func, *args)
+
+        return run
+
+    def finish(self) -> dict[str, dict[str, float]]:
+        """Stop tracing, write pstats and the allocation snapshot and return hook timings.
+
+        Does file I/O and walks every traced allocation; run it in the executor.
+        """
+        self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._profile_lock:
+            self._profile.create_stats()
+            self._profile.dump_stats(self.stats_path)
+        if self.allocations_path is not None and tracemalloc.is_tracing():
+            tracemalloc.take_snapshot().dump(str(self.allocations_path))
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+        else:
+            # Stopped by someone else in the meantime.
+            self.allocations_path = None
+        return {hook: timing.as_dict() for hook, timing in sorted(self.timings.items())}
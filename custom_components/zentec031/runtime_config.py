@@ -0,0 +1,132 @@
+"""Runtime configuration for Zentec 031."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    CONF_ALARM_REGISTER,
+    CONF_BAUDRATE,
+    CONF_CLOCK_DRIFT_THRESHOLD,
+    CONF_LEAN_TRANSPORT,
+    CONF_METRICS_EXPORT,
+    CONF_PIPELINE_WINDOW,
+    CONF_WRITE_FRESHNESS,
+    CONF_CLOCK_SYNC_INTERVAL,
+    CONF_FAN_SPEED_REGISTER,
+    CONF_MAX_HEAT_TEMP_REGISTER,
+    CONF_MAX_FAN_SPEED,
+    CONF_MIN_HEAT_TEMP_REGISTER,
+    CONF_MODE_HEAT_VALUE,
+    CONF_MODE_REGISTER,
+    CONF_MODE_VENT_VALUE,
+    CONF_OUTDOOR_TEMP_DEADBAND,
+    CONF_OUTDOOR_TEMP_MAX_SILENCE,
+    CONF_OUTDOOR_TEMP_MIN_INTERVAL,
+    CONF_OUTDOOR_TEMP_REGISTER,
+    CONF_PARITY,
+    CONF_POWER_REGISTER,
+    CONF_READ_ONLY,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONF_SLAVE_ID,
+    CONF_STOPBITS,
+    CONF_SUPPLY_TEMP_DEADBAND,
+    CONF_SUPPLY_TEMP_DIVISOR,
+    CONF_SUPPLY_TEMP_MAX_SILENCE,
+    CONF_SUPPLY_TEMP_MIN_INTERVAL,
+    CONF_SUPPLY_TEMP_REGISTER,
+    CONF_TARGET_TEMP_REGISTER,
+    CONF_TEMPERATURE_DIVISOR,
+    CONF_TRANSPORT,
+    DEFAULT_ALARM_REGISTER,
+    DEFAULT_BAUDRATE,
+    DEFAULT_CLOCK_DRIFT_THRESHOLD,
+    DEFAULT_LEAN_TRANSPORT,
+    DEFAULT_METRICS_EXPORT,
+    DEFAULT_PIPELINE_WINDOW,
+    DEFAULT_WRITE_FRESHNESS,
+    DEFAULT_CLOCK_SYNC_INTERVAL,
+    DEFAULT_DEADBAND,
+    DEFAULT_FAN_SPEED_REGISTER,
+    DEFAULT_MAX_HEAT_TEMP_REGISTER,
+    DEFAULT_MAX_FAN_SPEED,
+    DEFAULT_MAX_SILENCE,
+    DEFAULT_MIN_HEAT_TEMP_REGISTER,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_MODE_HEAT_VALUE,
+    DEFAULT_MODE_REGISTER,
+    DEFAULT_MODE_VENT_VALUE,
+    DEFAULT_OUTDOOR_TEMP_REGISTER,
+    DEFAULT_PARITY,
+    DEFAULT_POWER_REGISTER,
+    DEFAULT_READ_ONLY,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLAVE_ID,
+    DEFAULT_STOPBITS,
+    DEFAULT_SUPPLY_TEMP_DIVISOR,
+    DEFAULT_SUPPLY_TEMP_REGISTER,
+    DEFAULT_TARGET_TEMP_REGISTER,
+    DEFAULT_TEMPERATURE_DIVISOR,
+    DEFAULT_TRANSPORT,
+)
+
+
+def build_runtime_config(data: Mapping[str, Any], options: Mapping[str, Any]) -> dict[str, int | float | bool]:
+    """Merge entry data and options into the runtime config used by the API."""
+    return {
+        CONF_SLAVE_ID: int(data.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID)),
+        CONF_TRANSPORT: str(data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)),
+        CONF_BAUDRATE: int(data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)),
+        CONF_PARITY: str(data.get(CONF_PARITY, DEFAULT_PARITY)),
+        CONF_STOPBITS: int(data.get(CONF_STOPBITS, DEFAULT_STOPBITS)),
+        CONF_SCAN_INTERVAL: int(options.get(CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))),
+        CONF_POWER_REGISTER: int(
+            options.get(CONF_POWER_REGISTER, data.get(CONF_POWER_REGISTER, data.get("power_coil", DEFAULT_POWER_REGISTER)))
+        ),
+        CONF_MODE_REGISTER: int(options.get(CONF_MODE_REGISTER, data.get(CONF_MODE_REGISTER, DEFAULT_MODE_REGISTER))),
+        CONF_MODE_HEAT_VALUE: int(options.get(CONF_MODE_HEAT_VALUE, data.get(CONF_MODE_HEAT_VALUE, DEFAULT_MODE_HEAT_VALUE))),
+        CONF_MODE_VENT_VALUE: int(options.get(CONF_MODE_VENT_VALUE, data.get(CONF_MODE_VENT_VALUE, DEFAULT_MODE_VENT_VALUE))),
+        CONF_FAN_SPEED_REGISTER: int(
+            options.get(CONF_FAN_SPEED_REGISTER, data.get(CONF_FAN_SPEED_REGISTER, DEFAULT_FAN_SPEED_REGISTER))
+        ),
+        CONF_TARGET_TEMP_REGISTER: int(
+            options.get(CONF_TARGET_TEMP_REGISTER, data.get(CONF_TARGET_TEMP_REGISTER, DEFAULT_TARGET_TEMP_REGISTER))
+        ),
+        CONF_MIN_HEAT_TEMP_REGISTER: int(
+            options.get(CONF_MIN_HEAT_TEMP_REGISTER, data.get(CONF_MIN_HEAT_TEMP_REGISTER, DEFAULT_MIN_HEAT_TEMP_REGISTER))
+        ),
+        CONF_MAX_HEAT_TEMP_REGISTER: int(
+            options.get(CONF_MAX_HEAT_TEMP_REGISTER, data.get(CONF_MAX_HEAT_TEMP_REGISTER, DEFAULT_MAX_HEAT_TEMP_REGISTER))
+        ),
+        CONF_SUPPLY_TEMP_REGISTER: int(
+            options.get(CONF_SUPPLY_TEMP_REGISTER, data.get(CONF_SUPPLY_TEMP_REGISTER, DEFAULT_SUPPLY_TEMP_REGISTER))
+        ),
+        CONF_SUPPLY_TEMP_DIVISOR: int(
+            options.get(CONF_SUPPLY_TEMP_DIVISOR, data.get(CONF_SUPPLY_TEMP_DIVISOR, DEFAULT_SUPPLY_TEMP_DIVISOR))
+        ),
+        CONF_OUTDOOR_TEMP_REGISTER: int(
+            options.get(CONF_OUTDOOR_TEMP_REGISTER, data.get(CONF_OUTDOOR_TEMP_REGISTER, DEFAULT_OUTDOOR_TEMP_REGISTER))
+        ),
+        CONF_ALARM_REGISTER: int(options.get(CONF_ALARM_REGISTER, data.get(CONF_ALARM_REGISTER, DEFAULT_ALARM_REGISTER))),
+        CONF_TEMPERATURE_DIVISOR: int(
+            options.get(CONF_TEMPERATURE_DIVISOR, data.get(CONF_TEMPERATURE_DIVISOR, DEFAULT_TEMPERATURE_DIVISOR))
+        ),
+        CONF_MAX_FAN_SPEED: int(options.get(CONF_MAX_FAN_SPEED, data.get(CONF_MAX_FAN_SPEED, DEFAULT_MAX_FAN_SPEED))),
+        CONF_READ_ONLY: bool(options.get(CONF_READ_ONLY, data.get(CONF_READ_ONLY, DEFAULT_READ_ONLY))),
+        CONF_SUPPLY_TEMP_DEADBAND: float(options.get(CONF_SUPPLY_TEMP_DEADBAND, DEFAULT_DEADBAND)),
+        CONF_SUPPLY_TEMP_MIN_INTERVAL: int(options.get(CONF_SUPPLY_TEMP_MIN_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL)),
+        CONF_SUPPLY_TEMP_MAX_SILENCE: int(options.get(CONF_SUPPLY_TEMP_MAX_SILENCE, DEFAULT_MAX_SILENCE)),
+        CONF_OUTDOOR_TEMP_DEADBAND: float(options.get(CONF_OUTDOOR_TEMP_DEADBAND, DEFAULT_DEADBAND)),
+        CONF_OUTDOOR_TEMP_MIN_INTERVAL: int(options.get(CONF_OUTDOOR_TEMP_MIN_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL)),
+        CONF_OUTDOOR_TEMP_MAX_SILENCE: int(options.get(CONF_OUTDOOR_TEMP_MAX_SILENCE, DEFAULT_MAX_SILENCE)),
+        CONF_SAMPLE_INTERVAL: int(options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)),
+        CONF_CLOCK_SYNC_INTERVAL: int(options.get(CONF_CLOCK_SYNC_INTERVAL, DEFAULT_CLOCK_SYNC_INTERVAL)),
+        CONF_CLOCK_DRIFT_THRESHOLD: int(options.get(CONF_CLOCK_DRIFT_THRESHOLD, DEFAULT_CLOCK_DRIFT_THRESHOLD)),
+        CONF_LEAN_TRANSPORT: bool(options.get(CONF_LEAN_TRANSPORT, DEFAULT_LEAN_TRANSPORT)),
+        CONF_PIPELINE_WINDOW: int(options.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW)),
+        CONF_WRITE_FRESHNESS: int(options.get(CONF_WRITE_FRESHNESS, DEFAULT_WRITE_FRESHNESS)),
+        CONF_METRICS_EXPORT: bool(options.get(CONF_METRICS_EXPORT, DEFAULT_METRICS_EXPORT)),
+    }
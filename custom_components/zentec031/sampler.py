@@ -0,0 +1,141 @@
+"""High-resolution sampling and statistics import for Zentec 031."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+import time
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval, async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+
+from .api import ZentecModbusApi
+from .const import (
+    DOMAIN,
+    REG_FAN_SPEED,
+    REG_OUTDOOR_TEMP,
+    REG_POWER,
+    REG_SUPPLY_TEMP,
+    SAMPLE_REGISTERS,
+    SAMPLE_RETENTION,
+)
+from .samples import SampleRing
+
+_LOGGER = logging.getLogger(__name__)
+
+_HOUR = 3600
+
+# Statistic name suffix and unit per sampled channel.
+_CHANNEL_META: dict[str, tuple[str, str | None]] = {
+    REG_SUPPLY_TEMP: ("supply temperature", UnitOfTemperature.CELSIUS),
+    REG_OUTDOOR_TEMP: ("outdoor temperature", UnitOfTemperature.CELSIUS),
+    REG_FAN_SPEED: ("fan speed", None),
+    REG_POWER: ("power", None),
+}
+
+
+class ZentecSampler:
+    """Sample a few registers at a fast cadence into an in-memory ring buffer.
+
+    Samples never become recorder states. Once per hour the finished hours are
+    reduced to min/mean/max and imported as external long-term statistics in
+    one call per channel.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: ZentecModbusApi,
+        interval: int,
+        paused: Callable[[], bool] = lambda: False,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._api = api
+        # True while the bus must be left alone, e.g. the gateway is down.
+        self._paused = paused
+        self.interval = interval
+        self.ring = SampleRing(SAMPLE_REGISTERS, int(SAMPLE_RETENTION.total_seconds()) // interval + 1)
+        self._busy = False
+        self._imported_until = _hour_floor(time.time())
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling and hourly statistics import."""
+        self._unsubs.append(
+            async_track_time_interval(
+                self._hass,
+                self._async_sample,
+                timedelta(seconds=self.interval),
+                name=f"{DOMAIN} sampler {self._entry.entry_id}",
+            )
+        )
+        self._unsubs.append(async_track_utc_time_change(self._hass, self._async_import_statistics, minute=0, second=5))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop all timers."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    def recent(self, seconds: float) -> list[tuple[float, list[float | None]]]:
+        """Return raw samples from the last ``seconds`` seconds."""
+        return self.ring.window(time.time() - seconds)
+
+    async def _async_sample(self, now: datetime) -> None:
+        if self._busy or self._paused():
+            # Previous sample still waiting for the bus or the gateway is down; drop this tick instead of queueing.
+            return
+        self._busy = True
+        try:
+            state = await self._hass.async_add_executor_job(self._api.read_samples)
+        finally:
+            self._busy = False
+        values = [getattr(state, key) for key in SAMPLE_REGISTERS]
+        if all(value is None for value in values):
+            return
+        self.ring.append(time.time(), values)
+
+    async def _async_import_statistics(self, now: datetime) -> None:
+        until = _hour_floor(now.timestamp())
+        if until <= self._imported_until:
+            return
+        if "recorder" not in self._hass.config.components:
+            self._imported_until = until
+            return
+        # Recorder modules are already loaded once the recorder is set up.
+        from homeassistant.components.recorder.models import StatisticData, StatisticMeanType, StatisticMetaData
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        statistics: dict[str, list[StatisticData]] = {key: [] for key in SAMPLE_REGISTERS}
+        for hour in range(int(self._imported_until), int(until), _HOUR):
+            for key, (low, mean, high) in self.ring.aggregate(hour, hour + _HOUR).items():
+                statistics[key].append(
+                    StatisticData(start=dt_util.utc_from_timestamp(hour), min=low, mean=mean, max=high)
+                )
+        self._imported_until = until
+
+        for key, rows in statistics.items():
+            if not rows:
+                continue
+            label, unit = _CHANNEL_META[key]
+            metadata = StatisticMetaData(
+                mean_type=StatisticMeanType.ARITHMETIC,
+                has_sum=False,
+                name=f"{self._entry.title} {label}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{self._entry.entry_id.lower()}_{key}",
+                unit_of_measurement=unit,
+            )
+            async_add_external_statistics(self._hass, metadata, rows)
+        _LOGGER.debug("Imported sample statistics for %s up to %s", self._entry.entry_id, until)
+
+
+def _hour_floor(timestamp: float) -> float:
+    return timestamp - timestamp % _HOUR
@@ -0,0 +1,97 @@
+"""High-resolution sample ring buffer for Zentec 031."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+import math
+
+_NAN = float("nan")
+
+
+class SampleRing:
+    """Fixed-capacity ring of timestamped samples with one array per channel.
+
+    Storage is preallocated ``array('d')`` so appending never allocates and
+    missing values are kept as NaN. Timestamps must be appended in
+    non-decreasing order, which lets window lookups use binary search.
+    """
+
+    def __init__(self, channels: Sequence[str], capacity: int) -> None:
+        self.channels = tuple(channels)
+        self._capacity = max(int(capacity), 1)
+        self._times = array("d", [0.0]) * self._capacity
+        self._values = [array("d", [_NAN]) * self._capacity for _ in self.channels]
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Return maximum number of samples kept."""
+        return self._capacity
+
+    def append(self, timestamp: float, values: Sequence[float | None]) -> None:
+        """Store one sample, overwriting the oldest when full."""
+        if self._size < self._capacity:
+            index = (self._start + self._size) % self._capacity
+            self._size += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self._capacity
+        self._times[index] = timestamp
+        for column, value in zip(self._values, values):
+            column[index] = _NAN if value is None else float(value)
+
+    def window(self, since: float, until: float = math.inf) -> list[tuple[float, list[float | None]]]:
+        """Return samples with ``since <= timestamp < until``, oldest first."""
+        first = self._bisect(since)
+        last = self._bisect(until)
+        samples: list[tuple[float, list[float | None]]] = []
+        for logical in range(first, last):
+            index = (self._start + logical) % self._capacity
+            samples.append(
+                (
+                    self._times[index],
+                    [None if math.isnan(column[index]) else column[index] for column in self._values],
+                )
+            )
+        return samples
+
+    def aggregate(self, since: float, until: float) -> dict[str, tuple[float, float, float]]:
+        """Return ``(min, mean, max)`` per channel over ``[since, until)``.
+
+        Channels without a single valid sample in the window are omitted.
+        """
+        first = self._bisect(since)
+        last = self._bisect(until)
+        result: dict[str, tuple[float, float, float]] = {}
+        for channel, column in zip(self.channels, self._values):
+            low = math.inf
+            high = -math.inf
+            total = 0.0
+            count = 0
+            for logical in range(first, last):
+                value = column[(self._start + logical) % self._capacity]
+                if math.isnan(value):
+                    continue
+                low = min(low, value)
+                high = max(high, value)
+                total += value
+                count += 1
+            if count:
+                result[channel] = (low, total / count, high)
+        return result
+
+    def _bisect(self, timestamp: float) -> int:
+        """Return the first logical index whose timestamp is >= ``timestamp``."""
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[(self._start + middle) % self._capacity] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,213 @@
+"""Weekly schedules applied across the fleet.
+
+Schedules are named groups of config entries with weekly transitions. All
+groups compile into one wheel of slots sorted by time of week; a single
+timer is armed for the next slot. At a boundary every unit of the slot gets
+its settings in one batched write, with at most ``SCHEDULE_CONCURRENCY``
+units in flight, instead of one automation and refresh per setting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    CONF_MODE_HEAT_VALUE,
+    CONF_MODE_VENT_VALUE,
+    DEFAULT_MODE_HEAT_VALUE,
+    DEFAULT_MODE_VENT_VALUE,
+    DOMAIN,
+    SCHEDULE_CONCURRENCY,
+    SCHEDULE_STORAGE_KEY,
+    SCHEDULE_STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from .api import ZentecModbusApi
+
+_LOGGER = logging.getLogger(__name__)
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+SETTING_POWER = "power"
+SETTING_MODE = "mode"
+SETTING_FAN_SPEED = "fan_speed"
+SETTING_TARGET_TEMP = "target_temp"
+SETTINGS = (SETTING_POWER, SETTING_MODE, SETTING_FAN_SPEED, SETTING_TARGET_TEMP)
+# Climate HVAC modes a transition can switch to.
+MODES = ("heat", "fan_only")
+# Transition flag: write even values the unit recently confirmed.
+TRANSITION_FORCE = "force"
+
+DATA_SCHEDULER: HassKey[ZentecScheduler] = HassKey(f"{DOMAIN}_scheduler")
+
+
+@dataclass(slots=True)
+class Slot:
+    """Settings due at one time of the week, by config entry id."""
+
+    weekday: int
+    at: time
+    settings: dict[str, dict[str, Any]]
+
+
+def compile_schedules(schedules: dict[str, dict[str, Any]]) -> list[Slot]:
+    """Merge the transitions of every group into slots sorted by time of week.
+
+    A unit in several groups with transitions at the same time gets the
+    settings of all of them, later group names winning per setting; it is
+    forced if any of those transitions is.
+    """
+    slots: dict[tuple[int, time], dict[str, dict[str, Any]]] = {}
+    for name in sorted(schedules):
+        group = schedules[name]
+        for transition in group["transitions"]:
+            at = time.fromisoformat(transition["at"])
+            settings = {key: transition[key] for key in SETTINGS if key in transition}
+            if transition.get(TRANSITION_FORCE):
+                settings[TRANSITION_FORCE] = True
+            for day in transition["days"]:
+                slot = slots.setdefault((WEEKDAYS.index(day), at), {})
+                for entry_id in group["config_entry_ids"]:
+                    slot.setdefault(entry_id, {}).update(settings)
+    return [Slot(weekday, at, settings) for (weekday, at), settings in sorted(slots.items())]
+
+
+def next_slot(wheel: list[Slot], now: datetime) -> tuple[datetime, Slot] | None:
+    """Return the first slot strictly after ``now`` and when it is due in ``now``'s time zone."""
+    if not wheel:
+        return None
+    index = bisect.bisect_right(wheel, (now.weekday(), now.time()), key=lambda slot: (slot.weekday, slot.at))
+    week = 0
+    if index == len(wheel):
+        index, week = 0, 1
+    slot = wheel[index]
+    monday = now.date() - timedelta(days=now.weekday())
+    return datetime.combine(monday + timedelta(days=7 * week + slot.weekday), slot.at, tzinfo=now.tzinfo), slot
+
+
+def setting_values(api: ZentecModbusApi, settings: dict[str, Any]) -> dict[int, int]:
+    """Return raw register values for a unit's transition settings."""
+    mode_value: int | None = None
+    if (mode := settings.get(SETTING_MODE)) is not None:
+        mode_value = int(
+            api.config.get(CONF_MODE_HEAT_VALUE, DEFAULT_MODE_HEAT_VALUE)
+            if mode == "heat"
+            else api.config.get(CONF_MODE_VENT_VALUE, DEFAULT_MODE_VENT_VALUE)
+        )
+    return api.setting_values(
+        power=settings.get(SETTING_POWER),
+        mode_value=mode_value,
+        fan_speed=settings.get(SETTING_FAN_SPEED),
+        target_temp=settings.get(SETTING_TARGET_TEMP),
+    )
+
+
+class ZentecScheduler:
+    """Stored schedules and the timer for their next transition."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, SCHEDULE_STORAGE_VERSION, SCHEDULE_STORAGE_KEY)
+        # Group name -> {"config_entry_ids": [...], "transitions": [...]}, times as ISO strings.
+        self.schedules: dict[str, dict[str, Any]] = {}
+        self.next_run: datetime | None = None
+        self._wheel: list[Slot] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    async def async_load(self) -> None:
+        """Load stored schedules and arm the timer."""
+        data = await self._store.async_load() or {}
+        self.schedules = data.get("schedules", {})
+        self._async_compile()
+
+    async def async_set(self, name: str, entry_ids: list[str], transitions: list[dict[str, Any]]) -> None:
+        """Create or replace a group."""
+        self.schedules[name] = {"config_entry_ids": entry_ids, "transitions": transitions}
+        await self._async_save()
+
+    async def async_remove(self, name: str) -> bool:
+        """Remove a group; False if there was none."""
+        if self.schedules.pop(name, None) is None:
+            return False
+        await self._async_save()
+        return True
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        """Drop a deleted config entry from every group."""
+        changed = False
+        for group in self.schedules.values():
+            if entry_id in group["config_entry_ids"]:
+                group["config_entry_ids"].remove(entry_id)
+                changed = True
+        if changed:
+            await self._async_save()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the pending transition timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self.next_run = None
+
+    async def _async_save(self) -> None:
+        await self._store.async_save({"schedules": self.schedules})
+        self._async_compile()
+
+    @callback
+    def _async_compile(self) -> None:
+        self._wheel = compile_schedules(self.schedules)
+        self._async_arm()
+
+    @callback
+    def _async_arm(self) -> None:
+        self.async_stop()
+        if (upcoming := next_slot(self._wheel, dt_util.now())) is None:
+            return
+        self.next_run, slot = upcoming
+        self._unsub_timer = async_track_point_in_time(self.hass, partial(self._async_fire, slot), self.next_run)
+
+    @callback
+    def _async_fire(self, slot: Slot, now: datetime) -> None:
+        self._unsub_timer = None
+        self._async_arm()
+        self.hass.async_create_background_task(
+            self.async_apply(slot), f"{DOMAIN} schedule {WEEKDAYS[slot.weekday]} {slot.at.isoformat()}"
+        )
+
+    async def async_apply(self, slot: Slot) -> None:
+        """Write the slot's settings to every loaded unit, ``SCHEDULE_CONCURRENCY`` at a time."""
+        semaphore = asyncio.Semaphore(SCHEDULE_CONCURRENCY)
+
+        async def _async_apply_unit(entry_id: str, settings: dict[str, Any]) -> None:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            if entry is None or entry.state is not ConfigEntryState.LOADED:
+                _LOGGER.debug("Skipping scheduled transition for Zentec entry %s, it is not loaded", entry_id)
+                return
+            coordinator = entry.runtime_data
+            if coordinator.gateway_open:
+                _LOGGER.debug("Skipping scheduled transition for %s, its gateway is not answering", entry.title)
+                return
+            async with semaphore:
+                try:
+                    await coordinator.async_write_values(
+                        setting_values(coordinator.api, settings), settings.get(TRANSITION_FORCE, False)
+                    )
+                except HomeAssistantError as err:
+                    _LOGGER.warning("Scheduled transition for %s failed: %s", entry.title, err)
+
+        await asyncio.gather(*(_async_apply_unit(entry_id, settings) for entry_id, settings in slot.settings.items()))
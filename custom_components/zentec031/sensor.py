@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import (
+    CONF_MAX_FAN_SPEED,
+    REG_ALARM_1,
+    REG_ALARM_2,
+    REG_ALARM_3,
+    REG_FAN_SPEED,
+    REG_MODE,
+    REG_OUTDOOR_TEMP,
+    REG_POWER,
+    REG_SUPPLY_TEMP,
+)
+from .coordinator import ZentecCoordinator
 from .entity import ZentecEntity
+from .metrics import RollingAverage
 
 
 async def async_setup_entry(
@@ -27,6 +40,22 @@ async def async_setup_entry(
             ZentecAlarmCode3DiagnosticSensor(coordinator, entry),
             ZentecPowerRawDiagnosticSensor(coordinator, entry),
             ZentecModeRawDiagnosticSensor(coordinator, entry),
+            ZentecTemperatureDeltaSensor(coordinator, entry),
+            ZentecHeatingDutySensor(coordinator, entry),
+            ZentecClockDriftSensor(coordinator, entry),
+            *(
+                ZentecRollingAverageSensor(coordinator, entry, attribute, name, register)
+                for attribute, name, register in (
+                    ("supply_avg_1h", "Supply Temperature 1h Average", REG_SUPPLY_TEMP),
+                    ("supply_avg_24h", "Supply Temperature 24h Average", REG_SUPPLY_TEMP),
+                    ("outdoor_avg_1h", "Outdoor Temperature 1h Average", REG_OUTDOOR_TEMP),
+                    ("outdoor_avg_24h", "Outdoor Temperature 24h Average", REG_OUTDOOR_TEMP),
+                )
+            ),
+            *(
+                ZentecFanRuntimeSensor(coordinator, entry, speed)
+                for speed in range(1, int(coordinator.api.config[CONF_MAX_FAN_SPEED]) + 1)
+            ),
         ]
     )
 
@@ -35,6 +64,7 @@ class ZentecSupplyTemperatureSensor(ZentecEntity, SensorEntity):
     """Supply temperature."""
 
     _attr_name = "Supply Temperature"
+    _register_keys = (REG_SUPPLY_TEMP,)
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_device_class = SensorDeviceClass.TEMPERATURE
 
@@ -44,13 +74,14 @@ class ZentecSupplyTemperatureSensor(ZentecEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        return self.coordinator.data.supply_temp if self.coordinator.data else None
+        return self.coordinator.published_value(REG_SUPPLY_TEMP)
 
 
 class ZentecOutdoorTemperatureSensor(ZentecEntity, SensorEntity):
     """Outdoor temperature."""
 
     _attr_name = "Outdoor Temperature"
+    _register_keys = (REG_OUTDOOR_TEMP,)
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_device_class = SensorDeviceClass.TEMPERATURE
 
@@ -60,13 +91,14 @@ class ZentecOutdoorTemperatureSensor(ZentecEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        return self.coordinator.data.outdoor_temp if self.coordinator.data else None
+        return self.coordinator.published_value(REG_OUTDOOR_TEMP)
 
 
 class ZentecAlarmCodeSensor(ZentecEntity, SensorEntity):
     """Current alarm code from controller."""
 
     _attr_name = "Alarm Code"
+    _register_keys = (REG_ALARM_1,)
 
     @property
     def unique_id(self) -> str:
@@ -82,6 +114,7 @@ class ZentecAlarmCode2DiagnosticSensor(ZentecEntity, SensorEntity):
 
     _attr_name = "Alarm Code 17-32"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _register_keys = (REG_ALARM_2,)
 
     @property
     def unique_id(self) -> str:
@@ -97,6 +130,7 @@ class ZentecAlarmCode3DiagnosticSensor(ZentecEntity, SensorEntity):
 
     _attr_name = "Alarm Code 33-48"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _register_keys = (REG_ALARM_3,)
 
     @property
     def unique_id(self) -> str:
@@ -112,6 +146,7 @@ class ZentecPowerRawDiagnosticSensor(ZentecEntity, SensorEntity):
 
     _attr_name = "Power Raw"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _register_keys = (REG_POWER,)
 
     @property
     def unique_id(self) -> str:
@@ -127,6 +162,7 @@ class ZentecModeRawDiagnosticSensor(ZentecEntity, SensorEntity):
 
     _attr_name = "Mode Raw"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _register_keys = (REG_MODE,)
 
     @property
     def unique_id(self) -> str:
@@ -135,3 +171,108 @@ class ZentecModeRawDiagnosticSensor(ZentecEntity, SensorEntity):
     @property
     def native_value(self) -> int | None:
         return self.coordinator.data.mode_raw if self.coordinator.data else None
+
+
+class ZentecTemperatureDeltaSensor(ZentecEntity, SensorEntity):
+    """Supply minus outdoor temperature."""
+
+    _attr_name = "Supply-Outdoor Temperature Delta"
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _register_keys = (REG_SUPPLY_TEMP, REG_OUTDOOR_TEMP)
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._entry.entry_id}_temp_delta"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.metrics.temperature_delta
+
+
+class ZentecHeatingDutySensor(ZentecEntity, SensorEntity):
+    """Share of the last 24 hours spent powered in heating mode."""
+
+    _attr_name = "Heating Duty 24h"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _register_keys = (REG_POWER, REG_MODE)
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._entry.entry_id}_heating_duty_24h"
+
+    @property
+    def native_value(self) -> float | None:
+        duty = self.coordinator.metrics.heating_duty.value
+        return round(duty * 100, 1) if duty is not None else None
+
+
+class ZentecClockDriftSensor(ZentecEntity, SensorEntity):
+    """Controller clock drift against Home Assistant time at the last check."""
+
+    _attr_name = "Clock Drift"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Stays unknown unless the clock is checked.
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._entry.entry_id}_clock_drift"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.clock_drift
+
+
+class ZentecRollingAverageSensor(ZentecEntity, SensorEntity):
+    """Rolling time-weighted temperature average."""
+
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator: ZentecCoordinator, entry: ConfigEntry, attribute: str, name: str, register: str
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._attribute = attribute
+        self._attr_name = name
+        self._register_keys = (register,)
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._entry.entry_id}_{self._attribute}"
+
+    @property
+    def native_value(self) -> float | None:
+        average: RollingAverage = getattr(self.coordinator.metrics, self._attribute)
+        value = average.value
+        return round(value, 1) if value is not None else None
+
+
+class ZentecFanRuntimeSensor(ZentecEntity, SensorEntity):
+    """Cumulative runtime at one fan speed."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_suggested_display_precision = 1
+    _register_keys = (REG_POWER, REG_FAN_SPEED)
+
+    def __init__(self, coordinator: ZentecCoordinator, entry: ConfigEntry, speed: int) -> None:
+        super().__init__(coordinator, entry)
+        self._speed = speed
+        self._attr_name = f"Fan Speed {speed} Runtime"
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._entry.entry_id}_fan_runtime_{self._speed}"
+
+    @property
+    def native_value(self) -> float:
+        return round(self.coordinator.metrics.fan_runtime.get(self._speed, 0.0) / 3600, 3)
@@ -0,0 +1,348 @@
+"""Services for Zentec 031."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import config_validation as cv
+
+from .api import plan_range_reads
+from .const import DOMAIN, IMPORT_CONCURRENCY, MAX_IMPORT_CONCURRENCY, SAMPLE_REGISTERS, SAMPLE_RETENTION
+from .coordinator import ZentecCoordinator
+from .inventory import read_inventory
+from .schedule import (
+    DATA_SCHEDULER,
+    MODES,
+    SETTING_FAN_SPEED,
+    SETTING_MODE,
+    SETTING_POWER,
+    SETTING_TARGET_TEMP,
+    SETTINGS,
+    TRANSITION_FORCE,
+    WEEKDAYS,
+)
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_SECONDS = "seconds"
+ATTR_DURATION = "duration"
+ATTR_RANGES = "ranges"
+ATTR_REGISTER_TYPE = "register_type"
+ATTR_FORCE = "force"
+ATTR_NAME = "name"
+ATTR_CONFIG_ENTRY_IDS = "config_entry_ids"
+ATTR_TRANSITIONS = "transitions"
+ATTR_DAYS = "days"
+ATTR_AT = "at"
+ATTR_PATH = "path"
+ATTR_CONCURRENCY = "concurrency"
+
+SERVICE_GET_SAMPLES = "get_samples"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+SERVICE_READ_REGISTERS = "read_registers"
+SERVICE_SYNC_CLOCK = "sync_clock"
+SERVICE_START_PROFILING = "start_profiling"
+SERVICE_STOP_PROFILING = "stop_profiling"
+SERVICE_SET_SCHEDULE = "set_schedule"
+SERVICE_REMOVE_SCHEDULE = "remove_schedule"
+SERVICE_GET_SCHEDULES = "get_schedules"
+SERVICE_IMPORT_INVENTORY = "import_inventory"
+
+# Register type of read_registers; "auto" derives it from the address like the configured registers.
+REGISTER_TYPES = {"auto": None, "holding": False, "input": True}
+
+GET_SAMPLES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_SECONDS, default=300): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=int(SAMPLE_RETENTION.total_seconds()))
+        ),
+    }
+)
+
+START_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=600): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+    }
+)
+
+START_PROFILING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=60): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+    }
+)
+
+ENTRY_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def _register_range(value: Any) -> tuple[int, int]:
+    """Validate an address or an inclusive ``first-last`` address range."""
+    first, _, last = str(value).partition("-")
+    try:
+        first_address = int(first)
+        last_address = int(last) if last else first_address
+    except ValueError as err:
+        raise vol.Invalid(f"Expected an address or a range like 50048-50055, got {value!r}") from err
+    if not 0 <= first_address <= last_address <= 0xFFFF:
+        raise vol.Invalid(f"Invalid register range {value!r}")
+    return first_address, last_address
+
+
+SYNC_CLOCK_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+    }
+)
+
+TRANSITION_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_DAYS): vol.All(cv.ensure_list, vol.Length(min=1), [vol.In(WEEKDAYS)]),
+            vol.Required(ATTR_AT): cv.time,
+            vol.Optional(SETTING_POWER): cv.boolean,
+            vol.Optional(SETTING_MODE): vol.In(MODES),
+            vol.Optional(SETTING_FAN_SPEED): vol.All(vol.Coerce(int), vol.Range(min=1, max=255)),
+            vol.Optional(SETTING_TARGET_TEMP): vol.All(vol.Coerce(float), vol.Range(min=10, max=30)),
+            vol.Optional(TRANSITION_FORCE, default=False): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(*SETTINGS),
+)
+
+SET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Required(ATTR_CONFIG_ENTRY_IDS): vol.All(cv.ensure_list, vol.Length(min=1), [cv.string]),
+        vol.Required(ATTR_TRANSITIONS): vol.All(cv.ensure_list, vol.Length(min=1), [TRANSITION_SCHEMA]),
+    }
+)
+
+REMOVE_SCHEDULE_SCHEMA = vol.Schema({vol.Required(ATTR_NAME): cv.string})
+
+IMPORT_INVENTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_PATH): cv.string,
+        vol.Optional(ATTR_CONCURRENCY, default=IMPORT_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_IMPORT_CONCURRENCY)
+        ),
+    }
+)
+
+# Import flow aborts that leave an existing entry or a parallel import of the same unit in place.
+_IMPORT_SKIPPED = ("already_configured", "already_in_progress")
+
+READ_REGISTERS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_RANGES): vol.All(cv.ensure_list, vol.Length(min=1), [_register_range]),
+        vol.Optional(ATTR_REGISTER_TYPE, default="auto"): vol.In(REGISTER_TYPES),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, entry_id: str) -> ZentecCoordinator:
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"Zentec entry {entry_id} is not loaded")
+    return entry.runtime_data
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def _async_get_samples(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        if coordinator.sampler is None:
+            raise ServiceValidationError("High-resolution sampling is disabled for this entry")
+        return {
+            "channels": list(SAMPLE_REGISTERS),
+            "interval": coordinator.sampler.interval,
+            "samples": [[timestamp, *values] for timestamp, values in coordinator.sampler.recent(call.data[ATTR_SECONDS])],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SAMPLES,
+        _async_get_samples,
+        schema=GET_SAMPLES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_start_capture(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        path = await coordinator.async_start_capture(call.data[ATTR_DURATION])
+        return {"path": str(path)}
+
+    async def _async_stop_capture(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        path = await coordinator.async_stop_capture()
+        return {"path": str(path) if path is not None else None}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_CAPTURE,
+        _async_start_capture,
+        schema=START_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_CAPTURE,
+        _async_stop_capture,
+        schema=ENTRY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_read_registers(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        blocks = plan_range_reads(call.data[ATTR_RANGES], REGISTER_TYPES[call.data[ATTR_REGISTER_TYPE]])
+        values, failed = await hass.async_add_executor_job(coordinator.api.read_registers, blocks)
+        return {
+            "requests": len(blocks),
+            "registers": values,
+            "failed": [
+                {"address": block.address, "count": block.count, "input_registers": block.input_registers}
+                for block in failed
+            ],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_READ_REGISTERS,
+        _async_read_registers,
+        schema=READ_REGISTERS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_sync_clock(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        drift, synced = await coordinator.async_sync_clock(call.data[ATTR_FORCE])
+        return {"drift": drift, "synced": synced}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SYNC_CLOCK,
+        _async_sync_clock,
+        schema=SYNC_CLOCK_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_start_profiling(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        session = await coordinator.async_start_profiling(call.data[ATTR_DURATION])
+        return {"stats": str(session.stats_path), "allocations": str(session.allocations_path)}
+
+    async def _async_stop_profiling(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        session = await coordinator.async_stop_profiling()
+        if session is None:
+            return {"stats": None, "allocations": None, "timings": {}}
+        return {
+            "stats": str(session.stats_path),
+            "allocations": str(session.allocations_path) if session.allocations_path is not None else None,
+            "timings": {hook: timing.as_dict() for hook, timing in sorted(session.timings.items())},
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_PROFILING,
+        _async_start_profiling,
+        schema=START_PROFILING_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_PROFILING,
+        _async_stop_profiling,
+        schema=ENTRY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_set_schedule(call: ServiceCall) -> None:
+        entry_ids: list[str] = call.data[ATTR_CONFIG_ENTRY_IDS]
+        for entry_id in entry_ids:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is None or entry.domain != DOMAIN:
+                raise ServiceValidationError(f"{entry_id} is not a Zentec entry")
+        transitions = [
+            {**transition, ATTR_AT: transition[ATTR_AT].isoformat()} for transition in call.data[ATTR_TRANSITIONS]
+        ]
+        await hass.data[DATA_SCHEDULER].async_set(call.data[ATTR_NAME], list(dict.fromkeys(entry_ids)), transitions)
+
+    async def _async_remove_schedule(call: ServiceCall) -> None:
+        if not await hass.data[DATA_SCHEDULER].async_remove(call.data[ATTR_NAME]):
+            raise ServiceValidationError(f"No Zentec schedule named {call.data[ATTR_NAME]}")
+
+    async def _async_get_schedules(call: ServiceCall) -> ServiceResponse:
+        scheduler = hass.data[DATA_SCHEDULER]
+        return {
+            "schedules": scheduler.schedules,
+            "next_run": scheduler.next_run.isoformat() if scheduler.next_run is not None else None,
+        }
+
+    hass.services.async_register(DOMAIN, SERVICE_SET_SCHEDULE, _async_set_schedule, schema=SET_SCHEDULE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_REMOVE_SCHEDULE, _async_remove_schedule, schema=REMOVE_SCHEDULE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_GET_SCHEDULES, _async_get_schedules, supports_response=SupportsResponse.ONLY
+    )
+
+    async def _async_import_inventory(call: ServiceCall) -> ServiceResponse:
+        path = hass.config.path(call.data[ATTR_PATH])
+
+        def _read() -> list[tuple[int, dict[str, str]]]:
+            # Read only from the configuration directory or an allowlisted one.
+            if not Path(path).resolve().is_relative_to(Path(hass.config.config_dir).resolve()) and not (
+                hass.config.is_allowed_path(path)
+            ):
+                raise ServiceValidationError(f"{path} is outside the configuration directory and allowlist_external_dirs")
+            return read_inventory(path)
+
+        try:
+            rows = await hass.async_add_executor_job(_read)
+        except (OSError, UnicodeDecodeError, ValueError) as err:
+            raise ServiceValidationError(f"Cannot read inventory {path}: {err}") from err
+        semaphore = asyncio.Semaphore(call.data[ATTR_CONCURRENCY])
+
+        async def _async_import_row(row: int, values: dict[str, str]) -> tuple[str, dict[str, Any]]:
+            # Bounds the probes; Home Assistant sets up the created entries on its own.
+            async with semaphore:
+                result = await hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=values
+                )
+            report: dict[str, Any] = {"row": row, "host": values["host"]}
+            if result["type"] is FlowResultType.CREATE_ENTRY:
+                entry = result["result"]
+                report.update(config_entry_id=entry.entry_id, title=entry.title, state=entry.state.value)
+                return "created", report
+            report["reason"] = result.get("reason")
+            placeholders = result.get("description_placeholders") or {}
+            # Validation error of an invalid row, unreadable addresses of a partial probe.
+            report.update((key, placeholders[key]) for key in ("error", "failed") if placeholders.get(key))
+            return ("skipped" if report["reason"] in _IMPORT_SKIPPED else "failed"), report
+
+        summary: dict[str, list[dict[str, Any]]] = {"created": [], "skipped": [], "failed": []}
+        for outcome, report in await asyncio.gather(*(_async_import_row(row, values) for row, values in rows)):
+            summary[outcome].append(report)
+        return {"rows": len(rows), **summary}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_INVENTORY,
+        _async_import_inventory,
+        schema=IMPORT_INVENTORY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -9,6 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import REG_POWER
 from .entity import ZentecEntity
 
 
@@ -25,6 +26,7 @@ class ZentecPowerSwitch(ZentecEntity, SwitchEntity):
     """Power switch entity."""
 
     _attr_name = "Power"
+    _register_keys = (REG_POWER,)
 
     @property
     def unique_id(self) -> str:
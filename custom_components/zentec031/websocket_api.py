@@ -0,0 +1,90 @@
+"""Websocket API for Zentec 031."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, LIVE_SCAN_INTERVAL, MAX_SCAN_INTERVAL
+from .coordinator import ZentecCoordinator
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Required("config_entry_id"): str,
+        vol.Optional("interval", default=LIVE_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=LIVE_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+        ),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stream the raw register image of an entry as deltas.
+
+    The first event holds every known register by Modbus address, later
+    events only the addresses whose value changed and ``available`` when the
+    connection state flips. While subscribed the entry reads all registers
+    at least every ``interval`` seconds. Unloading the entry ends the
+    subscription with an ``unloaded`` event.
+    """
+    entry = hass.config_entries.async_get_entry(msg["config_entry_id"])
+    if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, f"Zentec entry {msg['config_entry_id']} is not loaded")
+        return
+    coordinator: ZentecCoordinator = entry.runtime_data
+    available = coordinator.last_update_success
+    # Listeners also run without a poll (clock sync, gateway outages); send each delta once.
+    sent_poll = coordinator.register_poll
+
+    @callback
+    def _forward_changes() -> None:
+        nonlocal available, sent_poll
+        event: dict[str, Any] = {}
+        if coordinator.register_poll != sent_poll:
+            sent_poll = coordinator.register_poll
+            if coordinator.register_changes:
+                event["registers"] = coordinator.register_changes
+        if coordinator.last_update_success != available:
+            available = coordinator.last_update_success
+            event["available"] = available
+        if event:
+            connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    remove_listener = coordinator.async_add_listener(_forward_changes)
+    end_boost = coordinator.async_boost_polling(msg["interval"])
+
+    @callback
+    def _unsubscribe() -> None:
+        remove_listener()
+        end_boost()
+
+    @callback
+    def _async_entry_unloaded() -> None:
+        # Gone already if the client unsubscribed or disconnected.
+        if connection.subscriptions.get(msg["id"]) is not _unsubscribe:
+            return
+        del connection.subscriptions[msg["id"]]
+        _unsubscribe()
+        connection.send_message(websocket_api.event_message(msg["id"], {"unloaded": True}))
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
+    entry.async_on_unload(_async_entry_unloaded)
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"registers": dict(coordinator.registers), "available": available})
+    )
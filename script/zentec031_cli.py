@@ -0,0 +1,19 @@
+"""Run the Zentec 031 command line tools without Home Assistant.
+
+The integration package imports Home Assistant on import, so it is
+registered here as a bare package: ``cli`` and the modules it uses (API,
+runtime configuration, capture, batch export) load without running
+``__init__``.
+"""
+
+from pathlib import Path
+import sys
+import types
+
+package = types.ModuleType("zentec031")
+package.__path__ = [str(Path(__file__).resolve().parent.parent / "custom_components" / "zentec031")]
+sys.modules["zentec031"] = package
+
+from zentec031.cli import main  # noqa: E402
+
+sys.exit(main())
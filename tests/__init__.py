@@ -0,0 +1 @@
+"""Tests for the Zentec 031 integration."""
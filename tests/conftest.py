@@ -0,0 +1,66 @@
+"""Fixtures for Zentec 031 tests.
+
+The integration runs unmodified in a test Home Assistant; only the pymodbus
+client under ``ZentecModbusApi`` is replaced by ``FakeModbusClient``, and
+time is driven by the ``freezer`` fixture; tests that need request latency
+hook ``FakeModbusClient.sleep`` to it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.zentec031.const import CONF_SCAN_INTERVAL, CONF_SLAVE_ID, DEFAULT_SCAN_INTERVAL, DOMAIN
+
+from .fake_bus import FakeModbusClient
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+def bus() -> Generator[FakeModbusClient]:
+    """Replace the Modbus client of every API built during the test."""
+    client = FakeModbusClient()
+    with patch("custom_components.zentec031.api.ZentecModbusApi._create_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def entry_options() -> dict[str, Any]:
+    """Options of the ``entry`` fixture; parametrize to override."""
+    return {}
+
+
+@pytest.fixture
+async def entry(
+    hass: HomeAssistant, bus: FakeModbusClient, entry_options: dict[str, Any]
+) -> AsyncGenerator[MockConfigEntry]:
+    """Set up one controller entry and unload it after the test."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="192.0.2.10:502:1",
+        data={
+            CONF_NAME: "Zentec 031",
+            CONF_HOST: "192.0.2.10",
+            CONF_PORT: 502,
+            CONF_SLAVE_ID: 1,
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+        },
+        options=entry_options,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
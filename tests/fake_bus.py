@@ -0,0 +1,97 @@
+"""In-memory stand-in for the pymodbus client, without Home Assistant."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import random
+
+# Default register map: fan speed 2, ventilation, 21.0 °C target, on, no alarms,
+# supply 18.0 °C, outdoor 5.0 °C, heating limits 15.0..30.0 °C.
+REGISTERS = {40000: 2, 40001: 1, 40002: 210, 40003: 1, 40009: 180, 50005: 50, 50008: 150, 50009: 300}
+
+
+class _Response:
+    def __init__(self, registers: list[int]) -> None:
+        self.registers = registers
+
+    def isError(self) -> bool:  # noqa: N802 - pymodbus API
+        return False
+
+
+class FakeModbusClient:
+    """pymodbus client stand-in serving a register image from memory.
+
+    While ``online`` is False the gateway is silent: connects fail and every
+    request raises, like pymodbus after its retries. Requests touching an
+    address in ``failing`` raise as well. Input registers are a separate
+    table, as on the controller.
+
+    Every request takes ``latency`` seconds give or take up to ``jitter``
+    times that, unless ``script`` holds latencies for the next requests. A
+    request slower than ``timeout`` fails after the timeout. The time passes
+    through ``sleep``, which does nothing by default; tests hook it to the
+    frozen clock. ``busy`` adds up the time spent on the bus.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, timeout: float = 10.0, seed: int = 0) -> None:
+        self.registers: dict[int, int] = dict(REGISTERS)
+        self.input_registers: dict[int, int] = {}
+        self.online = True
+        self.failing: set[int] = set()
+        self.connected = False
+        self.latency = latency
+        self.jitter = jitter
+        self.timeout = timeout
+        self.script: deque[float] = deque()
+        self.sleep: Callable[[float], None] = lambda seconds: None
+        self.busy = 0.0
+        self._random = random.Random(seed)
+        # Read and write requests that reached the bus, answered or not.
+        self.requests = 0
+        self.writes: list[tuple[int, list[int]]] = []
+
+    def connect(self) -> bool:
+        self.connected = self.online
+        return self.connected
+
+    def close(self) -> None:
+        self.connected = False
+
+    def read_holding_registers(self, address: int, count: int, device_id: int) -> _Response:
+        self._transact(address, count)
+        return _Response([self.registers.get(register, 0) for register in range(address, address + count)])
+
+    def read_input_registers(self, address: int, count: int, device_id: int) -> _Response:
+        self._transact(address, count)
+        return _Response([self.input_registers.get(register, 0) for register in range(address, address + count)])
+
+    def write_register(self, address: int, value: int, device_id: int) -> _Response:
+        return self.write_registers(address, [value], device_id)
+
+    def write_registers(self, address: int, values: list[int], device_id: int) -> _Response:
+        self._transact(address, len(values))
+        self.writes.append((address, list(values)))
+        self.registers.update(zip(range(address, address + len(values)), values))
+        return _Response(list(values))
+
+    def _transact(self, address: int, count: int) -> None:
+        self.requests += 1
+        if not self.online:
+            self._wait(self.timeout)
+            self.connected = False
+            raise ConnectionError("Fake gateway did not respond")
+        if self.script:
+            latency = self.script.popleft()
+        else:
+            latency = self.latency * (1 + self._random.uniform(-self.jitter, self.jitter))
+        if latency > self.timeout:
+            self._wait(self.timeout)
+            raise ConnectionError(f"Fake controller did not answer within {self.timeout} s")
+        self._wait(latency)
+        if not self.failing.isdisjoint(range(address, address + count)):
+            raise ConnectionError(f"Fake controller did not answer for {address}")
+
+    def _wait(self, seconds: float) -> None:
+        self.busy += seconds
+        self.sleep(seconds)
@@ -0,0 +1,277 @@
+"""Tests for ZentecModbusApi against a fake bus."""
+
+from __future__ import annotations
+
+import socket
+import struct
+import threading
+
+import pytest
+
+from custom_components.zentec031 import api as api_module
+from custom_components.zentec031.api import RegisterBlock, ZentecModbusApi, ZentecState, plan_range_reads, serial_timeout
+from custom_components.zentec031.const import (
+    CONF_BAUDRATE,
+    CONF_PARITY,
+    CONF_STOPBITS,
+    CONF_TRANSPORT,
+    TRANSPORT_RTU_OVER_TCP,
+    TRANSPORT_SERIAL,
+)
+from custom_components.zentec031.runtime_config import build_runtime_config
+
+from .fake_bus import FakeModbusClient
+
+
+def _api(bus: FakeModbusClient) -> ZentecModbusApi:
+    api = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), client=bus)
+    # Confirm the whole register image, as a poll does.
+    api.read_raw()
+    return api
+
+
+def test_write_values_leaves_unrequested_registers_alone() -> None:
+    """A mode set on the panel since the last poll survives a write of fan speed and power."""
+    bus = FakeModbusClient()
+    api = _api(bus)
+    bus.registers[40001] = 2
+
+    assert api.write_values({40000: 3, 40003: 0}) == 2
+    assert bus.writes == [(40000, [3]), (40003, [0])]
+    assert bus.registers[40001] == 2
+
+
+def test_write_values_bridges_skipped_requested_registers() -> None:
+    """A requested register that is already set joins its neighbours' request."""
+    bus = FakeModbusClient()
+    api = _api(bus)
+
+    assert api.write_values({40000: 4, 40001: 1, 40002: 22}) == 1
+    assert bus.writes == [(40000, [4, 1, 22])]
+
+
+def test_write_values_skips_confirmed_values_unless_forced() -> None:
+    """Confirmed values are not written again, unless forced."""
+    bus = FakeModbusClient()
+    api = _api(bus)
+
+    assert api.write_values({40000: 2}) == 0
+    assert api.write_values({40000: 2}, force=True) == 1
+    assert bus.writes == [(40000, [2])]
+
+
+def test_input_register_read_does_not_confirm_holding_register() -> None:
+    """An input register read at a holding register's address does not make a write look done."""
+    bus = FakeModbusClient()
+    bus.input_registers[40000] = 3
+    api = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), client=bus)
+
+    values, failed = api.read_registers(plan_range_reads([(40000, 40000)], input_registers=True))
+    assert values == {40000: 3}
+    assert not failed
+
+    assert api.write_values({40000: 3}) == 1
+    assert bus.writes == [(40000, [3])]
+
+
+def test_probe_round_trip_counts_answered_requests_only() -> None:
+    """A block that times out is reported failed and left out of the typical request time."""
+    bus = FakeModbusClient()
+    bus.failing.add(50005)
+    api = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), client=bus)
+
+    result = api.probe(60)
+
+    assert result.failed_addresses == [50005]
+    assert result.requests == 4
+    assert result.round_trip < 0.1
+    assert result.state.outdoor_temp is None
+    assert result.state.fan_speed == 2
+
+
+def test_probe_sends_nothing_that_could_overrun_the_budget() -> None:
+    """With no room for a request timeout left, blocks fail without being sent."""
+    bus = FakeModbusClient()
+    api = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), client=bus, timeout=3)
+
+    result = api.probe(1)
+
+    assert bus.requests == 0
+    assert len(result.failed_addresses) == result.requests
+    assert result.round_trip == 0.0
+    assert result.state == ZentecState()
+
+
+def test_plan_range_reads_merges_overlapping_and_adjacent_ranges() -> None:
+    """Ranges are sorted and merged; a gap of one register starts a new read."""
+    assert plan_range_reads([(50010, 50012), (50000, 50005), (50004, 50009), (50014, 50014)]) == (
+        RegisterBlock(50000, 13, False, ()),
+        RegisterBlock(50014, 1, False, ()),
+    )
+
+
+def test_plan_range_reads_splits_at_register_type_boundaries() -> None:
+    """With the type left to the address, a range crossing 30000 or 40000 splits there."""
+    assert plan_range_reads([(29998, 40001)]) == (
+        RegisterBlock(29998, 2, False, ()),
+        RegisterBlock(40000, 2, False, ()),
+        *(RegisterBlock(address, 125, True, ()) for address in range(30000, 39875, 125)),
+        RegisterBlock(39875, 125, True, ()),
+    )
+
+
+def test_plan_range_reads_chunks_and_honours_explicit_type() -> None:
+    """Long ranges are cut into reads of at most 125 registers of the requested type."""
+    assert plan_range_reads([(50000, 50299)], input_registers=True) == (
+        RegisterBlock(50000, 125, True, ()),
+        RegisterBlock(50125, 125, True, ()),
+        RegisterBlock(50250, 50, True, ()),
+    )
+
+
+def test_read_registers_reports_failed_blocks() -> None:
+    """Values come back by address; an unanswered block is returned instead of raising."""
+    bus = FakeModbusClient()
+    bus.failing.add(50200)
+    api = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), client=bus)
+    blocks = plan_range_reads([(50000, 50001), (50150, 50300)])
+
+    values, failed = api.read_registers(blocks)
+
+    assert values == {50000: 0, 50001: 0, **{address: 0 for address in range(50275, 50301)}}
+    assert failed == [RegisterBlock(50150, 125, False, ())]
+
+
+class _SocketClient(FakeModbusClient):
+    """Fake bus whose connection is a real socket pair, as the TCP client keeps one."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.socket: socket.socket | None = None
+        self.peer: socket.socket | None = None
+        self.connects = 0
+
+    def connect(self) -> bool:
+        self.socket, self.peer = socket.socketpair()
+        self.connects += 1
+        return super().connect()
+
+    def close(self) -> None:
+        if self.socket is not None:
+            self.socket.close()
+            self.peer.close()
+            self.socket = self.peer = None
+        super().close()
+
+
+def _answer_probe(peer: socket.socket) -> threading.Thread:
+    """Answer one register read on ``peer`` with the transaction id of the request."""
+
+    def answer() -> None:
+        request = peer.recv(256)
+        transaction, _, _, unit, function = struct.unpack_from(">HHHBB", request)
+        peer.sendall(struct.pack(">HHHBBBH", transaction, 0, 5, unit, function, 2, 1))
+
+    thread = threading.Thread(target=answer)
+    thread.start()
+    return thread
+
+
+def test_socket_closed_tells_fin_from_stale_bytes() -> None:
+    """Late responses are drained; only an orderly close or reset counts as closed."""
+    sock, peer = socket.socketpair()
+    try:
+        assert not ZentecModbusApi._socket_closed(sock)
+        peer.sendall(b"late response")
+        assert not ZentecModbusApi._socket_closed(sock)
+        sock.setblocking(False)
+        with pytest.raises(BlockingIOError):
+            sock.recv(1)
+        peer.close()
+        assert ZentecModbusApi._socket_closed(sock)
+    finally:
+        sock.close()
+
+
+def test_supervise_connection_reopens_socket_closed_by_peer() -> None:
+    """A gateway that closed the idle socket gets a fresh connection without a probe."""
+    bus = _SocketClient()
+    api = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), client=bus)
+    bus.connect()
+    bus.peer.close()
+
+    assert api.supervise_connection(probe_after=60) is True
+    assert bus.connects == 2
+    assert bus.connected
+
+
+def test_supervise_connection_probes_idle_link(monkeypatch: pytest.MonkeyPatch) -> None:
+    """After ``probe_after`` a one-register read checks the link; no answer drops the socket."""
+    bus = _SocketClient()
+    api = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), client=bus)
+    bus.connect()
+
+    thread = _answer_probe(bus.peer)
+    assert api.supervise_connection(probe_after=0) is True
+    thread.join()
+    assert bus.connects == 1
+
+    monkeypatch.setattr(api_module, "IDLE_PROBE_TIMEOUT", 0.05)
+    assert api.supervise_connection(probe_after=0) is False
+    # The silent socket was replaced by a new connection.
+    assert bus.connects == 2
+
+
+def test_supervise_connection_skips_while_busy() -> None:
+    """A running transaction is never interrupted by the supervisor."""
+    bus = _SocketClient()
+    api = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), client=bus)
+
+    with api._lock:
+        assert api.supervise_connection(probe_after=0) is None
+    assert bus.connects == 0
+
+
+@pytest.mark.parametrize(
+    ("line", "timeout"),
+    [
+        ({}, 0.5 + 256 * 10 / 9600),
+        ({CONF_BAUDRATE: 1200, CONF_PARITY: "E", CONF_STOPBITS: 2}, 0.5 + 256 * 12 / 1200),
+        ({CONF_BAUDRATE: 115200, CONF_PARITY: "O"}, 0.5 + 256 * 11 / 115200),
+    ],
+)
+def test_serial_timeout_covers_longest_frame(line: dict, timeout: float) -> None:
+    """The timeout is the turnaround plus a full-length frame at the line's bit rate."""
+    assert serial_timeout(line) == pytest.approx(timeout)
+
+
+def test_create_client_framer_per_transport() -> None:
+    """TCP speaks MBAP; RTU over TCP sends RTU frames over the same TCP client."""
+    from pymodbus.client import ModbusTcpClient
+    from pymodbus.framer import FramerRTU, FramerSocket
+
+    tcp = ZentecModbusApi("192.0.2.10", 502, build_runtime_config({}, {}), timeout=3)
+    rtu = ZentecModbusApi("192.0.2.10", 4001, build_runtime_config({CONF_TRANSPORT: TRANSPORT_RTU_OVER_TCP}, {}))
+
+    assert isinstance(tcp._client, ModbusTcpClient)
+    assert isinstance(tcp._client.framer, FramerSocket)
+    assert tcp._client.comm_params.timeout_connect == 3
+    assert isinstance(rtu._client, ModbusTcpClient)
+    assert isinstance(rtu._client.framer, FramerRTU)
+    assert rtu._client.comm_params.port == 4001
+
+
+def test_create_client_serial_caps_timeout() -> None:
+    """The serial client uses the line settings and never waits longer than the line needs."""
+    pytest.importorskip("serial")
+    from pymodbus.client import ModbusSerialClient
+    from pymodbus.framer import FramerRTU
+
+    line = {CONF_TRANSPORT: TRANSPORT_SERIAL, CONF_BAUDRATE: 19200, CONF_PARITY: "E", CONF_STOPBITS: 1}
+    api = ZentecModbusApi("/dev/ttyUSB0", 0, build_runtime_config(line, {}), timeout=10)
+
+    assert isinstance(api._client, ModbusSerialClient)
+    assert isinstance(api._client.framer, FramerRTU)
+    params = api._client.comm_params
+    assert (params.host, params.baudrate, params.parity, params.stopbits) == ("/dev/ttyUSB0", 19200, "E", 1)
+    assert params.timeout_connect == pytest.approx(serial_timeout(line))
@@ -0,0 +1,114 @@
+"""Tests for columnar batch decoding."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from custom_components.zentec031.api import ZentecModbusApi, ZentecState
+from custom_components.zentec031.batch import ALARM_COLUMNS, MISSING, decode_batch, export_raw_records
+from custom_components.zentec031.const import (
+    ALL_REGISTERS,
+    CONF_SUPPLY_TEMP_DIVISOR,
+    CONF_TEMPERATURE_DIVISOR,
+    REG_ALARM_1,
+    REG_ALARM_2,
+    REG_SUPPLY_TEMP,
+)
+from custom_components.zentec031.runtime_config import build_runtime_config
+
+from .fake_bus import FakeModbusClient
+
+np = pytest.importorskip("numpy")
+
+
+def _row_state(columns: dict, row: int) -> ZentecState:
+    """Turn one row of ``decode_batch`` columns back into a state."""
+    values = {}
+    for name, column in columns.items():
+        if name not in ZentecState.__dataclass_fields__:
+            continue
+        value = column[row].item()
+        if isinstance(value, float):
+            values[name] = None if math.isnan(value) else value
+        else:
+            values[name] = None if value == MISSING else value
+    if values["power"] is not None:
+        values["power"] = bool(values["power"])
+    return ZentecState(**values)
+
+
+@pytest.mark.parametrize(("divisor", "supply_divisor"), [(10, 10), (1, 100), (20, 1000)])
+def test_decode_batch_matches_decode(divisor: int, supply_divisor: int) -> None:
+    """Every row decodes exactly as ``ZentecModbusApi.decode``, ties and negatives included."""
+    config = build_runtime_config({}, {CONF_TEMPERATURE_DIVISOR: divisor, CONF_SUPPLY_TEMP_DIVISOR: supply_divisor})
+    api = ZentecModbusApi("192.0.2.10", 502, config, client=FakeModbusClient())
+    rng = np.random.default_rng(0)
+    images = rng.integers(0, 0x10000, size=(2000, len(ALL_REGISTERS)))
+    images[rng.random(images.shape) < 0.1] = MISSING
+    # Ties of the divisors, e.g. 0.15 and -0.25.
+    images[:4, ALL_REGISTERS.index(REG_SUPPLY_TEMP)] = [15 * supply_divisor // 100, 0x10000 - 25 * supply_divisor // 100, 0x7FFF, 0x8000]
+
+    columns = decode_batch(images, divisor, supply_divisor)
+
+    for row, image in enumerate(images.tolist()):
+        expected = api.decode({key: None if value == MISSING else value for key, value in zip(ALL_REGISTERS, image)})
+        assert _row_state(columns, row) == expected
+
+
+def test_decode_batch_per_row_divisors() -> None:
+    """Rows of one batch can carry different divisors."""
+    images = np.full((2, len(ALL_REGISTERS)), MISSING)
+    images[:, ALL_REGISTERS.index(REG_SUPPLY_TEMP)] = 215
+
+    columns = decode_batch(images, 10, np.array([10, 100]))
+
+    assert columns[REG_SUPPLY_TEMP].tolist() == [21.5, 2.1]
+
+
+def test_decode_batch_alarm_bits() -> None:
+    """Bit 0 of the first alarm word is E01, bit 0 of the second E17; unread words raise nothing."""
+    images = np.full((2, len(ALL_REGISTERS)), MISSING)
+    images[0, ALL_REGISTERS.index(REG_ALARM_1)] = 0b1
+    images[0, ALL_REGISTERS.index(REG_ALARM_2)] = 0x8001
+
+    columns = decode_batch(images)
+
+    raised = [name for name in ALARM_COLUMNS if columns[name][0]]
+    assert raised == ["alarm_e01", "alarm_e17", "alarm_e32"]
+    assert not any(columns[name][1] for name in ALARM_COLUMNS)
+
+
+def test_decode_batch_rejects_wrong_shape() -> None:
+    """Images must have one column per register."""
+    with pytest.raises(ValueError, match="Expected an"):
+        decode_batch(np.zeros((3, 2)))
+
+
+def test_export_csv_in_chunks(tmp_path: Path) -> None:
+    """Chunks share one header and unread registers become empty cells."""
+    lines = [
+        json.dumps(
+            {
+                "time": f"2026-01-01T00:00:0{second}.000+00:00",
+                "device": "ahu",
+                CONF_TEMPERATURE_DIVISOR: 10,
+                CONF_SUPPLY_TEMP_DIVISOR: 10,
+                "registers": {REG_SUPPLY_TEMP: 180 + second} if second else {},
+            }
+        )
+        for second in range(3)
+    ]
+    path = tmp_path / "out.csv"
+
+    assert export_raw_records([io.StringIO("\n".join(lines) + "\n")], path, chunk_size=2) == 3
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row[REG_SUPPLY_TEMP] for row in rows] == ["", "18.1", "18.2"]
+    assert rows[0]["alarm_e01"] == "0"
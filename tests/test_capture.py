@@ -0,0 +1,148 @@
+"""Tests for traffic capture files, request pairing and replay."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import struct
+import time
+
+from custom_components.zentec031.api import crc16
+from custom_components.zentec031.capture import (
+    FRAMER_RTU,
+    FRAMER_SOCKET,
+    MAGIC,
+    CaptureRecord,
+    CaptureWriter,
+    Exchange,
+    ReplayServer,
+    pair_exchanges,
+    read_capture,
+)
+
+_MBAP = struct.Struct(">HHHB")
+
+
+def _tcp(transaction: int, pdu: bytes, unit: int = 1) -> bytes:
+    return _MBAP.pack(transaction, 0, 1 + len(pdu), unit) + pdu
+
+
+def _rtu(frame: bytes) -> bytes:
+    return frame + crc16(frame).to_bytes(2, "little")
+
+
+def test_capture_round_trip(tmp_path: Path) -> None:
+    """Records and the framer survive writing and reading."""
+    path = tmp_path / "nested" / "capture.zcap"
+    writer = CaptureWriter(path, FRAMER_RTU)
+    writer.record(True, b"\x01\x03\x9c\x40\x00\x01")
+    writer.record(False, b"\x01\x03\x02\x00\x02")
+    writer.close()
+    # Packets recorded after closing are dropped.
+    writer.record(True, b"late")
+
+    started, framer, records = read_capture(path)
+
+    assert started > 0
+    assert framer == FRAMER_RTU
+    assert [(record.sending, record.data) for record in records] == [
+        (True, b"\x01\x03\x9c\x40\x00\x01"),
+        (False, b"\x01\x03\x02\x00\x02"),
+    ]
+    assert records[0].offset <= records[1].offset
+
+
+def test_version_1_capture_is_modbus_tcp(tmp_path: Path) -> None:
+    """Files written before the framer was recorded still read, as Modbus TCP."""
+    path = tmp_path / "old.zcap"
+    path.write_bytes(struct.pack("<4sBd", MAGIC, 1, 1.0) + struct.pack("<BdH", 0, 0.5, 3) + b"abc")
+
+    assert read_capture(path) == (1.0, FRAMER_SOCKET, [CaptureRecord(0.5, True, b"abc")])
+
+
+def test_pair_tcp_by_transaction() -> None:
+    """Pipelined responses pair by transaction id; the last accumulated receive wins."""
+    first = _tcp(1, b"\x03\x9c\x40\x00\x07")
+    second = _tcp(2, b"\x03\x9c\x49\x00\x01")
+    second_response = _tcp(2, b"\x03\x02\x00\xb4")
+    records = [
+        CaptureRecord(0.0, True, first),
+        CaptureRecord(0.001, True, second),
+        CaptureRecord(0.010, False, second_response[:5]),
+        CaptureRecord(0.012, False, second_response + b"\x00"),
+    ]
+
+    assert pair_exchanges(records) == [
+        Exchange(first, None, 0.0),
+        Exchange(second, second_response, 0.011),
+    ]
+
+
+def test_pair_rtu_by_order_and_function() -> None:
+    """RTU receives belong to the last request with the same unit and function."""
+    read = _rtu(b"\x01\x03\x9c\x40\x00\x01")
+    read_response = _rtu(b"\x01\x03\x02\x00\x02")
+    write = _rtu(b"\x01\x06\x9c\x40\x00\x03")
+    write_error = _rtu(b"\x01\x86\x02")
+    stale = _rtu(b"\x01\x03\x02\x00\x05")
+    records = [
+        CaptureRecord(0.0, True, read),
+        CaptureRecord(0.02, False, read_response[:3]),
+        CaptureRecord(0.03, False, read_response),
+        CaptureRecord(0.10, True, write),
+        # A late answer to the read does not pair with the write.
+        CaptureRecord(0.11, False, stale),
+        CaptureRecord(0.13, False, write_error),
+        CaptureRecord(0.20, True, read),
+    ]
+
+    exchanges = pair_exchanges(records, FRAMER_RTU)
+
+    assert [(exchange.request, exchange.response) for exchange in exchanges] == [
+        (read, read_response),
+        (write, write_error),
+        (read, None),
+    ]
+    assert abs(exchanges[1].delay - 0.03) < 1e-9
+
+
+def test_replay_answers_queued_requests_concurrently() -> None:
+    """Pipelined requests get their captured delays in parallel, with their own transaction ids."""
+    first = _tcp(1, b"\x03\x9c\x40\x00\x01")
+    second = _tcp(2, b"\x03\x9c\x49\x00\x01")
+    server = ReplayServer(
+        [
+            Exchange(first, _tcp(1, b"\x03\x02\x00\x02"), 0.2),
+            Exchange(second, _tcp(2, b"\x03\x02\x00\xb4"), 0.2),
+        ]
+    )
+
+    async def _exchange() -> tuple[list[bytes], float]:
+        listener = await asyncio.start_server(server._handle_client, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        started = time.monotonic()
+        writer.write(_tcp(7, first[7:]) + _tcp(8, second[7:]))
+        responses = [await asyncio.wait_for(reader.readexactly(11), 2) for _ in range(2)]
+        elapsed = time.monotonic() - started
+        writer.close()
+        await writer.wait_closed()
+        listener.close()
+        await listener.wait_closed()
+        return responses, elapsed
+
+    responses, elapsed = asyncio.run(_exchange())
+
+    assert sorted(responses) == [_tcp(7, b"\x03\x02\x00\x02"), _tcp(8, b"\x03\x02\x00\xb4")]
+    assert elapsed < 0.35
+    assert server.served == 2
+
+
+def test_replay_rtu_unknown_request_gets_exception() -> None:
+    """Requests never captured get exception 02 with a valid CRC."""
+    server = ReplayServer([], scale=0, framer=FRAMER_RTU)
+
+    response = asyncio.run(server._respond(_rtu(b"\x01\x03\x00\x10\x00\x01")))
+
+    assert response == _rtu(b"\x01\x83\x02")
+    assert server.unmatched == 1
@@ -0,0 +1,67 @@
+"""Tests for the command line collector."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.zentec031.cli import load_inventory, main, percentile
+from custom_components.zentec031.const import CONF_READ_ONLY, CONF_SLAVE_ID, CONF_SUPPLY_TEMP_REGISTER
+
+from .fake_bus import FakeModbusClient
+
+
+def test_load_inventory_applies_defaults_and_overrides(tmp_path: Path) -> None:
+    """Comments and blank lines are skipped; columns override settings per row."""
+    inventory = tmp_path / "inventory.csv"
+    inventory.write_text(
+        "host,port,slave_id,name,supply_temp_register\n"
+        "# spare unit\n"
+        "192.0.2.10,,,,\n"
+        "\n"
+        "192.0.2.11,5020,7,AHU 2,40020\n",
+        encoding="utf-8",
+    )
+
+    first, second = load_inventory(str(inventory), slave_id=3)
+
+    assert (first.name, first.port, first.config[CONF_SLAVE_ID]) == ("192.0.2.10:502/3", 502, 3)
+    assert (second.name, second.port, second.config[CONF_SLAVE_ID]) == ("AHU 2", 5020, 7)
+    assert second.config[CONF_SUPPLY_TEMP_REGISTER] == 40020
+    # The collector never writes.
+    assert first.config[CONF_READ_ONLY] and second.config[CONF_READ_ONLY]
+
+
+def test_load_inventory_names_row_without_host(tmp_path: Path) -> None:
+    """A row without a host fails with the file and line, comments counted."""
+    inventory = tmp_path / "inventory.csv"
+    inventory.write_text("host,port\n192.0.2.10,502\n# spare\n,502\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match=r"inventory\.csv:4: missing host"):
+        load_inventory(str(inventory), slave_id=1)
+
+
+def test_percentile_nearest_rank() -> None:
+    """Percentiles pick the nearest rank of the sorted values."""
+    values = [float(value) for value in range(1, 11)]
+
+    assert [percentile(values, percent) for percent in (1, 50, 90, 99, 100)] == [1.0, 5.0, 9.0, 10.0, 10.0]
+
+
+def test_poll_writes_ndjson(tmp_path: Path) -> None:
+    """``poll`` reads every device and writes one decoded record per poll."""
+    bus = FakeModbusClient()
+    output = tmp_path / "out.ndjson"
+
+    with patch("custom_components.zentec031.api.ZentecModbusApi._create_client", return_value=bus):
+        assert main(["--host", "192.0.2.10:5020", "--slave-id", "2", "-n", "2", "--interval", "0", "-o", str(output)]) == 0
+
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 2
+    assert records[0]["device"] == "192.0.2.10:5020/2"
+    assert records[0]["ok"] is True
+    assert records[0]["supply_temp"] == 18.0
+    assert bus.writes == []
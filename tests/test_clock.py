@@ -0,0 +1,48 @@
+"""Tests for the controller clock registers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.zentec031.api import ControllerClock
+
+
+def test_clock_round_trips_through_registers() -> None:
+    """Encoding and decoding keep every field, negative zones included."""
+    moment = datetime(2026, 3, 1, 23, 59, 59, 600_000, tzinfo=timezone(timedelta(hours=-5)))
+
+    clock = ControllerClock.from_datetime(moment)
+
+    # Rounded to the next second, which is the next day.
+    assert clock == ControllerClock(26, 3, 2, 1, 0, 0, 0, utc_offset=-5)
+    assert clock.to_registers() == [26, 3, 2, 1, 0, 0, 0, 0xFB]
+    assert ControllerClock.from_registers(clock.to_registers()) == clock
+
+
+def test_clock_ignores_register_high_bytes() -> None:
+    """Only the low byte of each register carries a field."""
+    clock = ControllerClock.from_registers([0x1A1A, 0x0A, 0x13, 0x01, 0x0C, 0x00, 0x00, 0xFF03])
+
+    assert clock == ControllerClock(26, 10, 19, 1, 12, 0, 0, utc_offset=3)
+
+
+def test_clock_rounds_partial_hour_zones() -> None:
+    """Offsets that are not whole hours go to the nearest hour, half hours up."""
+    def offset(hours: int, minutes: int) -> int:
+        zone = timezone(timedelta(hours=hours, minutes=minutes))
+        return ControllerClock.from_datetime(datetime(2026, 10, 19, 12, tzinfo=zone)).utc_offset
+
+    assert offset(5, 30) == 6
+    assert offset(5, 45) == 6
+    assert offset(9, 30) == 10
+    assert offset(-3, -30) == -3
+    assert offset(3, 0) == 3
+
+
+def test_clock_drift() -> None:
+    """Drift is the controller's lead over local wall time; None for a cleared clock."""
+    reference = datetime(2026, 10, 19, 12, 0, 0, tzinfo=timezone(timedelta(hours=3)))
+
+    assert ControllerClock(26, 10, 19, 1, 12, 0, 42, 3).drift(reference) == 42
+    assert ControllerClock(26, 10, 19, 1, 11, 59, 0, 3).drift(reference) == -60
+    assert ControllerClock(0, 0, 0, 0, 0, 0, 0, 0).drift(reference) is None
@@ -0,0 +1,185 @@
+"""Tests for ZentecCoordinator scheduling against a fake bus."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_capture_events, async_fire_time_changed
+
+from custom_components.zentec031.const import (
+    DEFAULT_SCAN_INTERVAL,
+    EVENT_ALARM,
+    GATEWAY_FAILURE_THRESHOLD,
+    GATEWAY_PROBE_INTERVAL,
+    REG_ALARM_3,
+    REG_FAN_SPEED,
+    REG_POWER,
+    REG_SUPPLY_TEMP,
+)
+from custom_components.zentec031.coordinator import ZentecCoordinator
+
+from .fake_bus import FakeModbusClient
+
+# The coordinator schedules the next poll up to a second past the interval.
+POLL = timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+# Clock resolution of the long runs.
+STEP = timedelta(seconds=0.5)
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, delta: timedelta) -> None:
+    freezer.tick(delta)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_poll_reads_plan_once_per_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Every scan interval costs exactly one request per read plan block."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    assert coordinator.data.fan_speed == 2
+    requests = bus.requests
+
+    for _ in range(6):
+        await _advance(hass, freezer, POLL)
+
+    assert bus.requests - requests == 6 * len(coordinator.api.read_plan)
+    assert coordinator.poll_stats.failures == 0
+
+
+
+async def test_cadence_and_latency_with_jittery_bus(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Over an hour of 80 ms ± 50 % requests, polls keep their interval and latency bound."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    latency, jitter = 0.08, 0.5
+    bus.latency, bus.jitter = latency, jitter
+    bus.sleep = lambda seconds: freezer.tick(timedelta(seconds=seconds))
+    bound = len(coordinator.api.read_plan) * latency * (1 + jitter)
+    polls: list[tuple[datetime, float, float]] = []
+    seen, busy = coordinator.register_poll, bus.busy
+
+    @callback
+    def _record() -> None:
+        nonlocal seen, busy
+        if coordinator.register_poll != seen:
+            polls.append((dt_util.utcnow(), bus.busy - busy, coordinator.poll_stats.last_seconds))
+            seen, busy = coordinator.register_poll, bus.busy
+
+    remove_listener = coordinator.async_add_listener(_record)
+    for _ in range(int(timedelta(hours=1) / STEP)):
+        await _advance(hass, freezer, STEP)
+    remove_listener()
+
+    assert len(polls) >= timedelta(hours=1) / timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1 + bound + STEP.total_seconds())
+    assert all(on_bus <= bound and measured <= bound for _, on_bus, measured in polls)
+    # The next poll is due ``interval`` after the last one ended, from a whole second plus up to one second.
+    gaps = [(later - earlier).total_seconds() for (earlier, _, _), (later, _, _) in zip(polls, polls[1:])]
+    assert min(gaps) >= DEFAULT_SCAN_INTERVAL - 1
+    assert max(gaps) <= DEFAULT_SCAN_INTERVAL + 1 + bound + STEP.total_seconds()
+    assert coordinator.poll_stats.failures == 0
+
+
+async def test_scripted_timeout_fails_one_block(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """A request slower than the timeout costs the timeout; its block keeps the last value."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    bus.sleep = lambda seconds: freezer.tick(timedelta(seconds=seconds))
+    blocks = len(coordinator.api.read_plan)
+    supply = coordinator.api.register_map[REG_SUPPLY_TEMP]
+    assert [block.address for block in coordinator.api.read_plan].index(supply) == 1
+    bus.registers[supply] = 190
+    bus.script.extend([0.05, bus.timeout + 1, *[0.05] * (blocks - 2)])
+    busy = bus.busy
+
+    await _advance(hass, freezer, POLL)
+
+    assert bus.busy - busy == pytest.approx(0.05 * (blocks - 1) + bus.timeout)
+    assert coordinator.last_update_success
+    assert coordinator.data.supply_temp == 18.0
+
+    await _advance(hass, freezer, POLL)
+    assert coordinator.data.supply_temp == 19.0
+
+async def test_write_requests_refresh_unless_skipped(
+    hass: HomeAssistant, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """A sent write is followed by a poll; a write of the confirmed value touches nothing unless forced."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    address = coordinator.api.register_map[REG_FAN_SPEED]
+    requests = bus.requests
+
+    await coordinator.async_set_fan_speed(3)
+    await hass.async_block_till_done()
+    assert bus.writes == [(address, [3])]
+    assert bus.requests - requests == 1 + len(coordinator.api.read_plan)
+    assert coordinator.data.fan_speed == 3
+
+    requests = bus.requests
+    await coordinator.async_set_fan_speed(3)
+    await hass.async_block_till_done()
+    assert bus.requests == requests
+
+    await coordinator.async_set_fan_speed(3, force=True)
+    await hass.async_block_till_done()
+    assert bus.writes == [(address, [3]), (address, [3])]
+
+
+async def test_writes_in_cooldown_share_one_refresh(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """A write during the refresh cooldown does not poll until the cooldown ends."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    await coordinator.async_set_fan_speed(3)
+    await hass.async_block_till_done()
+    requests = bus.requests
+
+    await coordinator.async_set_power(False)
+    await hass.async_block_till_done()
+    assert bus.requests == requests + 1
+    assert bus.writes[-1] == (coordinator.api.register_map[REG_POWER], [0])
+    assert coordinator.data.power is True
+
+    await _advance(hass, freezer, POLL)
+    assert coordinator.data.power is False
+
+
+async def test_gateway_outage_pauses_bus(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """A silent gateway opens the breaker; polls leave the bus alone until a probe gets an answer."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    bus.online = False
+    for _ in range(GATEWAY_FAILURE_THRESHOLD):
+        await _advance(hass, freezer, POLL)
+    assert coordinator.gateway_open
+    assert not coordinator.last_update_success
+
+    requests = bus.requests
+    for _ in range(3):
+        await _advance(hass, freezer, POLL)
+    assert bus.requests == requests
+
+    bus.online = True
+    await _advance(hass, freezer, timedelta(seconds=2 * GATEWAY_PROBE_INTERVAL))
+    assert not coordinator.gateway_open
+    assert coordinator.last_update_success
+
+
+async def test_alarm_events_without_alarm_entities(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """E33 fires its event although the E17..E48 entities are disabled by default."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    events = async_capture_events(hass, EVENT_ALARM)
+
+    bus.registers[coordinator.api.register_map[REG_ALARM_3]] = 0x0001
+    await _advance(hass, freezer, POLL)
+
+    assert [(event.data["code"], event.data["active"]) for event in events] == [("E33", True)]
@@ -0,0 +1,117 @@
+"""Tests for the gateway circuit breaker."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.zentec031.api import ZentecModbusApi
+from custom_components.zentec031.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_SLAVE_ID,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    GATEWAY_PROBE_INTERVAL,
+    GATEWAY_PROBE_MAX_INTERVAL,
+)
+from custom_components.zentec031.coordinator import ZentecCoordinator
+
+from .fake_bus import FakeModbusClient
+
+STEP = timedelta(seconds=1)
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, delta: timedelta) -> None:
+    freezer.tick(delta)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def _add_unit(hass: HomeAssistant, port: int, slave_id: int) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=f"192.0.2.10:{port}:{slave_id}",
+        data={
+            CONF_NAME: f"Zentec 031 {slave_id}",
+            CONF_HOST: "192.0.2.10",
+            CONF_PORT: port,
+            CONF_SLAVE_ID: slave_id,
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_entries_share_gateway_by_host_and_port(
+    hass: HomeAssistant, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Units behind one host and port join one breaker, which goes away with its last unit."""
+    first: ZentecCoordinator = entry.runtime_data
+    second = await _add_unit(hass, 502, 2)
+    other = await _add_unit(hass, 5020, 1)
+
+    assert first.gateway is second.runtime_data.gateway
+    assert first.gateway.members == [first, second.runtime_data]
+    assert other.runtime_data.gateway is not first.gateway
+
+    gateway = other.runtime_data.gateway
+    assert await hass.config_entries.async_unload(other.entry_id)
+    assert gateway.members == []
+    assert await hass.config_entries.async_unload(second.entry_id)
+    assert first.gateway.members == [first]
+
+
+async def test_probe_backs_off_and_rotates_members(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+    bus: FakeModbusClient,
+    entry: MockConfigEntry,
+) -> None:
+    """While open, one probe at a time doubles its delay up to the cap and takes turns among units."""
+    second = await _add_unit(hass, 502, 2)
+    coordinators: list[ZentecCoordinator] = [entry.runtime_data, second.runtime_data]
+    gateway = coordinators[0].gateway
+    probes: list[tuple[datetime, ZentecModbusApi]] = []
+    for coordinator in coordinators:
+        api = coordinator.api
+
+        def _check_link(api: ZentecModbusApi = api, check_link: Callable[[], bool] = api.check_link) -> bool:
+            probes.append((dt_util.utcnow(), api))
+            return check_link()
+
+        monkeypatch.setattr(api, "check_link", _check_link)
+
+    bus.online = False
+    while not gateway.is_open:
+        await _advance(hass, freezer, STEP)
+    opened = dt_util.utcnow()
+    assert not any(coordinator.last_update_success for coordinator in coordinators)
+
+    delays = [GATEWAY_PROBE_INTERVAL * 2**power for power in range(5)]
+    delays = [min(delay, GATEWAY_PROBE_MAX_INTERVAL) for delay in (*delays, GATEWAY_PROBE_MAX_INTERVAL)]
+    for _ in range(int(sum(delays) + len(delays))):
+        await _advance(hass, freezer, STEP)
+
+    times = [opened, *(at for at, _ in probes)]
+    gaps = [(later - earlier).total_seconds() for earlier, later in zip(times, times[1:])]
+    assert len(gaps) == len(delays)
+    for gap, delay in zip(gaps, delays):
+        assert delay <= gap <= delay + 2 * STEP.total_seconds()
+    assert [api for _, api in probes] == [coordinator.api for coordinator in coordinators] * 3
+
+    bus.online = True
+    await _advance(hass, freezer, timedelta(seconds=GATEWAY_PROBE_MAX_INTERVAL + 1))
+    assert not gateway.is_open
+    assert all(coordinator.last_update_success for coordinator in coordinators)
+    assert await hass.config_entries.async_unload(second.entry_id)
@@ -0,0 +1,64 @@
+"""Tests for entry setup and options applied to a running entry."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.zentec031.const import (
+    CONF_MAX_FAN_SPEED,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONF_SUPPLY_TEMP_REGISTER,
+    DEFAULT_MAX_FAN_SPEED,
+)
+from custom_components.zentec031.coordinator import ZentecCoordinator
+
+from .fake_bus import FakeModbusClient
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_options_apply_without_reload(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Interval, sampler and register map options change the running coordinator in place."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    bus.registers[40020] = 250
+
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_SCAN_INTERVAL: 30, CONF_SAMPLE_INTERVAL: 5, CONF_SUPPLY_TEMP_REGISTER: 40020}
+    )
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data is coordinator
+    assert entry.state is ConfigEntryState.LOADED
+    assert coordinator.update_interval == timedelta(seconds=30)
+    assert coordinator.sampler is not None
+    # The options refresh already read the new register.
+    assert coordinator.data.supply_temp == 25.0
+
+    polls = coordinator.poll_stats.polls
+    await _advance(hass, freezer, 20)
+    assert coordinator.poll_stats.polls == polls
+    await _advance(hass, freezer, 11)
+    assert coordinator.poll_stats.polls == polls + 1
+
+async def test_entity_set_options_reload(hass: HomeAssistant, bus: FakeModbusClient, entry: MockConfigEntry) -> None:
+    """Changing the fan speed count adds entities, so the entry reloads."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+
+    hass.config_entries.async_update_entry(entry, options={CONF_MAX_FAN_SPEED: DEFAULT_MAX_FAN_SPEED - 2})
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data is not coordinator
+    assert entry.runtime_data.api.config[CONF_MAX_FAN_SPEED] == DEFAULT_MAX_FAN_SPEED - 2
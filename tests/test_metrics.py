@@ -0,0 +1,82 @@
+"""Tests for the streaming derived metrics."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.zentec031.api import ZentecState
+from custom_components.zentec031.metrics import HOUR, DerivedMetrics, RollingAverage
+
+HEAT = 2
+
+
+def _state(**values: object) -> ZentecState:
+    defaults: dict[str, object] = {
+        "power": True,
+        "fan_speed": 2,
+        "mode_raw": 1,
+        "supply_temp": 20.0,
+        "outdoor_temp": 5.0,
+    }
+    return ZentecState(**(defaults | values))
+
+
+def test_rolling_average_is_time_weighted() -> None:
+    """Values count by how long they were observed."""
+    average = RollingAverage(HOUR, 60)
+    assert average.value is None
+
+    average.add(60, 10.0, 60)
+    average.add(240, 20.0, 180)
+
+    assert average.value == pytest.approx(17.5)
+
+
+def test_rolling_average_drops_expired_buckets() -> None:
+    """Buckets older than the span leave the average."""
+    average = RollingAverage(HOUR, 60)
+    average.add(60, 10.0, 60)
+    average.add(HOUR + 120, 30.0, 60)
+
+    assert average.value == pytest.approx(30.0)
+
+    # A jump past the whole window clears every bucket once.
+    average.add(10 * HOUR, 40.0, 60)
+    assert average.value == pytest.approx(40.0)
+
+
+def test_fan_runtime_and_duty_attribute_intervals_to_their_start() -> None:
+    """Each interval counts for the state at its start; long gaps are skipped."""
+    metrics = DerivedMetrics()
+    metrics.update(0, _state(fan_speed=1, mode_raw=HEAT), HEAT, 300)
+    metrics.update(60, _state(fan_speed=3, mode_raw=1), HEAT, 300)
+    metrics.update(180, _state(fan_speed=3, power=False), HEAT, 300)
+    metrics.update(240, _state(fan_speed=3), HEAT, 300)
+    # Missed polls: this hour is not attributed to anything.
+    metrics.update(240 + HOUR, _state(fan_speed=3), HEAT, 300)
+
+    assert metrics.fan_runtime == {1: 60.0, 3: 120.0}
+    assert metrics.heating_duty.value == pytest.approx(60 / 240)
+    assert metrics.temperature_delta == 15.0
+
+
+def test_metrics_checkpoint_round_trip() -> None:
+    """A restored checkpoint continues with the same values."""
+    metrics = DerivedMetrics()
+    for second in range(0, 600, 30):
+        metrics.update(second, _state(supply_temp=20.0 + second / 100), HEAT, 300)
+
+    restored = DerivedMetrics()
+    restored.restore(metrics.as_dict())
+
+    assert restored.fan_runtime == metrics.fan_runtime
+    assert restored.supply_avg_1h.value == pytest.approx(metrics.supply_avg_1h.value)
+    assert restored.heating_duty.value == pytest.approx(metrics.heating_duty.value)
+
+
+def test_restore_ignores_mismatched_buckets() -> None:
+    """A checkpoint from a different bucket layout is not loaded."""
+    average = RollingAverage(HOUR, 60)
+    average.restore({"epoch": 1, "sums": [1.0] * 10, "weights": [1.0] * 10})
+
+    assert average.value is None
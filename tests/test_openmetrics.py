@@ -0,0 +1,93 @@
+"""Tests for the OpenMetrics exposition."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from custom_components.zentec031.api import TransactionStats, ZentecState
+from custom_components.zentec031.const import CONF_METRICS_EXPORT
+from custom_components.zentec031.coordinator import PollStats
+from custom_components.zentec031.metrics_view import METRICS_URL
+from custom_components.zentec031.openmetrics import CONTENT_TYPE, ExportedDevice, format_labels, render_openmetrics
+
+from .fake_bus import FakeModbusClient
+
+
+def _device(name: str, state: ZentecState | None) -> ExportedDevice:
+    return ExportedDevice(
+        labels=format_labels({"name": name}),
+        available=state is not None,
+        gateway_open=False,
+        state=state,
+        polls=PollStats(polls=3, failures=1, seconds=0.25, last_seconds=0.05, last_success=1760000000.5),
+        transactions=TransactionStats(reads=12, read_errors=1, read_seconds=0.2, writes=2),
+    )
+
+
+def test_format_labels_escapes_values() -> None:
+    """Backslashes, quotes and newlines in label values are escaped."""
+    assert format_labels({"name": 'AHU "2"\\roof\nwest', "slave_id": "1"}) == (
+        'name="AHU \\"2\\"\\\\roof\\nwest",slave_id="1"'
+    )
+
+
+def test_render_groups_samples_by_family() -> None:
+    """Each family has its metadata once, then the samples of every device; the text ends with EOF."""
+    text = render_openmetrics(
+        [_device("a", ZentecState(power=True, supply_temp=18.5, alarm_code=5)), _device("b", None)]
+    )
+    lines = text.split("\n")
+
+    assert text.endswith("# EOF\n")
+    assert lines.count("# TYPE zentec_up gauge") == 1
+    up = lines.index("# TYPE zentec_up gauge")
+    assert lines[up + 1 : up + 4] == [
+        "# HELP zentec_up 1 if the last poll succeeded.",
+        'zentec_up{name="a"} 1',
+        'zentec_up{name="b"} 0',
+    ]
+    assert 'zentec_power{name="a"} 1' in lines
+    assert 'zentec_alarm_word{name="a",word="1"} 5' in lines
+    supply = lines.index("# TYPE zentec_supply_temperature_celsius gauge")
+    assert lines[supply + 2 : supply + 4] == [
+        "# UNIT zentec_supply_temperature_celsius celsius",
+        'zentec_supply_temperature_celsius{name="a"} 18.5',
+    ]
+    assert 'zentec_polls_total{name="b"} 3' in lines
+    assert 'zentec_modbus_reads_total{name="a"} 12' in lines
+    # Values that are not known are left out instead of rendered as NaN.
+    assert not any(line.startswith("zentec_outdoor_temperature_celsius") for line in lines)
+    assert not any('name="b"' in line for line in lines if line.startswith("zentec_power"))
+
+
+def test_render_without_devices() -> None:
+    """An empty fleet still renders valid metadata and the EOF marker."""
+    text = render_openmetrics([])
+
+    assert text.endswith("\n# EOF\n")
+    assert not any(line and not line.startswith("#") for line in text.split("\n"))
+
+
+@pytest.mark.parametrize("entry_options", [{CONF_METRICS_EXPORT: True}])
+async def test_metrics_endpoint(
+    hass: HomeAssistant,
+    bus: FakeModbusClient,
+    entry: MockConfigEntry,
+    hass_client: ClientSessionGenerator,
+    hass_client_no_auth: ClientSessionGenerator,
+) -> None:
+    """The endpoint serves entries with export enabled to authenticated clients only."""
+    response = await (await hass_client_no_auth()).get(METRICS_URL)
+    assert response.status == 401
+
+    response = await (await hass_client()).get(METRICS_URL)
+    assert response.status == 200
+    assert response.headers["Content-Type"] == CONTENT_TYPE
+    text = await response.text()
+    labels = f'entry_id="{entry.entry_id}",name="{entry.title}",gateway="192.0.2.10:502",slave_id="1"'
+    assert f"zentec_up{{{labels}}} 1" in text
+    assert f"zentec_supply_temperature_celsius{{{labels}}} 18.0" in text
+    assert text.endswith("# EOF\n")
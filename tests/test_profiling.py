@@ -0,0 +1,91 @@
+"""Tests for on-demand profiling."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import pstats
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.zentec031.const import DOMAIN
+from custom_components.zentec031.coordinator import ZentecCoordinator
+from custom_components.zentec031.profiling import HookTiming, ProfilingSession
+
+from .fake_bus import FakeModbusClient
+
+
+def _poll() -> list[int]:
+    return [value * 2 for value in range(1000)]
+
+
+def test_session_profiles_hooks_and_writes_files(tmp_path: Path) -> None:
+    """Profiled calls end up in the pstats file; the snapshot is saved and tracing stops."""
+    assert not tracemalloc.is_tracing()
+    session = ProfilingSession(tmp_path / "out" / "poll.pstats", tmp_path / "out" / "poll.tracemalloc")
+
+    assert session.run("update_bus", _poll)[-1] == 1998
+    session.wrap("update_bus", _poll)()
+    timings = session.finish()
+
+    assert timings["update_bus"]["calls"] == 2
+    assert timings["update_bus_queue"]["calls"] == 1
+    functions = {name for _, _, name in pstats.Stats(str(session.stats_path)).stats}
+    assert "_poll" in functions
+    assert tracemalloc.Snapshot.load(str(session.allocations_path)).traces
+    assert not tracemalloc.is_tracing()
+
+
+def test_session_leaves_foreign_tracemalloc_running(tmp_path: Path) -> None:
+    """tracemalloc started by someone else keeps running after the session."""
+    tracemalloc.start()
+    try:
+        session = ProfilingSession(tmp_path / "poll.pstats", tmp_path / "poll.tracemalloc")
+        session.finish()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_overlapping_sections_are_only_timed(tmp_path: Path) -> None:
+    """A section that starts while another is profiled runs unprofiled but is still timed."""
+    session = ProfilingSession(tmp_path / "poll.pstats", tmp_path / "poll.tracemalloc")
+
+    assert session.run("state_write", session.run, "update_bus", _poll)[0] == 0
+    timings = session.finish()
+
+    assert timings["state_write"]["calls"] == timings["update_bus"]["calls"] == 1
+
+
+def test_hook_timing_in_milliseconds() -> None:
+    """Timings are reported in milliseconds with the mean over all calls."""
+    timing = HookTiming()
+    assert timing.as_dict() == {"calls": 0, "total_ms": 0.0, "mean_ms": 0.0, "max_ms": 0.0}
+    timing.add(0.002)
+    timing.add(0.004)
+    assert timing.as_dict() == {"calls": 2, "total_ms": 6.0, "mean_ms": 3.0, "max_ms": 4.0}
+
+
+async def test_profiling_services_time_polls(
+    hass: HomeAssistant, tmp_path: Path, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """A poll while profiling shows up as executor queueing, bus time and state writes."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    hass.config.config_dir = str(tmp_path)
+    target = {"config_entry_id": entry.entry_id}
+
+    started = await hass.services.async_call(
+        DOMAIN, "start_profiling", {**target, "duration": 60}, blocking=True, return_response=True
+    )
+    await coordinator.async_refresh()
+    stopped = await hass.services.async_call(DOMAIN, "stop_profiling", target, blocking=True, return_response=True)
+
+    assert stopped["stats"] == started["stats"]
+    assert Path(stopped["stats"]).parent == tmp_path / DOMAIN
+    assert Path(stopped["allocations"]).is_file()
+    assert {"update", "update_bus", "update_bus_queue", "state_write"} <= stopped["timings"].keys()
+    assert stopped["timings"]["update_bus"]["calls"] == 1
+    assert await hass.services.async_call(
+        DOMAIN, "stop_profiling", target, blocking=True, return_response=True
+    ) == {"stats": None, "allocations": None, "timings": {}}
@@ -0,0 +1,80 @@
+"""Tests for the deadband and rate limit of published sensor values."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+import pytest
+
+from custom_components.zentec031.const import (
+    CONF_SUPPLY_TEMP_DEADBAND,
+    CONF_SUPPLY_TEMP_MAX_SILENCE,
+    DEFAULT_SCAN_INTERVAL,
+    REG_SUPPLY_TEMP,
+)
+from custom_components.zentec031.coordinator import PublishFilter, ZentecCoordinator
+
+from .fake_bus import FakeModbusClient
+
+
+def test_deadband_holds_small_changes() -> None:
+    """Changes below the deadband keep the published value; the reference is the last published one."""
+    publish = PublishFilter(deadband=0.5, min_interval=0, max_silence=0)
+
+    assert publish.apply(20.0, 0) == 20.0
+    assert publish.apply(20.3, 10) == 20.0
+    assert publish.apply(20.4, 20) == 20.0
+    assert publish.apply(20.5, 30) == 20.5
+    assert publish.apply(20.1, 40) == 20.5
+
+
+def test_min_interval_limits_rate() -> None:
+    """A changed value waits until min_interval has passed since the last publish."""
+    publish = PublishFilter(deadband=0, min_interval=60, max_silence=0)
+
+    assert publish.apply(20.0, 0) == 20.0
+    assert publish.apply(21.0, 30) == 20.0
+    assert publish.apply(21.0, 60) == 21.0
+    assert publish.apply(22.0, 90) == 21.0
+
+
+def test_max_silence_forces_heartbeat() -> None:
+    """After max_silence any change is published, however small."""
+    publish = PublishFilter(deadband=1.0, min_interval=0, max_silence=300)
+
+    assert publish.apply(20.0, 0) == 20.0
+    assert publish.apply(20.2, 299) == 20.0
+    assert publish.apply(20.2, 300) == 20.2
+
+
+def test_unknown_values_pass_through() -> None:
+    """Losing and regaining a value is always published."""
+    publish = PublishFilter(deadband=5.0, min_interval=600, max_silence=0)
+
+    assert publish.apply(20.0, 0) == 20.0
+    assert publish.apply(None, 10) is None
+    assert publish.apply(20.1, 20) == 20.1
+
+
+@pytest.mark.parametrize("entry_options", [{CONF_SUPPLY_TEMP_DEADBAND: 0.5, CONF_SUPPLY_TEMP_MAX_SILENCE: 0}])
+async def test_filter_applies_to_sensor_only(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Coordinator data stays raw for derived metrics; the sensor state is filtered."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    entity_id = er.async_get(hass).async_get_entity_id("sensor", "zentec031", f"{entry.entry_id}_supply_temp")
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "18.0"
+
+    bus.registers[coordinator.api.register_map[REG_SUPPLY_TEMP]] = 182
+    freezer.tick(timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert coordinator.data.supply_temp == 18.2
+    assert coordinator.published_value(REG_SUPPLY_TEMP) == 18.0
+    assert hass.states.get(entity_id).state == "18.0"
@@ -0,0 +1,69 @@
+"""Tests for the high-resolution sample ring and the sampler."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+import pytest
+
+from custom_components.zentec031.api import compile_read_plan
+from custom_components.zentec031.const import CONF_SAMPLE_INTERVAL, REG_SUPPLY_TEMP, SAMPLE_REGISTERS
+from custom_components.zentec031.coordinator import ZentecCoordinator
+from custom_components.zentec031.samples import SampleRing
+
+from .fake_bus import FakeModbusClient
+
+
+def test_ring_overwrites_oldest_when_full() -> None:
+    """A full ring keeps the newest samples in order."""
+    ring = SampleRing(("a", "b"), 3)
+    for second in range(5):
+        ring.append(float(second), [second, None])
+
+    assert len(ring) == 3
+    assert ring.window(0) == [(2.0, [2.0, None]), (3.0, [3.0, None]), (4.0, [4.0, None])]
+
+
+def test_ring_window_is_half_open() -> None:
+    """window() includes ``since`` and excludes ``until``."""
+    ring = SampleRing(("a",), 10)
+    for second in range(6):
+        ring.append(float(second), [second])
+
+    assert [timestamp for timestamp, _ in ring.window(2, 4)] == [2.0, 3.0]
+    assert ring.window(6) == []
+
+
+def test_ring_aggregate_skips_missing_values() -> None:
+    """Missing values do not count; channels without any value are left out."""
+    ring = SampleRing(("a", "b"), 8)
+    for second, value in enumerate((1.0, None, 4.0, 7.0)):
+        ring.append(float(second), [value, None])
+    ring.append(10.0, [100.0, None])
+
+    assert ring.aggregate(0, 10) == {"a": (1.0, 4.0, 7.0)}
+
+
+@pytest.mark.parametrize("entry_options", [{CONF_SAMPLE_INTERVAL: 1}])
+async def test_sampler_reads_sample_plan_only(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Each tick reads only the sampled registers into the ring."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    sampler = coordinator.sampler
+    assert sampler is not None
+    sample_requests = len(compile_read_plan(coordinator.api.register_map, SAMPLE_REGISTERS))
+    bus.registers[coordinator.api.register_map[REG_SUPPLY_TEMP]] = 185
+    requests = bus.requests
+
+    for _ in range(3):
+        freezer.tick(timedelta(seconds=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert len(sampler.ring) == 3
+    assert bus.requests - requests == 3 * sample_requests
+    assert sampler.recent(60)[-1][1][0] == 18.5
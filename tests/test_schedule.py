@@ -0,0 +1,113 @@
+"""Tests for weekly schedules."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.zentec031.const import DOMAIN
+from custom_components.zentec031.schedule import WEEKDAYS, Slot, compile_schedules, next_slot
+
+from .fake_bus import FakeModbusClient
+
+SCHEDULES = {
+    "office": {
+        "config_entry_ids": ["a", "b"],
+        "transitions": [
+            {"days": ["mon", "tue"], "at": "07:00:00", "power": True, "fan_speed": 2},
+            {"days": ["sun"], "at": "22:00:00", "power": False},
+        ],
+    },
+    "lobby": {
+        "config_entry_ids": ["b"],
+        "transitions": [{"days": ["mon"], "at": "07:00:00", "fan_speed": 3, "force": True}],
+    },
+}
+
+
+def test_compile_merges_groups_into_sorted_slots() -> None:
+    """Slots are sorted by time of week; a unit in two groups gets both, later names winning."""
+    wheel = compile_schedules(SCHEDULES)
+
+    assert [(slot.weekday, slot.at) for slot in wheel] == [(0, time(7)), (1, time(7)), (6, time(22))]
+    # "office" sorts after "lobby", so its fan speed wins; the lobby transition still forces.
+    assert wheel[0].settings == {
+        "a": {"power": True, "fan_speed": 2},
+        "b": {"power": True, "fan_speed": 2, "force": True},
+    }
+    assert wheel[1].settings == {"a": {"power": True, "fan_speed": 2}, "b": {"power": True, "fan_speed": 2}}
+    assert wheel[2].settings == {"a": {"power": False}, "b": {"power": False}}
+
+
+def test_next_slot_is_strictly_after_now() -> None:
+    """A slot due right now is not returned again; the next one is."""
+    wheel = compile_schedules(SCHEDULES)
+
+    due, slot = next_slot(wheel, datetime(2026, 10, 19, 7, 0, tzinfo=UTC))
+
+    assert due == datetime(2026, 10, 20, 7, 0, tzinfo=UTC)
+    assert slot is wheel[1]
+
+
+def test_next_slot_across_midnight() -> None:
+    """A transition early next morning is found from late evening."""
+    wheel = [Slot(1, time(0, 15), {"a": {"power": True}})]
+
+    due, _ = next_slot(wheel, datetime(2026, 10, 19, 23, 30, tzinfo=UTC))
+
+    assert due == datetime(2026, 10, 20, 0, 15, tzinfo=UTC)
+
+
+def test_next_slot_wraps_past_the_end_of_the_week() -> None:
+    """After the last slot of the week the first one of next week is due."""
+    wheel = compile_schedules(SCHEDULES)
+
+    due, slot = next_slot(wheel, datetime(2026, 10, 25, 23, 0, tzinfo=UTC))
+
+    assert due == datetime(2026, 10, 26, 7, 0, tzinfo=UTC)
+    assert slot is wheel[0]
+
+
+def test_next_slot_keeps_local_wall_time() -> None:
+    """Transitions are local times, also on the night the clocks go back."""
+    berlin = ZoneInfo("Europe/Berlin")
+    wheel = [Slot(6, time(4), {"a": {"power": True}})]
+
+    due, _ = next_slot(wheel, datetime(2026, 10, 25, 1, 0, tzinfo=berlin))
+
+    assert due == datetime(2026, 10, 25, 4, 0, tzinfo=berlin)
+    assert due.utcoffset() == timedelta(hours=1)
+    assert next_slot([], datetime(2026, 10, 25, tzinfo=berlin)) is None
+
+
+async def test_transition_writes_each_unit_once(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """At the transition the unit gets all its settings in one write and the next week is armed."""
+    freezer.move_to(datetime(2026, 10, 19, 6, 0, tzinfo=dt_util.get_default_time_zone()))
+    await hass.services.async_call(
+        DOMAIN,
+        "set_schedule",
+        {
+            "name": "office",
+            "config_entry_ids": [entry.entry_id],
+            "transitions": [{"days": [WEEKDAYS[0]], "at": "06:30", "fan_speed": 3, "target_temp": 22}],
+        },
+        blocking=True,
+    )
+    response = await hass.services.async_call(DOMAIN, "get_schedules", blocking=True, return_response=True)
+    next_run = datetime.fromisoformat(response["next_run"])
+    assert next_run == datetime(2026, 10, 19, 6, 30, tzinfo=dt_util.get_default_time_zone())
+
+    freezer.move_to(next_run)
+    async_fire_time_changed(hass, next_run)
+    await hass.async_block_till_done()
+
+    assert bus.writes == [(40000, [3, 1, 220])]
+    response = await hass.services.async_call(DOMAIN, "get_schedules", blocking=True, return_response=True)
+    assert datetime.fromisoformat(response["next_run"]) == next_run + timedelta(days=7)
@@ -0,0 +1,81 @@
+"""Tests for the Zentec 031 services."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+import voluptuous as vol
+
+from custom_components.zentec031.config_flow import IMPORT_SCHEMA
+from custom_components.zentec031.const import (
+    CONF_SLAVE_ID,
+    CONF_SUPPLY_TEMP_REGISTER,
+    CONF_TRANSPORT,
+    DEFAULT_SLAVE_ID,
+    DOMAIN,
+    TRANSPORT_TCP,
+)
+
+from .fake_bus import FakeModbusClient
+
+
+def test_import_schema_drops_extra_columns() -> None:
+    """Inventory columns that are not entry keys are ignored; strings are coerced."""
+    row = IMPORT_SCHEMA({"host": "192.0.2.20", "port": "5020", "supply_temp_register": "40020", "asset": "AHU-7"})
+
+    assert row == {
+        CONF_HOST: "192.0.2.20",
+        CONF_PORT: 5020,
+        CONF_TRANSPORT: TRANSPORT_TCP,
+        CONF_SLAVE_ID: DEFAULT_SLAVE_ID,
+        CONF_SUPPLY_TEMP_REGISTER: 40020,
+    }
+
+
+@pytest.mark.parametrize(
+    "row", [{"port": "502"}, {"host": "192.0.2.20", "port": "70000"}, {"host": "192.0.2.20", "slave_id": "x"}]
+)
+def test_import_schema_rejects_invalid_rows(row: dict[str, str]) -> None:
+    """A row without a host or with values out of range is invalid."""
+    with pytest.raises(vol.Invalid):
+        IMPORT_SCHEMA(row)
+
+
+async def test_import_inventory_reports_every_row(
+    hass: HomeAssistant, tmp_path: Path, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Rows are created, skipped as configured or failed with the validation error."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / "inventory.csv").write_text(
+        "host,port,slave_id,asset\n"
+        "192.0.2.20,502,2,AHU-7\n"
+        "# already set up\n"
+        "192.0.2.10,502,1,AHU-1\n"
+        "192.0.2.30,70000,1,AHU-9\n",
+        encoding="utf-8",
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN, "import_inventory", {"path": "inventory.csv"}, blocking=True, return_response=True
+    )
+    await hass.async_block_till_done()
+
+    assert response["rows"] == 3
+    (created,) = response["created"]
+    assert (created["row"], created["host"]) == (2, "192.0.2.20")
+    assert response["skipped"] == [{"row": 4, "host": "192.0.2.10", "reason": "already_configured"}]
+    (failed,) = response["failed"]
+    assert (failed["row"], failed["reason"]) == (5, "invalid_row")
+    assert "port" in failed["error"]
+
+    new_entry = hass.config_entries.async_get_entry(created["config_entry_id"])
+    assert new_entry.state is ConfigEntryState.LOADED
+    assert new_entry.data[CONF_SLAVE_ID] == 2
+    assert "asset" not in new_entry.data
+    assert "asset" not in new_entry.options
+    assert await hass.config_entries.async_unload(new_entry.entry_id)
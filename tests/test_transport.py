@@ -0,0 +1,192 @@
+"""Tests for the lean Modbus TCP transport."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+import socket
+import struct
+import threading
+
+import pytest
+
+from custom_components.zentec031.transport import EncodedReads, ModbusTcpPipeline
+
+from .fake_bus import REGISTERS
+
+_REQUEST = struct.Struct(">HHHBBHH")
+
+Gateway = Callable[[Callable[[socket.socket], None]], socket.socket]
+
+
+def _receive(peer: socket.socket, count: int) -> list[tuple[int, ...]]:
+    """Read ``count`` request frames as (transaction, protocol, length, unit, function, address, count)."""
+    data = b""
+    while len(data) < count * _REQUEST.size:
+        chunk = peer.recv(4096)
+        assert chunk, "pipeline closed the socket"
+        data += chunk
+    return [_REQUEST.unpack_from(data, offset) for offset in range(0, len(data), _REQUEST.size)]
+
+
+def _response(request: tuple[int, ...]) -> bytes:
+    """Answer a read with the registers of the fake controller."""
+    transaction, _, _, unit, function, address, count = request
+    values = [REGISTERS.get(register, 0) for register in range(address, address + count)]
+    return struct.pack(f">HHHBBB{count}H", transaction, 0, 3 + 2 * count, unit, function, 2 * count, *values)
+
+
+@pytest.fixture
+def gateway() -> Generator[Gateway]:
+    """Run a gateway script on the far end of a socket pair; return the near end."""
+    threads: list[threading.Thread] = []
+    sockets: list[socket.socket] = []
+
+    def start(script: Callable[[socket.socket], None]) -> socket.socket:
+        sock, peer = socket.socketpair()
+        sockets.extend((sock, peer))
+        thread = threading.Thread(target=script, args=(peer,), daemon=True)
+        thread.start()
+        threads.append(thread)
+        return sock
+
+    yield start
+    for thread in threads:
+        thread.join(5)
+    for sock in sockets:
+        sock.close()
+
+
+READS = EncodedReads(1, [(0x03, 40000, 7), (0x03, 40009, 1), (0x03, 50005, 1), (0x03, 50008, 2)])
+EXPECTED = [(2, 1, 210, 1, 0, 0, 0), (180,), (50,), (150, 300)]
+
+
+def test_window_keeps_requests_in_flight_and_matches_out_of_order(gateway: Gateway) -> None:
+    """With a window of 4 every request is sent before the first answer, answers come back reversed."""
+
+    def script(peer: socket.socket) -> None:
+        requests = _receive(peer, 4)
+        peer.sendall(b"".join(_response(request) for request in reversed(requests)))
+
+    results, timed_out = ModbusTcpPipeline(timeout=5).read(gateway(script), READS, window=4)
+
+    assert results == EXPECTED
+    assert timed_out == 0
+
+
+def test_window_of_one_waits_for_each_answer(gateway: Gateway) -> None:
+    """With a window of 1 the next request only goes out once the previous one is answered."""
+    outstanding: list[int] = []
+
+    def script(peer: socket.socket) -> None:
+        peer.settimeout(0.2)
+        for _ in range(4):
+            (request,) = _receive(peer, 1)
+            try:
+                # Nothing else may arrive before this request is answered.
+                outstanding.append(len(peer.recv(4096)))
+            except TimeoutError:
+                outstanding.append(0)
+            peer.sendall(_response(request))
+
+    results, _ = ModbusTcpPipeline(timeout=5).read(gateway(script), READS, window=1)
+
+    assert results == EXPECTED
+    assert outstanding == [0, 0, 0, 0]
+
+
+def test_transaction_ids_stay_in_range_and_wrap(gateway: Gateway) -> None:
+    """Ids stay clear of pymodbus (1..65000) and the idle probe (65535) and restart at 65001."""
+    transactions: list[int] = []
+
+    def script(peer: socket.socket) -> None:
+        for _ in range(3):
+            requests = _receive(peer, 4)
+            transactions.extend(request[0] for request in requests)
+            peer.sendall(b"".join(_response(request) for request in requests))
+
+    pipeline = ModbusTcpPipeline(timeout=5)
+    sock = gateway(script)
+    assert pipeline.read(sock, READS, window=4)[0] == EXPECTED
+    # Leave room for fewer ids than the plan needs.
+    pipeline._next_transaction = 65532
+    assert pipeline.read(sock, READS, window=4)[0] == EXPECTED
+    assert pipeline.read(sock, READS, window=4)[0] == EXPECTED
+
+    assert transactions == [65001, 65002, 65003, 65004, 65001, 65002, 65003, 65004, 65005, 65006, 65007, 65008]
+
+
+def test_encoded_reads_patch_only_transaction_ids(gateway: Gateway) -> None:
+    """Frames are encoded once; a poll rewrites nothing but the transaction ids."""
+    reads = EncodedReads(7, [(0x03, 40000, 7), (0x04, 30010, 2)])
+    assert bytes(reads.frames) == (
+        struct.pack(">HHHBBHH", 0, 0, 6, 7, 0x03, 40000, 7) + struct.pack(">HHHBBHH", 0, 0, 6, 7, 0x04, 30010, 2)
+    )
+    received: list[tuple[int, ...]] = []
+
+    def script(peer: socket.socket) -> None:
+        for _ in range(2):
+            requests = _receive(peer, 2)
+            received.extend(requests)
+            peer.sendall(b"".join(_response(request) for request in requests))
+
+    pipeline = ModbusTcpPipeline(timeout=5)
+    sock = gateway(script)
+    pipeline.read(sock, reads, window=2)
+    pipeline.read(sock, reads, window=2)
+
+    assert [request[1:] for request in received] == [(0, 6, 7, 0x03, 40000, 7), (0, 6, 7, 0x04, 30010, 2)] * 2
+    assert [request[0] for request in received] == [65001, 65002, 65003, 65004]
+
+
+def test_responses_split_across_receives(gateway: Gateway) -> None:
+    """Responses arriving a byte at a time, several per receive, decode the same."""
+
+    def script(peer: socket.socket) -> None:
+        requests = _receive(peer, 4)
+        for byte in b"".join(_response(request) for request in requests):
+            peer.sendall(bytes((byte,)))
+
+    assert ModbusTcpPipeline(timeout=5).read(gateway(script), READS, window=4) == (EXPECTED, 0)
+
+
+def test_exception_and_malformed_responses_fail_their_request(gateway: Gateway) -> None:
+    """An exception response or a wrong byte count fails only that request."""
+
+    def script(peer: socket.socket) -> None:
+        first, second, third, fourth = _receive(peer, 4)
+        # Illegal data address for the first, two registers instead of one for the third.
+        peer.sendall(struct.pack(">HHHBBB", first[0], 0, 3, 1, 0x83, 0x02))
+        peer.sendall(_response(second))
+        peer.sendall(struct.pack(">HHHBBBHH", third[0], 0, 7, 1, 0x03, 4, 50, 0))
+        peer.sendall(_response(fourth))
+
+    results, timed_out = ModbusTcpPipeline(timeout=5).read(gateway(script), READS, window=4)
+
+    assert results == [None, (180,), None, (150, 300)]
+    assert timed_out == 0
+
+
+def test_unanswered_request_times_out_alone(gateway: Gateway) -> None:
+    """A request without an answer fails after the timeout; a stray id is ignored."""
+
+    def script(peer: socket.socket) -> None:
+        requests = _receive(peer, 4)
+        # A late answer to an earlier poll, then answers to all but the second request.
+        peer.sendall(_response((64000, *requests[0][1:])))
+        peer.sendall(b"".join(_response(request) for index, request in enumerate(requests) if index != 1))
+
+    results, timed_out = ModbusTcpPipeline(timeout=0.2).read(gateway(script), READS, window=4)
+
+    assert results == [EXPECTED[0], None, *EXPECTED[2:]]
+    assert timed_out == 1
+
+
+def test_connection_closed_mid_poll_raises(gateway: Gateway) -> None:
+    """A gateway closing the socket breaks the poll instead of waiting for the timeout."""
+
+    def script(peer: socket.socket) -> None:
+        _receive(peer, 1)
+        peer.shutdown(socket.SHUT_RDWR)
+
+    with pytest.raises(ConnectionError):
+        ModbusTcpPipeline(timeout=5).read(gateway(script), READS, window=1)
@@ -0,0 +1,67 @@
+"""Tests for the Zentec 031 websocket API."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.zentec031.const import DOMAIN, REG_FAN_SPEED, REG_MODE
+from custom_components.zentec031.coordinator import ZentecCoordinator
+
+from .fake_bus import FakeModbusClient
+
+
+async def test_subscribe_sends_each_delta_once(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Listener updates without a poll do not resend the last delta."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    fan_speed = coordinator.api.register_map[REG_FAN_SPEED]
+    mode = coordinator.api.register_map[REG_MODE]
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": f"{DOMAIN}/subscribe", "config_entry_id": entry.entry_id})
+    assert (await client.receive_json())["success"]
+    image = (await client.receive_json())["event"]
+    assert image["available"] is True
+    assert image["registers"][str(fan_speed)] == 2
+
+    bus.registers[fan_speed] = 3
+    await coordinator.async_refresh()
+    assert (await client.receive_json())["event"] == {"registers": {str(fan_speed): 3}}
+
+    coordinator.async_update_listeners()
+    bus.registers[mode] = 2
+    await coordinator.async_refresh()
+    assert (await client.receive_json())["event"] == {"registers": {str(mode): 2}}
+
+
+async def test_subscribe_requires_admin(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, hass_read_only_access_token: str, entry: MockConfigEntry
+) -> None:
+    """Non-admin users cannot stream the register image."""
+    client = await hass_ws_client(hass, hass_read_only_access_token)
+
+    await client.send_json_auto_id({"type": f"{DOMAIN}/subscribe", "config_entry_id": entry.entry_id})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "unauthorized"
+
+
+async def test_subscription_ends_when_entry_unloads(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, bus: FakeModbusClient, entry: MockConfigEntry
+) -> None:
+    """Unloading the entry removes the listener and tells the client."""
+    coordinator: ZentecCoordinator = entry.runtime_data
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": f"{DOMAIN}/subscribe", "config_entry_id": entry.entry_id})
+    assert (await client.receive_json())["success"]
+    await client.receive_json()
+    assert coordinator._listeners
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert (await client.receive_json())["event"] == {"unloaded": True}
+    assert not coordinator._listeners